@@ -110,6 +110,20 @@ def _run(args: Namespace, parser: ArgumentParser) -> None:
                 fps=args.fps,
                 segment_length=args.segment_length,
                 repair=args.repair,
+                single_decode=args.single_decode,
+            )
+        elif args.extract_type == "video-artifacts-batch":
+            f.extract_video_artifacts_batch(
+                source=args.source,
+                output_dir=args.output_dir,
+                storage_key_prefix=args.storage_key_prefix,
+                fps=args.fps,
+                segment_length=args.segment_length,
+                repair=args.repair,
+                single_decode=args.single_decode,
+                max_workers=args.jobs,
+                threads_per_job=args.threads_per_job,
+                force=args.force,
             )
         else:
             parser.print_help()
@@ -173,6 +187,7 @@ def _run(args: Namespace, parser: ArgumentParser) -> None:
                 args.retry,
                 args.retry_timeout,
                 args.retry_interval,
+                args.incremental,
             )
         elif args.action == "import":
             f.dataset_import(
@@ -186,6 +201,7 @@ def _run(args: Namespace, parser: ArgumentParser) -> None:
                 args.import_reviewers,
                 args.overwrite,
                 cpu_limit=args.cpu_limit,
+                batch_size=args.batch_size,
             )
         elif args.action == "convert":
             f.dataset_convert(
@@ -416,6 +416,7 @@ def pull_dataset(
     retry: bool = False,
     retry_timeout: int = 600,
     retry_interval: int = 10,
+    incremental: bool = False,
 ) -> None:
     """
     Downloads a remote dataset (images and annotations) in the datasets directory.
@@ -442,6 +443,8 @@ def pull_dataset(
         If retrying, total time to wait for the release to be ready for download
     retry_interval: int
         If retrying, time to wait between retries of checking if the release is ready for download.
+    incremental: bool
+        If True, only updates the items added, changed or removed since the previous pull. Defaults to False.
     """
     version: str = DatasetIdentifier.parse(dataset_slug).version or "latest"
     client: Client = _load_client(offline=False, maybe_guest=True)
@@ -470,6 +473,7 @@ def pull_dataset(
             retry=retry,
             retry_timeout=retry_timeout,
             retry_interval=retry_interval,
+            incremental=incremental,
         )
         print_new_version_info(client)
     except NotFound:
@@ -890,6 +894,7 @@ def dataset_import(
     overwrite: bool = False,
     use_multi_cpu: bool = False,
     cpu_limit: Optional[int] = None,
+    batch_size: int = 1,
 ) -> None:
     """
     Imports annotation files to the given dataset.
@@ -925,6 +930,8 @@ def dataset_import(
         If ``True`` it will use all multiple CPUs to speed up the import process.
     cpu_limit : Optional[int], default: Core count - 2
         The maximum number of CPUs to use for the import process.
+    batch_size : int, default: 1
+        The maximum number of items whose annotations are imported concurrently.
     """
 
     client: Client = _load_client(dataset_identifier=dataset_slug)
@@ -951,6 +958,7 @@ def dataset_import(
             overwrite,
             use_multi_cpu,
             cpu_limit,
+            batch_size,
         )
 
     except ImporterNotFoundError:
@@ -1477,6 +1485,7 @@ def extract_video_artifacts(
     fps: float = 0.0,
     segment_length: int = 2,
     repair: bool = False,
+    single_decode: bool = False,
 ) -> None:
     """
     Generate video artifacts (segments, sections, thumbnail, frames manifest).
@@ -1495,6 +1504,8 @@ def extract_video_artifacts(
         Length of each segment in seconds, by default 2
     repair : bool, optional
         Whether to attempt to repair video if errors are detected, by default False
+    single_decode : bool, optional
+        Whether to extract segments and frames with a single decode of the video, by default False
     """
 
     video.extract_artifacts(
@@ -1504,4 +1515,69 @@ def extract_video_artifacts(
         fps=fps,
         segment_length=segment_length,
         repair=repair,
+        single_decode=single_decode,
     )
+
+
+def extract_video_artifacts_batch(
+    source: str,
+    output_dir: str,
+    storage_key_prefix: str,
+    *,
+    fps: float = 0.0,
+    segment_length: int = 2,
+    repair: bool = False,
+    single_decode: bool = False,
+    max_workers: Optional[int] = None,
+    threads_per_job: Optional[int] = None,
+    force: bool = False,
+) -> None:
+    """
+    Generate the video artifacts of many videos in parallel jobs, and a registration manifest.
+
+    Parameters
+    ----------
+    source : str
+        Directory of the videos, or file listing one video path per line
+    output_dir : str
+        Output directory for artifacts
+    storage_key_prefix : str
+        Storage key prefix for generated files
+    fps : float, optional
+        Desired output FPS (0.0 for native), by default 0.0
+    segment_length : int, optional
+        Length of each segment in seconds, by default 2
+    repair : bool, optional
+        Whether to attempt to repair videos if errors are detected, by default False
+    single_decode : bool, optional
+        Whether to extract segments and frames with a single decode of each video, by default False
+    max_workers : Optional[int], optional
+        Number of videos processed at the same time, by default the number of CPUs divided by
+        ``threads_per_job``
+    threads_per_job : Optional[int], optional
+        Maximum number of threads of each job, by default the number of CPUs divided by
+        ``max_workers``
+    force : bool, optional
+        Whether to process videos even if their artifacts are up to date, by default False
+    """
+    try:
+        registration_manifest = video.extract_artifacts_batch(
+            source=source,
+            output_dir=output_dir,
+            storage_key_prefix=storage_key_prefix,
+            fps=fps,
+            segment_length=segment_length,
+            repair=repair,
+            single_decode=single_decode,
+            max_workers=max_workers,
+            threads_per_job=threads_per_job,
+            force=force,
+        )
+    except (FileNotFoundError, ValueError) as e:
+        _error(str(e))
+
+    if registration_manifest["failed"]:
+        _error(
+            f"Failed to extract {len(registration_manifest['failed'])} of "
+            f"{len(registration_manifest['items']) + len(registration_manifest['failed'])} videos"
+        )
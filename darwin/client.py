@@ -1,10 +1,13 @@
 import json
 import logging
 import os
+import reprlib
+import threading
+import weakref
 import zlib
 from logging import Logger
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Union, cast
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, cast
 from requests.exceptions import HTTPError
 import requests
 from requests import Response
@@ -44,17 +47,27 @@ from darwin.future.core.properties import update_property as update_property_fut
 from darwin.future.core.types.common import JSONDict
 from darwin.future.data_objects.properties import FullProperty
 from darwin.utils import (
-    get_response_content,
     has_json_content_type,
     is_project_dir,
     urljoin,
 )
 from darwin.utils.get_item_count import get_item_count
+from darwin.version import __version__
 
 INITIAL_WAIT = int(os.getenv("DARWIN_RETRY_INITIAL_WAIT", "60"))
 MAX_WAIT = int(os.getenv("DARWIN_RETRY_MAX_WAIT", "300"))
 MAX_RETRIES = int(os.getenv("DARWIN_RETRY_MAX_ATTEMPTS", "10"))
 
+#: Maximum number of characters of a payload or response body written to debug logs.
+DEBUG_LOG_MAX_LENGTH = 1000
+
+_log_repr = reprlib.Repr()
+_log_repr.maxlevel = 4
+_log_repr.maxdict = 20
+_log_repr.maxlist = 20
+_log_repr.maxstring = 200
+_log_repr.maxother = 200
+
 
 def log_rate_limit_exceeded(retry_state: RetryCallState):
     wait_time = retry_state.next_action.sleep
@@ -121,6 +134,60 @@ def log_retry_error(retry_state: RetryCallState) -> None:
             )
 
 
+def _truncate_for_log(value: Union[str, bytes]) -> str:
+    text = value[:DEBUG_LOG_MAX_LENGTH]
+    if isinstance(text, bytes):
+        text = text.decode("utf-8", errors="replace")
+    if len(value) > DEBUG_LOG_MAX_LENGTH:
+        return f"{text}... ({len(value) - DEBUG_LOG_MAX_LENGTH} more)"
+    return text
+
+
+class ConnectionStats:
+    """
+    Counts the requests sent through the session of a ``Client``, and how many of them had to open
+    a new connection instead of reusing a kept-alive one.
+    """
+
+    def __init__(self) -> None:
+        self.requests: int = 0
+        self.new_connections: int = 0
+        self._sockets: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    @property
+    def reused_connections(self) -> int:
+        return self.requests - self.new_connections
+
+    @property
+    def reuse_rate(self) -> float:
+        return self.reused_connections / self.requests if self.requests else 0.0
+
+    def record(self, response: Response, *args: Any, **kwargs: Any) -> None:
+        """
+        Response hook of the session that records on which connection the response was received.
+
+        Parameters
+        ----------
+        response : Response
+            The response, whose body has not been read yet.
+        """
+        connection = getattr(response.raw, "connection", None)
+        sock = getattr(connection, "sock", None)
+        with self._lock:
+            self.requests += 1
+            if sock is None or sock not in self._sockets:
+                self.new_connections += 1
+                if sock is not None:
+                    self._sockets.add(sock)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.requests} requests on {self.new_connections} connections "
+            f"({self.reuse_rate:.0%} reused)"
+        )
+
+
 class Client:
     def __init__(
         self,
@@ -134,9 +201,14 @@ class Client:
         self.default_team: str = default_team or config.get("global/default_team")
         self.features: Dict[str, List[Feature]] = {}
         self._newer_version: Optional[DarwinVersionNumber] = None
+        self._headers_cache: Dict[Tuple[str, bool, bool], Dict[str, str]] = {}
+        self._headers_cache_revision: Optional[int] = None
         self.session = requests.Session()
         adapter = HTTPAdapter(pool_maxsize=100)
         self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.connection_stats = ConnectionStats()
+        self.session.hooks["response"].append(self.connection_stats.record)
 
         if log is None:
             self.log: Logger = logging.getLogger("darwin")
@@ -791,6 +863,40 @@ class Client:
         team_slug: Optional[str] = None,
         compressed: bool = False,
         auth_token: Optional[bool] = False,
+    ) -> Dict[str, str]:
+        """
+        Returns the headers of a request to the given team.
+
+        The headers are cached per team until the configuration changes, so the returned
+        dictionary must not be modified.
+
+        Parameters
+        ----------
+        team_slug : Optional[str], default: None
+            The team of the request. The default team is used if not given.
+        compressed : bool, default: False
+            Whether the payload of the request is compressed.
+        auth_token : Optional[bool], default: False
+            Whether to leave out the ``Authorization`` and ``User-Agent`` headers.
+
+        Returns
+        -------
+        Dict[str, str]
+            The headers.
+        """
+        if self._headers_cache_revision != self.config.revision:
+            self._headers_cache = {}
+            self._headers_cache_revision = self.config.revision
+
+        key = (team_slug or self.default_team, compressed, bool(auth_token))
+        headers = self._headers_cache.get(key)
+        if headers is None:
+            headers = self._build_headers(*key)
+            self._headers_cache[key] = headers
+        return headers
+
+    def _build_headers(
+        self, team_slug: Optional[str], compressed: bool, auth_token: bool
     ) -> Dict[str, str]:
         headers: Dict[str, str] = {"Content-Type": "application/json"}
         if auth_token:
@@ -798,7 +904,7 @@ class Client:
 
         api_key: Optional[str] = None
         team_config: Optional[Team] = self.config.get_team(
-            team_slug or self.default_team, raise_on_invalid_team=False
+            team_slug, raise_on_invalid_team=False
         )
 
         if team_config:
@@ -810,8 +916,6 @@ class Client:
         if compressed:
             headers["X-Darwin-Payload-Compression-Version"] = "1"
 
-        from darwin.version import __version__
-
         headers["User-Agent"] = f"darwin-py/{__version__}"
         return headers
 
@@ -828,23 +932,13 @@ class Client:
         stream: bool = False,
         auth_token: Optional[bool] = False,
     ) -> Response:
-        response: Response = self.session.get(
+        return self._send(
+            "get",
             url,
             headers=self._get_headers(team_slug, auth_token=auth_token),
             stream=stream,
         )
 
-        self.log.debug(
-            f"Client GET request response ({get_response_content(response)}) with status "
-            f"({response.status_code}). "
-            f"Client: ({self})"
-            f"Request: (url={url})"
-        )
-
-        self._raise_if_known_error(response, url)
-        response.raise_for_status()
-        return response
-
     def _get_raw(
         self,
         endpoint: str,
@@ -873,23 +967,14 @@ class Client:
         payload: Dict[str, UnknownType],
         team_slug: Optional[str] = None,
     ) -> Response:
-        response: requests.Response = self.session.put(
+        return self._send(
+            "put",
             urljoin(self.url, endpoint),
+            payload,
             json=payload,
             headers=self._get_headers(team_slug),
         )
 
-        self.log.debug(
-            f"Client PUT request got response ({get_response_content(response)}) with status "
-            f"({response.status_code}). "
-            f"Client: ({self})"
-            f"Request: (endpoint={endpoint}, payload={payload})"
-        )
-
-        self._raise_if_known_error(response, urljoin(self.url, endpoint))
-        response.raise_for_status()
-        return response
-
     def _put(
         self,
         endpoint: str,
@@ -923,29 +1008,21 @@ class Client:
                 json.dumps(payload).encode("utf-8"), level=compression_level
             )
 
-            response: Response = requests.post(
+            return self._send(
+                "post",
                 urljoin(self.url, endpoint),
+                payload,
                 data=compressed_payload,
                 headers=self._get_headers(team_slug, compressed=True),
             )
-        else:
-            response: Response = requests.post(
-                urljoin(self.url, endpoint),
-                json=payload,
-                headers=self._get_headers(team_slug),
-            )
-
-        self.log.debug(
-            f"Client POST request response ({get_response_content(response)}) with unexpected status "
-            f"({response.status_code}). "
-            f"Client: ({self})"
-            f"Request: (endpoint={endpoint}, payload={payload})"
+        return self._send(
+            "post",
+            urljoin(self.url, endpoint),
+            payload,
+            json=payload,
+            headers=self._get_headers(team_slug),
         )
 
-        self._raise_if_known_error(response, urljoin(self.url, endpoint))
-        response.raise_for_status()
-        return response
-
     def _post(
         self,
         endpoint: str,
@@ -970,22 +1047,67 @@ class Client:
         if payload is None:
             payload = {}
 
-        response: requests.Response = self.session.delete(
+        response = self._send(
+            "delete",
             urljoin(self.url, endpoint),
+            payload,
             json=payload,
             headers=self._get_headers(team_slug),
         )
+        return self._decode_response(response)
 
-        self.log.debug(
-            f"Client DELETE request response ({get_response_content(response)}) with unexpected status "
-            f"({response.status_code}). "
-            f"Client: ({self})"
-            f"Request: (endpoint={endpoint})"
-        )
+    def _send(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[Dict[str, UnknownType]] = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> Response:
+        """
+        Sends a request through the pooled session shared by all the HTTP verbs of the client.
+
+        Parameters
+        ----------
+        method : str
+            The lowercase HTTP verb.
+        url : str
+            The full url of the request.
+        payload : Optional[Dict[str, UnknownType]], default: None
+            The payload of the request, only used for debug logs.
+        stream : bool, default: False
+            Whether to defer downloading the body of the response.
+        **kwargs : Any
+            Other arguments of the request, such as ``headers`` and ``json``.
+
+        Returns
+        -------
+        Response
+            The response.
+
+        Raises
+        ------
+        HTTPError
+            If the response has an error status code not handled by ``_raise_if_known_error``.
+        """
+        response: Response = getattr(self.session, method)(url, stream=stream, **kwargs)
+
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                "Client %s request response (%s) with status (%s). Client: (%s) "
+                "Request: (url=%s, payload=%s). Connections: (%s)",
+                method.upper(),
+                "<streamed>" if stream else _truncate_for_log(response.content),
+                response.status_code,
+                self,
+                url,
+                _truncate_for_log(_log_repr.repr(payload)),
+                self.connection_stats,
+            )
 
-        self._raise_if_known_error(response, urljoin(self.url, endpoint))
+        self._raise_if_known_error(response, url)
         response.raise_for_status()
-        return self._decode_response(response)
+        return response
 
     def _raise_if_known_error(self, response: Response, url: str) -> None:
         if response.status_code == 401:
@@ -997,7 +1119,7 @@ class Client:
         if response.status_code == 413:
             raise RequestEntitySizeExceeded(url)
 
-        if has_json_content_type(response):
+        if response.status_code == 422 and has_json_content_type(response):
             body = response.json()
             is_name_taken: Optional[bool] = None
             if isinstance(body, Dict):
@@ -1009,10 +1131,9 @@ class Client:
                 if errors and isinstance(errors, Dict):
                     is_name_taken = errors.get("name") == ["has already been taken"]
 
-            if response.status_code == 422:
-                if is_name_taken:
-                    raise NameTaken
-                raise ValidationError(body)
+            if is_name_taken:
+                raise NameTaken
+            raise ValidationError(body)
 
         if response.status_code == 429:
             error_code: Optional[str] = None
@@ -1063,8 +1184,6 @@ class Client:
                 (major, minor, patch) = version.split(".")
                 return (int(major), int(minor), int(patch))
 
-            from darwin.version import __version__
-
             current_version = parse_version(__version__)
             latest_version = parse_version(server_latest_version)
             if current_version >= latest_version:
@@ -20,6 +20,7 @@ class Config(object):
 
         self._path: Optional[Path] = path
         self._data: Dict[str, Any] = self._parse()
+        self._revision: int = 0
 
     def _parse(self) -> Dict[str, Any]:
         """Parses the YAML configuration file"""
@@ -31,6 +32,14 @@ class Config(object):
         except FileNotFoundError:
             return {}
 
+    @property
+    def revision(self) -> int:
+        """
+        Number of changes made to this configuration with ``put``, which lets values derived from it
+        be cached until it changes.
+        """
+        return self._revision
+
     def get(self, key: Union[str, List[str]], default: Optional[Any] = None) -> Any:
         """
         Gets the value defined by key.
@@ -85,6 +94,7 @@ class Config(object):
         for k in key[:-1]:
             pointer = pointer.setdefault(k, {})
         pointer[key[-1]] = str(value)
+        self._revision += 1
 
         if save:
             self._save()
@@ -0,0 +1,499 @@
+"""
+Holds the on-disk index of the annotation files of a pulled release.
+"""
+
+import os
+import sqlite3
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import darwin.datatypes as dt
+from darwin.utils import parse_darwin_json
+
+#: Suffix appended to the name of the annotations folder to get the path of its index, e.g.
+#: ``releases/<release_name>/annotations.index.sqlite``.
+ANNOTATION_INDEX_SUFFIX = ".index.sqlite"
+
+_SCHEMA_VERSION = 1
+
+
+@dataclass
+class IndexedAnnotationFile:
+    """
+    Summary of a single Darwin JSON file, as stored in an ``AnnotationIndex``.
+    """
+
+    #: Path of the annotation file, relative to the annotations folder.
+    path: str
+
+    #: Name of the dataset item.
+    item_name: Optional[str]
+
+    #: Remote folder of the dataset item.
+    item_path: Optional[str]
+
+    #: Name of the first source file of the first slot of the item.
+    source_file_name: Optional[str]
+
+    #: Width of the first slot of the item.
+    image_width: Optional[int]
+
+    #: Height of the first slot of the item.
+    image_height: Optional[int]
+
+    #: Number of annotations in the file.
+    annotation_count: int
+
+    #: Number of annotations in the file with a polygon path.
+    density: int
+
+    def image_path(self, images_dir: Path, with_folders: bool) -> Optional[Path]:
+        """
+        Returns the local path of the image of this item, following the same naming convention
+        as ``darwin.utils.get_image_path_from_stream``.
+
+        Parameters
+        ----------
+        images_dir : Path
+            Path to the directory containing the images.
+        with_folders : bool
+            Flag to determine if the release was pulled with or without folders.
+
+        Returns
+        -------
+        Optional[Path]
+            Path to the image file or ``None`` if the item has no source files.
+        """
+        if (
+            self.item_name is None
+            or self.item_path is None
+            or self.source_file_name is None
+        ):
+            return None
+        local_file_name = Path(
+            Path(self.item_name).stem + Path(self.source_file_name).suffix
+        )
+        if not with_folders:
+            return images_dir / local_file_name
+        return images_dir / Path(self.item_path.lstrip("/\\")) / local_file_name
+
+
+def get_annotation_index_path(annotations_path: Path) -> Path:
+    """
+    Returns the path of the index of the given annotations folder.
+
+    Parameters
+    ----------
+    annotations_path : Path
+        Path to the folder with the Darwin JSON files.
+
+    Returns
+    -------
+    Path
+        Path of the index file, next to the annotations folder.
+    """
+    annotations_path = Path(annotations_path)
+    return annotations_path.with_name(annotations_path.name + ANNOTATION_INDEX_SUFFIX)
+
+
+class AnnotationIndex:
+    """
+    SQLite index of the Darwin JSON files in an annotations folder. For each file it stores the
+    item information needed to locate its image, the image dimensions, the number of annotations
+    and the classes per annotation type, so that local dataset operations don't need to parse
+    every file again.
+
+    Files are tracked by their modification time and size: ``update`` only parses the files that
+    were added or changed since the last update and drops the ones that were removed.
+
+    Parameters
+    ----------
+    annotations_path : Path
+        Path to the folder with the Darwin JSON files.
+    index_path : Optional[Path], default: None
+        Path of the index file. Defaults to ``get_annotation_index_path(annotations_path)``.
+
+    Attributes
+    ----------
+    annotations_path : Path
+        Path to the folder with the Darwin JSON files.
+    index_path : Path
+        Path of the index file.
+    """
+
+    def __init__(self, annotations_path: Path, index_path: Optional[Path] = None):
+        self.annotations_path = Path(annotations_path)
+        self.index_path = index_path or get_annotation_index_path(self.annotations_path)
+        self._connection = sqlite3.connect(str(self.index_path))
+        self._create_tables()
+
+    @classmethod
+    def load(cls, annotations_path: Path) -> Optional["AnnotationIndex"]:
+        """
+        Opens the existing index of the given annotations folder and brings it up to date.
+
+        Parameters
+        ----------
+        annotations_path : Path
+            Path to the folder with the Darwin JSON files.
+
+        Returns
+        -------
+        Optional[AnnotationIndex]
+            The updated index, or ``None`` if the folder has no index or it cannot be read.
+        """
+        index_path = get_annotation_index_path(annotations_path)
+        if not index_path.is_file():
+            return None
+        try:
+            index = cls(annotations_path, index_path)
+            index.update()
+        except sqlite3.Error:
+            return None
+        return index
+
+    def close(self) -> None:
+        """Saves the pending entries and closes the connection to the index file."""
+        self._connection.commit()
+        self._connection.close()
+
+    def add(self, annotation_file: dt.AnnotationFile) -> None:
+        """
+        Indexes a single parsed file of the annotations folder, replacing its previous entry.
+        The entry is saved by the next ``update``, ``refresh_stats`` or ``close``.
+
+        Parameters
+        ----------
+        annotation_file : dt.AnnotationFile
+            The parsed annotation file, whose ``path`` is in the annotations folder.
+        """
+        relative_path = self._relative_path(annotation_file.path)
+        if relative_path is None:
+            return
+        stat = Path(annotation_file.path).stat()
+        self._delete(relative_path)
+        self._insert(relative_path, (stat.st_mtime_ns, stat.st_size), annotation_file)
+
+    def refresh_stats(self, annotation_paths: Iterable[Path]) -> None:
+        """
+        Records the current modification time and size of indexed files whose annotations did
+        not change, such as after the local paths of their source files were written to them,
+        so that ``update`` doesn't parse them again.
+
+        Parameters
+        ----------
+        annotation_paths : Iterable[Path]
+            Paths of the annotation files, in the annotations folder.
+        """
+        stats = []
+        for annotation_path in annotation_paths:
+            relative_path = self._relative_path(annotation_path)
+            if relative_path is None or not Path(annotation_path).exists():
+                continue
+            stat = Path(annotation_path).stat()
+            stats.append((stat.st_mtime_ns, stat.st_size, relative_path))
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE files SET mtime_ns = ?, size = ? WHERE path = ?", stats
+            )
+
+    def update(
+        self, annotation_files: Optional[Iterable[dt.AnnotationFile]] = None
+    ) -> None:
+        """
+        Brings the index up to date with the annotations folder.
+
+        Parameters
+        ----------
+        annotation_files : Optional[Iterable[dt.AnnotationFile]], default: None
+            Already parsed annotation files from the annotations folder. Changed files found in
+            here are indexed without being parsed again.
+        """
+        current = self._stat_files()
+        stored = {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in self._connection.execute(
+                "SELECT path, mtime_ns, size FROM files"
+            )
+        }
+        removed = [path for path in stored if path not in current]
+        changed = [path for path, stat in current.items() if stored.get(path) != stat]
+        if not removed and not changed:
+            self._connection.commit()
+            return
+
+        parsed: Dict[str, dt.AnnotationFile] = {}
+        for annotation_file in annotation_files or []:
+            relative_path = self._relative_path(annotation_file.path)
+            if relative_path is not None:
+                parsed[relative_path] = annotation_file
+
+        with self._connection:
+            for path in removed + [path for path in changed if path in stored]:
+                self._delete(path)
+            for path in changed:
+                changed_file: Optional[dt.AnnotationFile] = parsed.get(path)
+                if changed_file is None:
+                    changed_file = parse_darwin_json(self.annotations_path / path, 0)
+                self._insert(path, current[path], changed_file)
+
+    def annotation_file_paths(self) -> List[str]:
+        """
+        Returns the paths of all the indexed annotation files, in the same order as
+        ``darwin.utils.get_annotation_files_from_dir``.
+
+        Returns
+        -------
+        List[str]
+            The paths of the annotation files.
+        """
+        return [str(path) for path in self._sorted_paths()]
+
+    def entries(self) -> Dict[str, IndexedAnnotationFile]:
+        """
+        Returns the summary of every parseable annotation file.
+
+        Returns
+        -------
+        Dict[str, IndexedAnnotationFile]
+            Summaries indexed by the full path of the annotation file, as a string.
+        """
+        rows = self._connection.execute(
+            "SELECT path, item_name, item_path, source_file_name, image_width,"
+            " image_height, annotation_count, density FROM files WHERE parsed = 1"
+        )
+        return {
+            str(self.annotations_path / row[0]): IndexedAnnotationFile(*row)
+            for row in rows
+        }
+
+    def extract_classes(
+        self, annotation_types: List[str]
+    ) -> Tuple[Dict[str, Set[int]], Dict[int, Set[str]]]:
+        """
+        Index-backed equivalent of ``darwin.dataset.utils.extract_classes``.
+
+        Parameters
+        ----------
+        annotation_types : List[str]
+            Types of annotation to use to extract the classes.
+
+        Returns
+        -------
+        Tuple[Dict[str, Set[int]], Dict[int, Set[str]]]
+            Classes mapped to the indices of the files containing them, and file indices mapped
+            to the classes they contain.
+        """
+        file_indices = self._file_indices()
+        placeholders = ", ".join("?" for _ in annotation_types)
+        rows = self._connection.execute(
+            f"SELECT path, name FROM classes WHERE annotation_type IN ({placeholders})",
+            list(annotation_types),
+        )
+
+        classes: Dict[str, Set[int]] = defaultdict(set)
+        indices_to_classes: Dict[int, Set[str]] = defaultdict(set)
+        for path, name in rows:
+            i = file_indices[path]
+            indices_to_classes[i].add(name)
+            classes[name].add(i)
+        return classes, indices_to_classes
+
+    def extract_classes_by_type(
+        self, annotation_types: List[str]
+    ) -> Dict[str, Tuple[Dict[str, Set[int]], Dict[int, Set[str]]]]:
+        """
+        Index-backed equivalent of ``darwin.dataset.utils.extract_classes_by_type``.
+
+        Parameters
+        ----------
+        annotation_types : List[str]
+            Types of annotation to extract the classes of.
+
+        Returns
+        -------
+        Dict[str, Tuple[Dict[str, Set[int]], Dict[int, Set[str]]]]
+            For each annotation type, the same mappings returned by ``extract_classes``.
+        """
+        file_indices = self._file_indices()
+        placeholders = ", ".join("?" for _ in annotation_types)
+        rows = self._connection.execute(
+            "SELECT path, name, annotation_type FROM classes"
+            f" WHERE annotation_type IN ({placeholders})",
+            list(annotation_types),
+        )
+
+        classes_per_type: Dict[str, Tuple[Dict[str, Set[int]], Dict[int, Set[str]]]] = {
+            annotation_type: (defaultdict(set), defaultdict(set))
+            for annotation_type in annotation_types
+        }
+        for path, name, annotation_type in rows:
+            i = file_indices[path]
+            classes, indices_to_classes = classes_per_type[annotation_type]
+            indices_to_classes[i].add(name)
+            classes[name].add(i)
+        return classes_per_type
+
+    def class_counts(self, annotation_path: Path) -> Optional[Counter]:
+        """
+        Returns how many annotations of each class the given file has, regardless of their type.
+
+        Parameters
+        ----------
+        annotation_path : Path
+            Path of the annotation file.
+
+        Returns
+        -------
+        Optional[Counter]
+            The count of annotations per class name, or ``None`` if the file is not indexed or
+            could not be parsed.
+        """
+        relative_path = self._relative_path(annotation_path)
+        if relative_path is None:
+            return None
+        if (
+            self._connection.execute(
+                "SELECT 1 FROM files WHERE path = ? AND parsed = 1", (relative_path,)
+            ).fetchone()
+            is None
+        ):
+            return None
+        counts: Counter = Counter()
+        for name, count in self._connection.execute(
+            "SELECT name, count FROM classes WHERE path = ?", (relative_path,)
+        ):
+            counts[name] += count
+        return counts
+
+    def max_density(self) -> int:
+        """
+        Returns the maximum number of polygon annotations found in a single file.
+
+        Returns
+        -------
+        int
+            The maximum density, or 0 if no file has polygons.
+        """
+        (max_density,) = self._connection.execute(
+            "SELECT MAX(density) FROM files WHERE parsed = 1"
+        ).fetchone()
+        return max_density or 0
+
+    def _create_tables(self) -> None:
+        (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+        with self._connection:
+            if version != _SCHEMA_VERSION:
+                self._connection.execute("DROP TABLE IF EXISTS files")
+                self._connection.execute("DROP TABLE IF EXISTS classes")
+                self._connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                " path TEXT PRIMARY KEY,"
+                " mtime_ns INTEGER NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " parsed INTEGER NOT NULL,"
+                " item_name TEXT,"
+                " item_path TEXT,"
+                " source_file_name TEXT,"
+                " image_width INTEGER,"
+                " image_height INTEGER,"
+                " annotation_count INTEGER NOT NULL DEFAULT 0,"
+                " density INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS classes ("
+                " path TEXT NOT NULL,"
+                " name TEXT NOT NULL,"
+                " annotation_type TEXT NOT NULL,"
+                " count INTEGER NOT NULL,"
+                " PRIMARY KEY (path, name, annotation_type))"
+            )
+
+    def _stat_files(self) -> Dict[str, Tuple[int, int]]:
+        files: Dict[str, Tuple[int, int]] = {}
+        for dirpath, dirnames, filenames in os.walk(self.annotations_path):
+            # The properties manifest is not an annotation file
+            dirnames[:] = [dirname for dirname in dirnames if dirname != ".v7"]
+            for filename in filenames:
+                if not filename.endswith(".json"):
+                    continue
+                full_path = Path(dirpath) / filename
+                stat = full_path.stat()
+                relative_path = full_path.relative_to(self.annotations_path)
+                files[relative_path.as_posix()] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def _file_indices(self) -> Dict[str, int]:
+        return {
+            path.relative_to(self.annotations_path).as_posix(): i
+            for i, path in enumerate(self._sorted_paths())
+        }
+
+    def _sorted_paths(self) -> List[Path]:
+        return sorted(
+            self.annotations_path / path
+            for (path,) in self._connection.execute("SELECT path FROM files")
+        )
+
+    def _relative_path(self, annotation_path: Path) -> Optional[str]:
+        try:
+            return Path(annotation_path).relative_to(self.annotations_path).as_posix()
+        except ValueError:
+            return None
+
+    def _delete(self, path: str) -> None:
+        self._connection.execute("DELETE FROM files WHERE path = ?", (path,))
+        self._connection.execute("DELETE FROM classes WHERE path = ?", (path,))
+
+    def _insert(
+        self,
+        path: str,
+        stat: Tuple[int, int],
+        annotation_file: Optional[dt.AnnotationFile],
+    ) -> None:
+        mtime_ns, size = stat
+        if annotation_file is None:
+            self._connection.execute(
+                "INSERT INTO files (path, mtime_ns, size, parsed) VALUES (?, ?, ?, 0)",
+                (path, mtime_ns, size),
+            )
+            return
+
+        source_file_name = None
+        if annotation_file.slots and annotation_file.slots[0].source_files:
+            source_file_name = annotation_file.slots[0].source_files[0].file_name
+
+        class_counts: Counter = Counter()
+        density = 0
+        for annotation in annotation_file.annotations:
+            annotation_class = annotation.annotation_class
+            class_counts[(annotation_class.name, annotation_class.annotation_type)] += 1
+            data = getattr(annotation, "data", {})
+            if "path" in data or "paths" in data:
+                density += 1
+
+        self._connection.execute(
+            "INSERT INTO files VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                mtime_ns,
+                size,
+                annotation_file.filename,
+                annotation_file.remote_path,
+                source_file_name,
+                annotation_file.image_width,
+                annotation_file.image_height,
+                len(annotation_file.annotations),
+                density,
+            ),
+        )
+        self._connection.executemany(
+            "INSERT INTO classes VALUES (?, ?, ?, ?)",
+            [
+                (path, name, annotation_type, count)
+                for (name, annotation_type), count in class_counts.items()
+            ],
+        )
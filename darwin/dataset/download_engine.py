@@ -0,0 +1,224 @@
+"""
+Holds the thread based engine that runs the file downloads of a release pull.
+"""
+
+import concurrent.futures
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Tuple
+
+from requests import Response, Session
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from rich.progress import Progress
+
+if TYPE_CHECKING:
+    from darwin.client import Client
+
+#: Number of concurrent downloads used when none is given and
+#: ``DARWIN_DOWNLOAD_FILES_CONCURRENCY`` is not set. Downloads are I/O bound, so this is
+#: independent from the number of CPUs.
+DEFAULT_DOWNLOAD_WORKERS = 32
+
+
+@dataclass
+class DownloadStats:
+    """
+    Throughput of a run of the ``DownloadEngine``.
+    """
+
+    #: Number of downloads that finished successfully.
+    files: int = 0
+
+    #: Number of downloads that raised an error.
+    errors: int = 0
+
+    #: Number of bytes received, as announced by the ``Content-Length`` of the responses.
+    bytes: int = 0
+
+    #: Wall time of the run, in seconds.
+    seconds: float = 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes / 1e6 / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.files} files ({self.bytes / 1e6:.1f} MB) in {self.seconds:.1f}s: "
+            f"{self.files_per_second:.1f} files/s, {self.megabytes_per_second:.1f} MB/s"
+        )
+
+
+def get_download_workers(max_workers: Optional[int] = None) -> int:
+    """
+    Returns the number of concurrent downloads to use.
+
+    Parameters
+    ----------
+    max_workers : Optional[int], default: None
+        Explicit number of concurrent downloads.
+
+    Returns
+    -------
+    int
+        ``max_workers`` if given, otherwise ``DARWIN_DOWNLOAD_FILES_CONCURRENCY`` if set to a
+        positive number, otherwise ``DEFAULT_DOWNLOAD_WORKERS``.
+    """
+    if max_workers is not None:
+        if max_workers <= 0:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        return max_workers
+
+    env_max_workers = os.getenv("DARWIN_DOWNLOAD_FILES_CONCURRENCY")
+    if env_max_workers and int(env_max_workers) > 0:
+        return int(env_max_workers)
+    return DEFAULT_DOWNLOAD_WORKERS
+
+
+class DownloadEngine:
+    """
+    Runs download functions, such as the ones returned by
+    ``download_all_images_from_annotations``, on a bounded pool of threads.
+
+    All the downloads go through the ``requests.Session`` of the given ``Client``. When the
+    engine runs, the connection pools of that session are sized to keep one pool of keep-alive
+    connections per host, capped at ``max_connections_per_host`` connections: downloads to a
+    host that has all its connections busy wait for one to be released.
+
+    Parameters
+    ----------
+    client : Client
+        Client whose session is used by the download functions.
+    max_workers : Optional[int], default: None
+        Number of concurrent downloads. See ``get_download_workers``.
+    max_connections_per_host : Optional[int], default: None
+        Maximum number of simultaneous connections to a single host. Defaults to
+        ``max_workers``.
+
+    Attributes
+    ----------
+    client : Client
+        Client whose session is used by the download functions.
+    max_workers : int
+        Number of concurrent downloads.
+    max_connections_per_host : int
+        Maximum number of simultaneous connections to a single host.
+    stats : DownloadStats
+        Throughput of the last run.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        max_workers: Optional[int] = None,
+        max_connections_per_host: Optional[int] = None,
+    ):
+        self.client = client
+        self.max_workers = get_download_workers(max_workers)
+        self.max_connections_per_host = max_connections_per_host or self.max_workers
+        self.stats = DownloadStats()
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        download_functions: Iterable[Callable[[], Any]],
+        count: int,
+        progress: bool = True,
+    ) -> Tuple[List[Any], List[Exception]]:
+        """
+        Runs all the given download functions.
+
+        Parameters
+        ----------
+        download_functions : Iterable[Callable[[], Any]]
+            The functions to run, each one downloading a single file.
+        count : int
+            Number of functions, used for the progress bar.
+        progress : bool, default: True
+            Shows a progress bar while downloading.
+
+        Returns
+        -------
+        Tuple[List[Any], List[Exception]]
+            The values returned by the successful functions, and the errors raised by the others.
+        """
+        self.stats = DownloadStats()
+        successes: List[Any] = []
+        errors: List[Exception] = []
+        progress_bar = Progress(disable=not progress)
+        task = progress_bar.add_task("Downloading files", total=count)
+
+        def collect(future: concurrent.futures.Future) -> None:
+            try:
+                successes.append(future.result())
+                self.stats.files += 1
+            except Exception as e:
+                errors.append(e)
+                self.stats.errors += 1
+            progress_bar.advance(task)
+
+        _size_connection_pools(self.client.session, self.max_connections_per_host)
+        self.client.session.hooks["response"].append(self._count_bytes)
+        start = time.perf_counter()
+        try:
+            with progress_bar:
+                with concurrent.futures.ThreadPoolExecutor(
+                    self.max_workers
+                ) as executor:
+                    # Keep a bounded number of pending downloads, so that their futures don't
+                    # pile up in memory on large releases
+                    pending: set = set()
+                    for download_function in download_functions:
+                        if len(pending) >= self.max_workers * 2:
+                            done, pending = concurrent.futures.wait(
+                                pending, return_when=concurrent.futures.FIRST_COMPLETED
+                            )
+                            for future in done:
+                                collect(future)
+                        pending.add(executor.submit(download_function))
+                    for future in concurrent.futures.as_completed(pending):
+                        collect(future)
+        finally:
+            self.client.session.hooks["response"].remove(self._count_bytes)
+        self.stats.seconds = time.perf_counter() - start
+        return successes, errors
+
+    def _count_bytes(self, response: Response, *args: Any, **kwargs: Any) -> None:
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit():
+            with self._lock:
+                self.stats.bytes += int(content_length)
+
+
+def _size_connection_pools(session: Session, max_connections_per_host: int) -> None:
+    """
+    Sizes the connection pools of the HTTP adapters of a session, so that each pool keeps up to
+    ``max_connections_per_host`` connections to its host, and requests wait for one of them to
+    be released instead of opening more.
+
+    The adapters themselves are kept, along with their configuration such as their retries.
+    Requests already sent through the previous pools finish on their own connections.
+
+    Parameters
+    ----------
+    session : Session
+        The session whose adapters are sized.
+    max_connections_per_host : int
+        Maximum number of simultaneous connections to a single host.
+    """
+    for adapter in set(session.adapters.values()):
+        if not isinstance(adapter, HTTPAdapter):
+            continue
+        pool_kw = adapter.poolmanager.connection_pool_kw
+        if pool_kw.get("maxsize") == max_connections_per_host and pool_kw.get("block"):
+            continue
+        previous_poolmanager = adapter.poolmanager
+        adapter.init_poolmanager(DEFAULT_POOLSIZE, max_connections_per_host, block=True)
+        # Closes the idle connections of the previous pools, the others are closed when released
+        previous_poolmanager.clear()
@@ -2,8 +2,10 @@
 Holds helper functions that deal with downloading videos and images.
 """
 
+import concurrent.futures
 import functools
 import os
+import threading
 import time
 import urllib
 from collections import Counter
@@ -14,10 +16,13 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
+    Set,
     Tuple,
     TYPE_CHECKING,
+    Union,
 )
 
 import numpy as np
@@ -46,6 +51,132 @@ if TYPE_CHECKING:
     from darwin.client import Client
 
 
+#: Maximum number of frame manifests of a video downloaded at the same time.
+MAX_CONCURRENT_MANIFEST_DOWNLOADS = 8
+
+#: Encodings in which the frames extracted from video segments can be written.
+VIDEO_FRAME_FORMATS = ["png", "jpeg", "npy"]
+
+
+class VideoFrameExtraction:
+    """
+    How the frames of the videos of a pull are extracted from their segments when pulling video
+    frames, and how long each stage of the extraction took, across all the download functions
+    of the pull.
+
+    Parameters
+    ----------
+    frame_format : str, default: "png"
+        Encoding of the frames, one of ``VIDEO_FRAME_FORMATS``. ``"npy"`` writes the raw BGR
+        arrays, which is the fastest but produces files that are not images.
+    png_compression : Optional[int], default: None
+        Compression level of PNG frames, from 0 (fastest) to 9 (smallest). Defaults to the one
+        of OpenCV.
+    jpeg_quality : int, default: 95
+        Quality of JPEG frames, from 0 to 100.
+
+    Attributes
+    ----------
+    frame_format : str
+        Encoding of the frames.
+    png_compression : Optional[int]
+        Compression level of PNG frames.
+    jpeg_quality : int
+        Quality of JPEG frames.
+    stage_seconds : Dict[str, float]
+        Total time spent fetching manifests, downloading segments, decoding and encoding frames.
+        Only the time spent in the current process is counted.
+
+    Raises
+    ------
+    ValueError
+        If ``frame_format`` is not supported.
+    """
+
+    def __init__(
+        self,
+        frame_format: str = "png",
+        png_compression: Optional[int] = None,
+        jpeg_quality: int = 95,
+    ):
+        if frame_format not in VIDEO_FRAME_FORMATS:
+            raise ValueError(
+                f"Unsupported video frame format {frame_format}, use one of {VIDEO_FRAME_FORMATS}"
+            )
+        self.frame_format = frame_format
+        self.png_compression = png_compression
+        self.jpeg_quality = jpeg_quality
+        self.stage_seconds: Dict[str, float] = {
+            "manifests": 0.0,
+            "download": 0.0,
+            "decode": 0.0,
+            "encode": 0.0,
+        }
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks can't be pickled
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def extension(self) -> str:
+        """str : The extension of the frame files."""
+        return ".jpg" if self.frame_format == "jpeg" else f".{self.frame_format}"
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        """
+        Adds the given time to a stage of the extraction.
+
+        Parameters
+        ----------
+        stage : str
+            One of the keys of ``stage_seconds``.
+        seconds : float
+            The time spent in the stage.
+        """
+        with self._lock:
+            self.stage_seconds[stage] += seconds
+
+    def write_frame(self, frame: np.ndarray, path: Path) -> None:
+        """
+        Writes a frame decoded by OpenCV.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            The BGR frame.
+        path : Path
+            Path of the frame file, with the extension of this encoding.
+        """
+        if self.frame_format == "npy":
+            np.save(path, frame)
+            return
+
+        from cv2 import (  # pylint: disable=import-outside-toplevel
+            IMWRITE_JPEG_QUALITY,
+            IMWRITE_PNG_COMPRESSION,
+            imwrite,
+        )
+
+        params: List[int] = []
+        if self.frame_format == "jpeg":
+            params = [IMWRITE_JPEG_QUALITY, self.jpeg_quality]
+        elif self.png_compression is not None:
+            params = [IMWRITE_PNG_COMPRESSION, self.png_compression]
+        imwrite(str(path), frame, params)
+
+    def __str__(self) -> str:
+        return ", ".join(
+            f"{stage} {seconds:.1f}s" for stage, seconds in self.stage_seconds.items()
+        )
+
+
 def download_all_images_from_annotations(
     client: "Client",
     annotations_path: Path,
@@ -57,6 +188,9 @@ def download_all_images_from_annotations(
     video_frames: bool = False,
     force_slots: bool = False,
     ignore_slots: bool = False,
+    annotation_files: Optional[Iterable[AnnotationFile]] = None,
+    existing_images: Optional[Set[Path]] = None,
+    video_frame_extraction: Optional[VideoFrameExtraction] = None,
 ) -> Tuple[Callable[[], Iterable[Any]], int]:
     """
     Downloads all the images corresponding to a project.
@@ -82,6 +216,15 @@ def download_all_images_from_annotations(
     force_slots: bool, default: False
         Pulls all slots of items into deeper file structure ({prefix}/{item_name}/{slot_name}/{file_name})
         If False, all multi-slotted items and items with slots containing multiple source files will be downloaded as the deeper file structure
+    annotation_files : Optional[Iterable[AnnotationFile]], default: None
+        Already parsed annotation files, each with its ``path`` pointing inside ``annotations_path``.
+        If given, ``annotations_path`` is not walked and the files are not parsed again.
+    existing_images : Optional[Set[Path]], default: None
+        The files already in ``images_path``, for instance as recorded by a previous pull. If
+        given, ``images_path`` is not walked to find them, and only these files are considered by
+        ``remove_extra``.
+    video_frame_extraction : Optional[VideoFrameExtraction], default: None
+        How frames are extracted from video segments when pulling video frames.
 
     Returns
     -------
@@ -100,25 +243,27 @@ def download_all_images_from_annotations(
         raise ValueError(f"Annotation format {annotation_format} not supported")
 
     # Verify that there is not already image in the images folder
-    existing_images = {
-        image
-        for image in images_path.rglob("*")
-        if is_file_extension_allowed(image.name)
-    }
-
-    annotations_to_download_path: List = []
-    for annotation_path in annotations_path.glob(f"*.{annotation_format}"):
-        annotation = parse_darwin_json(annotation_path, count=0)
-        if annotation is None:
-            continue
-
-        if not force_replace:
-            # Check the planned path for the image against the existing images
+    if existing_images is None:
+        existing_images = {
+            image
+            for image in images_path.rglob("*")
+            if is_file_extension_allowed(image.name)
+        }
+
+    if annotation_files is None:
+        annotation_files = _parse_annotation_files(annotations_path, annotation_format)
+
+    annotations_to_download: List[Tuple[AnnotationFile, bool]] = []
+    release_image_paths: Set[Path] = set()
+    for annotation in annotation_files:
+        if not force_replace or remove_extra:
             planned_image_paths = _get_planned_image_paths(
                 annotation, images_path, use_folders
             )
+            release_image_paths.update(planned_image_paths)
 
-            if all(
+            # Check the planned path for the image against the existing images
+            if not force_replace and all(
                 planned_image_path in existing_images
                 for planned_image_path in planned_image_paths
             ):
@@ -131,40 +276,29 @@ def download_all_images_from_annotations(
                 len(slot.source_files) > 1 for slot in annotation.slots
             )
 
-        annotations_to_download_path.append((annotation_path, force_slots_for_item))
+        annotations_to_download.append((annotation, force_slots_for_item))
 
     if remove_extra:
-        annotations = (
-            parse_darwin_json(annotation_path)
-            for annotation_path in annotations_path.glob(f"*.{annotation_format}")
-        )
-        release_image_paths = [
-            _get_planned_image_paths(annotation, images_path, use_folders)
-            for annotation in annotations
-        ]
-        if any(isinstance(i, list) for i in release_image_paths):
-            release_image_paths = [
-                item for sublist in release_image_paths for item in sublist
-            ]
         for existing_image in existing_images:
             if existing_image not in release_image_paths:
                 print(f"Removing {existing_image} as it is not part of this release")
-                existing_image.unlink()
+                existing_image.unlink(missing_ok=True)
 
         _remove_empty_directories(images_path)
 
     # Create the generator with the partial functions
     download_functions: List = []
-    for annotation_path, force_slots in annotations_to_download_path:
+    for annotation, force_slots in annotations_to_download:
         file_download_functions = lazy_download_image_from_annotation(
             client,
-            annotation_path,
+            annotation,
             images_path,
             annotation_format,
             use_folders,
             video_frames,
             force_slots,
             ignore_slots,
+            video_frame_extraction,
         )
         download_functions.extend(file_download_functions)
 
@@ -174,15 +308,29 @@ def download_all_images_from_annotations(
     return lambda: download_functions, len(download_functions)
 
 
+def _parse_annotation_files(
+    annotations_path: Path, annotation_format: str
+) -> Iterator[AnnotationFile]:
+    """
+    Lazily parses the annotation files found in the given directory, skipping the ones without
+    annotations.
+    """
+    for annotation_path in annotations_path.glob(f"*.{annotation_format}"):
+        annotation = parse_darwin_json(annotation_path, count=0)
+        if annotation is not None:
+            yield annotation
+
+
 def lazy_download_image_from_annotation(
     client: "Client",
-    annotation: AnnotationFile,
+    annotation: Union[Path, AnnotationFile],
     images_path: Path,
     annotation_format: str,
     use_folders: bool,
     video_frames: bool,
     force_slots: bool,
     ignore_slots: bool = False,
+    video_frame_extraction: Optional[VideoFrameExtraction] = None,
 ) -> Iterable[Callable[[], None]]:
     """
     Returns functions to download an image given an annotation. Same as `download_image_from_annotation`
@@ -192,8 +340,8 @@ def lazy_download_image_from_annotation(
     ----------
     client : Client
         Client of the current team
-    annotation : AnnotationFile
-        Annotation file corresponding to the dataset file
+    annotation : Union[Path, AnnotationFile]
+        Annotation file corresponding to the dataset file, either already parsed or its path
     images_path : Path
         Path where to download the image
     annotation_format : str
@@ -204,6 +352,8 @@ def lazy_download_image_from_annotation(
         Pulls video frames images instead of video files
     force_slots: bool
         Pulls all slots of items into deeper file structure ({prefix}/{item_name}/{slot_name}/{file_name})
+    video_frame_extraction : Optional[VideoFrameExtraction], default: None
+        How frames are extracted from video segments when pulling video frames.
 
     Raises
     ------
@@ -212,6 +362,18 @@ def lazy_download_image_from_annotation(
     """
 
     if annotation_format == "json":
+        if isinstance(annotation, AnnotationFile):
+            return _download_image_from_json_annotation(
+                client,
+                annotation.path,
+                images_path,
+                use_folders,
+                video_frames,
+                force_slots,
+                ignore_slots,
+                annotation=annotation,
+                video_frame_extraction=video_frame_extraction,
+            )
         return _download_image_from_json_annotation(
             client,
             annotation,
@@ -220,6 +382,7 @@ def lazy_download_image_from_annotation(
             video_frames,
             force_slots,
             ignore_slots,
+            video_frame_extraction=video_frame_extraction,
         )
     else:
         console = Console()
@@ -235,8 +398,11 @@ def _download_image_from_json_annotation(
     video_frames: bool,
     force_slots: bool,
     ignore_slots: bool = False,
+    annotation: Optional[AnnotationFile] = None,
+    video_frame_extraction: Optional[VideoFrameExtraction] = None,
 ) -> Iterable[Callable[[], None]]:
-    annotation = parse_darwin_json(annotation_path, count=0)
+    if annotation is None:
+        annotation = parse_darwin_json(annotation_path, count=0)
     if annotation is None:
         return []
 
@@ -255,10 +421,11 @@ def _download_image_from_json_annotation(
                 annotation_path,
                 video_frames,
                 use_folders,
+                video_frame_extraction,
             )
         if force_slots:
             return _download_all_slots_from_json_annotation(
-                annotation, client, parent_path, video_frames
+                annotation, client, parent_path, video_frames, video_frame_extraction
             )
         else:
             return _download_single_slot_from_json_annotation(
@@ -268,6 +435,7 @@ def _download_image_from_json_annotation(
                 annotation_path,
                 video_frames,
                 use_folders,
+                video_frame_extraction,
             )
 
     return []
@@ -278,8 +446,10 @@ def _download_all_slots_from_json_annotation(
     client: "Client",
     parent_path: Path,
     video_frames: bool,
+    video_frame_extraction: Optional[VideoFrameExtraction] = None,
 ) -> Iterable[Callable[[], None]]:
     generator = []
+    local_path_updates = _LocalPathUpdates(annotation)
     for slot in annotation.slots:
         if not slot.name:
             raise ValueError("Slot name is required to download all slots")
@@ -294,7 +464,9 @@ def _download_all_slots_from_json_annotation(
             video_path: Path = slot_path
             video_path.mkdir(exist_ok=True, parents=True)
             if not slot.frame_urls:
-                segment_manifests = get_segment_manifests(slot, slot_path, client)
+                segment_manifests = get_segment_manifests(
+                    slot, slot_path, client, video_frame_extraction
+                )
                 for index, manifest in enumerate(segment_manifests):
                     if slot.segments is None:
                         raise ValueError("No segments found")
@@ -307,6 +479,7 @@ def _download_all_slots_from_json_annotation(
                             client,
                             path,
                             manifest,
+                            video_frame_extraction,
                         )
                     )
             else:
@@ -320,6 +493,7 @@ def _download_all_slots_from_json_annotation(
         else:
             for upload in slot.source_files:
                 file_path = slot_path / sanitize_filename(upload.file_name)
+                local_path_updates.add()
                 generator.append(
                     functools.partial(
                         _download_image_with_trace,
@@ -327,6 +501,7 @@ def _download_all_slots_from_json_annotation(
                         upload.url,
                         file_path,
                         client,
+                        local_path_updates,
                     )
                 )
     return generator
@@ -339,6 +514,7 @@ def _download_single_slot_from_json_annotation(
     annotation_path: Path,
     video_frames: bool,
     use_folders: bool = True,
+    video_frame_extraction: Optional[VideoFrameExtraction] = None,
 ) -> Iterable[Callable[[], None]]:
     slot = annotation.slots[0]
     generator = []
@@ -351,7 +527,9 @@ def _download_single_slot_from_json_annotation(
 
         # Indicates it's a long video and uses the segment and manifest
         if not slot.frame_urls:
-            segment_manifests = get_segment_manifests(slot, video_path, client)
+            segment_manifests = get_segment_manifests(
+                slot, video_path, client, video_frame_extraction
+            )
             for index, manifest in enumerate(segment_manifests):
                 if slot.segments is None:
                     raise ValueError("No segments found")
@@ -364,6 +542,7 @@ def _download_single_slot_from_json_annotation(
                         client,
                         path,
                         manifest,
+                        video_frame_extraction,
                     )
                 )
         else:
@@ -388,6 +567,8 @@ def _download_single_slot_from_json_annotation(
                 filename or annotation.filename
             )
 
+            local_path_updates = _LocalPathUpdates(annotation)
+            local_path_updates.add()
             generator.append(
                 functools.partial(
                     _download_image_with_trace,
@@ -395,12 +576,68 @@ def _download_single_slot_from_json_annotation(
                     image_url,
                     image_path,
                     client,
+                    local_path_updates,
                 )
             )
     return generator
 
 
-def _update_local_path(annotation: AnnotationFile, url, local_path):
+class _LocalPathUpdates:
+    """
+    Collects the local paths of the source files of an annotation while they are downloaded, and
+    writes them back to the annotation file at once when the last download of the annotation
+    finishes, whether it succeeded or not.
+
+    Copies sent to other processes, as when download functions are exhausted by a process pool,
+    can't know when the other downloads finish, so they write their local path right away.
+
+    Parameters
+    ----------
+    annotation : AnnotationFile
+        The annotation whose source files are downloaded.
+    """
+
+    def __init__(self, annotation: AnnotationFile):
+        self.annotation = annotation
+        self.local_paths: Dict[str, Path] = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._shared = True
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks can't be pickled
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._shared = False
+
+    def add(self) -> None:
+        """Registers one more download of a source file of the annotation."""
+        with self._lock:
+            self._pending += 1
+
+    def done(self, url: str, local_path: Optional[Path] = None) -> None:
+        """
+        Marks the download of the given url as finished, ``local_path`` being ``None`` if it
+        failed.
+        """
+        if not self._shared:
+            if local_path is not None:
+                _update_local_paths(self.annotation, {url: local_path})
+            return
+        with self._lock:
+            if local_path is not None:
+                self.local_paths[url] = local_path
+            self._pending -= 1
+            if self._pending == 0 and self.local_paths:
+                _update_local_paths(self.annotation, self.local_paths)
+
+
+def _update_local_paths(annotation: AnnotationFile, local_paths: Dict[str, Path]):
     if annotation.version.major == 1:
         return
 
@@ -409,8 +646,8 @@ def _update_local_path(annotation: AnnotationFile, url, local_path):
 
     for slot in raw_annotation["item"]["slots"]:
         for source_file in slot["source_files"]:
-            if source_file["url"] == url:
-                source_file["local_path"] = str(local_path)
+            if source_file["url"] in local_paths:
+                source_file["local_path"] = str(local_paths[source_file["url"]])
 
     with annotation.path.open(mode="w") as file:
         op = json.dumps(raw_annotation, json.OPT_INDENT_2).decode("utf-8")
@@ -455,9 +692,19 @@ def _download_image(
         time.sleep(1)
 
 
-def _download_image_with_trace(annotation, image_url, image_path, client):
-    _download_image(image_url, image_path, client)
-    _update_local_path(annotation, image_url, image_path)
+def _download_image_with_trace(
+    annotation, image_url, image_path, client, local_path_updates=None
+):
+    if local_path_updates is None:
+        local_path_updates = _LocalPathUpdates(annotation)
+        local_path_updates.add()
+
+    local_path = None
+    try:
+        _download_image(image_url, image_path, client)
+        local_path = image_path
+    finally:
+        local_path_updates.done(image_url, local_path)
 
 
 def _fetch_multiple_files(
@@ -512,21 +759,33 @@ def _rg16_to_grayscale(path):
 
 
 def _download_and_extract_video_segment(
-    url: str, client: "Client", path: Path, manifest: dt.SegmentManifest
+    url: str,
+    client: "Client",
+    path: Path,
+    manifest: dt.SegmentManifest,
+    video_frame_extraction: Optional[VideoFrameExtraction] = None,
 ) -> None:
+    video_frame_extraction = video_frame_extraction or VideoFrameExtraction()
+    start = time.perf_counter()
     _download_video_segment_file(url, client, path)
-    _extract_frames_from_segment(path, manifest)
+    video_frame_extraction.add_time("download", time.perf_counter() - start)
+    _extract_frames_from_segment(path, manifest, video_frame_extraction)
     path.unlink()
 
 
-def _extract_frames_from_segment(path: Path, manifest: dt.SegmentManifest) -> None:
+def _extract_frames_from_segment(
+    path: Path,
+    manifest: dt.SegmentManifest,
+    video_frame_extraction: Optional[VideoFrameExtraction] = None,
+) -> None:
     # import cv2 here to avoid dependency on OpenCV when not needed if not installed as optional extra
     try:
-        from cv2 import VideoCapture, imwrite  # pylint: disable=import-outside-toplevel
+        from cv2 import VideoCapture  # pylint: disable=import-outside-toplevel
     except ImportError as e:
         raise MissingDependency(
             "Missing Dependency: OpenCV required for Video Extraction. Install with `pip install darwin-py\[ocv]`"
         ) from e
+    video_frame_extraction = video_frame_extraction or VideoFrameExtraction()
     cap = VideoCapture(str(path))
 
     # Read and save frames. Iterates over every frame because frame seeking in OCV is not reliable or guaranteed.
@@ -534,8 +793,12 @@ def _extract_frames_from_segment(path: Path, manifest: dt.SegmentManifest) -> No
         item.frame: item.visible_frame for item in manifest.items if item.visibility
     }
     frame_index = 0
+    decode_seconds = 0.0
+    encode_seconds = 0.0
     while cap.isOpened():
+        start = time.perf_counter()
         success, frame = cap.read()
+        decode_seconds += time.perf_counter() - start
         if frame is None:
             break
         if not success:
@@ -544,12 +807,18 @@ def _extract_frames_from_segment(path: Path, manifest: dt.SegmentManifest) -> No
             )
         if frame_index in frames_to_extract:
             visible_frame = frames_to_extract.pop(frame_index)
-            frame_path = path.parent / f"{visible_frame:07d}.png"
-            imwrite(str(frame_path), frame)
+            frame_path = path.parent / (
+                f"{visible_frame:07d}{video_frame_extraction.extension}"
+            )
+            start = time.perf_counter()
+            video_frame_extraction.write_frame(frame, frame_path)
+            encode_seconds += time.perf_counter() - start
             if not frames_to_extract:
                 break
         frame_index += 1
     cap.release()
+    video_frame_extraction.add_time("decode", decode_seconds)
+    video_frame_extraction.add_time("encode", encode_seconds)
 
 
 def _download_video_segment_file(url: str, client: "Client", path: Path) -> None:
@@ -568,8 +837,7 @@ def _download_video_segment_file(url: str, client: "Client", path: Path) -> None
 def download_manifest_txts(
     urls: List[str], client: "Client", folder: Path
 ) -> List[Path]:
-    paths = []
-    for index, url in enumerate(urls):
+    def download_manifest_txt(index: int, url: str) -> Path:
         auth_token = "token" in url
         response = client._get_raw_from_full_url(
             url, stream=True, auth_token=auth_token
@@ -583,13 +851,25 @@ def download_manifest_txts(
         path = folder / f"manifest_{index + 1}.txt"
         with open(str(path), "wb") as file:
             file.write(response.content)
-        paths.append(path)
-    return paths
+        return path
+
+    if len(urls) <= 1:
+        return [download_manifest_txt(index, url) for index, url in enumerate(urls)]
+
+    # The manifests are fetched concurrently, and returned in order as the frames they
+    # describe are numbered across all of them
+    max_workers = min(len(urls), MAX_CONCURRENT_MANIFEST_DOWNLOADS)
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        return list(executor.map(download_manifest_txt, range(len(urls)), urls))
 
 
 def get_segment_manifests(
-    slot: dt.Slot, parent_path: Path, client: "Client"
+    slot: dt.Slot,
+    parent_path: Path,
+    client: "Client",
+    video_frame_extraction: Optional[VideoFrameExtraction] = None,
 ) -> List[dt.SegmentManifest]:
+    start = time.perf_counter()
     with TemporaryDirectory(dir=parent_path) as tmpdirname:
         tmpdir = Path(tmpdirname)
         if slot.frame_manifest is None:
@@ -597,6 +877,8 @@ def get_segment_manifests(
         frame_urls = [item["url"] for item in slot.frame_manifest]
         manifest_paths = download_manifest_txts(frame_urls, client, tmpdir)
         segment_manifests = _parse_manifests(manifest_paths, slot.name or "0")
+    if video_frame_extraction is not None:
+        video_frame_extraction.add_time("manifests", time.perf_counter() - start)
     return segment_manifests
 
 
@@ -676,7 +958,8 @@ def _get_planned_image_paths(
             return [images_path / filename]
     else:
         for slot in annotation.slots:
-            if len(slot.source_files) > 1:
+            source_files = slot.source_files
+            if len(source_files) > 1:
                 # Check that the item is either a DICOM series or a frame extracted from a video
                 is_dicom_series = all(
                     source_file.file_name.endswith(".dcm")  # type: ignore
@@ -705,14 +988,14 @@ def _get_planned_image_paths(
                             for ext in SUPPORTED_IMAGE_EXTENSIONS
                         )
                     )
-                    slot.source_files = [frame_source_file]
+                    source_files = [frame_source_file]
                 if not is_dicom_series and not is_extracted_frame:
                     raise ValueError(
                         "This slot contains data that is not a DICOM series or a frame extracted from a video"
                     )
 
             slot_name = Path(slot.name)
-            for source_file in slot.source_files:
+            for source_file in source_files:
                 file_name = source_file.file_name  # type: ignore
                 if use_folders and annotation.remote_path != "/":
                     file_paths.append(
@@ -5,6 +5,7 @@ from typing import Any, Dict, Iterator, List, Optional, Tuple
 import numpy as np
 from PIL import Image as PILImage
 
+from darwin.dataset.annotation_index import AnnotationIndex, IndexedAnnotationFile
 from darwin.dataset.utils import get_classes, get_release_path, load_pil_image
 from darwin.utils import (
     SUPPORTED_IMAGE_EXTENSIONS,
@@ -143,15 +144,29 @@ class LocalDataset:
             release_path, annotations_dir, annotation_type, split, partition, split_type
         )
 
+        indexed_files: Dict[str, IndexedAnnotationFile] = {}
+        annotation_index = AnnotationIndex.load(annotations_dir)
+        if annotation_index is not None:
+            indexed_files = annotation_index.entries()
+            annotation_index.close()
+
         for annotation_filepath in annotation_filepaths:
+            indexed_file = indexed_files.get(str(annotation_filepath))
             annotation_filepath = Path(annotation_filepath)
-            darwin_json = stream_darwin_json(annotation_filepath)
-            image_path = get_image_path_from_stream(
-                darwin_json, images_dir, annotation_filepath, with_folders
-            )
+            image_path = None
+            if indexed_file is not None:
+                image_path = indexed_file.image_path(images_dir, with_folders)
+            if image_path is None:
+                indexed_file = None
+                darwin_json = stream_darwin_json(annotation_filepath)
+                image_path = get_image_path_from_stream(
+                    darwin_json, images_dir, annotation_filepath, with_folders
+                )
             if image_path.exists():
-                if not keep_empty_annotations and is_stream_list_empty(
-                    darwin_json["annotations"]
+                if not keep_empty_annotations and (
+                    indexed_file.annotation_count == 0
+                    if indexed_file is not None
+                    else is_stream_list_empty(darwin_json["annotations"])
                 ):
                     continue
                 self.images_path.append(image_path)
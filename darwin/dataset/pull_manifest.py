@@ -0,0 +1,114 @@
+"""
+Holds the manifest of the last release pulled into a local dataset, which lets the next pull only
+touch the items that were added, changed or removed since.
+"""
+
+import zipfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import orjson as json
+
+PULL_MANIFEST_NAME = ".pull_manifest.json"
+_MANIFEST_VERSION = 1
+
+
+def get_member_hash(member: zipfile.ZipInfo) -> str:
+    """
+    Returns a hash of the content of a zip member, read from the zip directory without
+    decompressing the member.
+
+    Parameters
+    ----------
+    member : zipfile.ZipInfo
+        The zip member.
+
+    Returns
+    -------
+    str
+        The CRC-32 and the size of the member.
+    """
+    return f"{member.CRC:08x}-{member.file_size}"
+
+
+@dataclass
+class PulledItem:
+    """
+    An item of a pulled release.
+    """
+
+    #: Name of the annotation file of the item in the release zip.
+    member: str
+
+    #: Hash of the annotation file in the release zip, see ``get_member_hash``.
+    hash: str
+
+    #: Name of the annotation file of the item in the annotations folder.
+    file: str
+
+    #: Paths of the files of the item, relative to the images folder of the dataset.
+    images: List[str] = field(default_factory=list)
+
+    #: Whether all the files of the item are known to be downloaded.
+    downloaded: bool = False
+
+
+@dataclass
+class PullManifest:
+    """
+    The items of the last release pulled into a local dataset, keyed by item id.
+    """
+
+    #: Annotations folder of the release, relative to the local dataset.
+    annotations_dir: str
+
+    #: Options of the pull that affect where the files of the items are downloaded to.
+    options: Dict[str, bool]
+
+    items: Dict[str, PulledItem] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, local_path: Path) -> Optional["PullManifest"]:
+        """
+        Loads the manifest of the given local dataset.
+
+        Parameters
+        ----------
+        local_path : Path
+            The folder of the local dataset.
+
+        Returns
+        -------
+        Optional[PullManifest]
+            The manifest, or ``None`` if the dataset has none or it cannot be read.
+        """
+        manifest_path = local_path / PULL_MANIFEST_NAME
+        if not manifest_path.exists():
+            return None
+        try:
+            data = json.loads(manifest_path.read_bytes())
+            if data.get("version") != _MANIFEST_VERSION:
+                return None
+            return cls(
+                annotations_dir=data["annotations_dir"],
+                options=data["options"],
+                items={key: PulledItem(**item) for key, item in data["items"].items()},
+            )
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return None
+
+    def save(self, local_path: Path) -> None:
+        """
+        Saves this manifest into the given local dataset.
+
+        Parameters
+        ----------
+        local_path : Path
+            The folder of the local dataset.
+        """
+        data = {"version": _MANIFEST_VERSION, **asdict(self)}
+        manifest_path = local_path / PULL_MANIFEST_NAME
+        temporary_path = manifest_path.with_name(f"{manifest_path.name}.tmp")
+        temporary_path.write_bytes(json.dumps(data))
+        temporary_path.replace(manifest_path)
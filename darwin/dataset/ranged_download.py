@@ -0,0 +1,354 @@
+"""
+Holds the resumable downloader used to fetch large files, such as release zips, in parallel
+chunks using HTTP Range requests.
+"""
+
+import base64
+import binascii
+import concurrent.futures
+import hashlib
+import re
+import threading
+import zlib
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+import orjson as json
+import requests
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from darwin.exceptions import DownloadVerificationError
+
+#: Size of each ranged request.
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+#: Number of chunks downloaded at the same time.
+DEFAULT_MAX_WORKERS = 8
+
+#: Number of attempts made to download each chunk.
+MAX_CHUNK_ATTEMPTS = 5
+
+_CONTENT_RANGE_TOTAL = re.compile(r"bytes \d+-\d+/(\d+)")
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+#: Response headers holding a base64 checksum of the whole body, with the algorithm of each.
+#: The ``ETag`` is deliberately not one of them: even when it looks like an MD5 checksum, it is
+#: not one for every storage (e.g. S3 objects encrypted with KMS, GCS or Azure).
+_CHECKSUM_HEADERS = {
+    "Content-MD5": "md5",
+    "x-amz-checksum-sha256": "sha256",
+    "x-amz-checksum-sha1": "sha1",
+    "x-amz-checksum-crc32": "crc32",
+}
+
+
+def get_partial_path(path: Path) -> Path:
+    """
+    Returns the path of the partial file a download to the given path is written to, until it
+    completes.
+
+    Parameters
+    ----------
+    path : Path
+        The destination of the download.
+
+    Returns
+    -------
+    Path
+        The partial file, next to ``path``.
+    """
+    return path.with_name(f"{path.name}.part")
+
+
+def get_progress_path(path: Path) -> Path:
+    """
+    Returns the path of the file that records the chunks of a download to the given path that
+    are already in its partial file.
+
+    Parameters
+    ----------
+    path : Path
+        The destination of the download.
+
+    Returns
+    -------
+    Path
+        The progress file, next to ``path``.
+    """
+    return path.with_name(f"{path.name}.part.json")
+
+
+def download_file(
+    url: str,
+    path: Path,
+    session: Optional[requests.Session] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    expected_size: Optional[int] = None,
+    expected_md5: Optional[str] = None,
+) -> Path:
+    """
+    Downloads the file at the given url.
+
+    If the server supports Range requests, the file is fetched in chunks of ``chunk_size`` bytes
+    by ``max_workers`` threads, each chunk being retried on failure. Chunks are written to a
+    partial file whose progress is recorded next to it, so that calling this function again after
+    an interruption only fetches the missing chunks. Otherwise, the file is streamed in one request.
+
+    Once complete, the size of the file and its checksum are verified before the file is moved to
+    ``path``. The checksum is the given MD5 one or, if the whole file was sent in one response, the
+    one of its ``Content-MD5`` or ``x-amz-checksum-*`` header.
+
+    The ``ETag`` of the file, or its ``Last-Modified`` date without a strong ``ETag``, is sent as
+    ``If-Range`` with every chunk, so that every chunk comes from the same version of the file.
+    A partial file is only resumed if it was written for the same version. When the server sends
+    neither, an interrupted download starts over.
+
+    Parameters
+    ----------
+    url : str
+        The url of the file.
+    path : Path
+        Where to save the file.
+    session : Optional[requests.Session], default: None
+        The session used for the requests. A new one is used if not given.
+    chunk_size : int, default: DEFAULT_CHUNK_SIZE
+        Size in bytes of each Range request.
+    max_workers : int, default: DEFAULT_MAX_WORKERS
+        Number of chunks downloaded at the same time.
+    expected_size : Optional[int], default: None
+        Expected size of the file, in bytes.
+    expected_md5 : Optional[str], default: None
+        Expected hexadecimal MD5 checksum of the file.
+
+    Returns
+    -------
+    Path
+        Same ``Path`` as provided in the parameters.
+
+    Raises
+    ------
+    DownloadVerificationError
+        If the downloaded file does not have the expected size or checksum.
+    """
+    session = session or requests.Session()
+    partial_path = get_partial_path(path)
+    progress_path = get_progress_path(path)
+
+    with session.get(url, headers={"Range": "bytes=0-0"}, stream=True) as response:
+        response.raise_for_status()
+        total_size = _get_total_size(response)
+        validator = _get_validator(response)
+        expected_checksum = ("md5", expected_md5.lower()) if expected_md5 else None
+        if response.status_code != 206 or total_size is None:
+            # The server ignored the range and is sending the whole file
+            _stream_to_file(response, partial_path)
+            total_size = None
+            expected_checksum = expected_checksum or _get_header_checksum(response)
+
+    if total_size is not None:
+        _download_chunks(
+            url,
+            session,
+            partial_path,
+            progress_path,
+            total_size,
+            validator,
+            chunk_size,
+            max_workers,
+        )
+
+    try:
+        _verify(partial_path, expected_size or total_size, expected_checksum)
+    except DownloadVerificationError:
+        partial_path.unlink()
+        progress_path.unlink(missing_ok=True)
+        raise
+
+    partial_path.replace(path)
+    progress_path.unlink(missing_ok=True)
+    return path
+
+
+def _get_total_size(response: requests.Response) -> Optional[int]:
+    content_range = _CONTENT_RANGE_TOTAL.match(
+        response.headers.get("Content-Range", "")
+    )
+    return int(content_range.group(1)) if content_range else None
+
+
+def _get_validator(response: requests.Response) -> Optional[str]:
+    etag = response.headers.get("ETag")
+    # Weak ETags can't be used in If-Range
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def _get_header_checksum(response: requests.Response) -> Optional[Tuple[str, str]]:
+    # The checksum headers of a partial response describe the range, not the whole file
+    if response.status_code != 200:
+        return None
+    for header, algorithm in _CHECKSUM_HEADERS.items():
+        value = response.headers.get(header)
+        # Composite checksums of multipart uploads ("<checksum>-<parts>") can't be verified
+        if not value or "-" in value:
+            continue
+        try:
+            return algorithm, base64.b64decode(value, validate=True).hex()
+        except binascii.Error:
+            continue
+    return None
+
+
+def _stream_to_file(response: requests.Response, partial_path: Path) -> None:
+    with partial_path.open("wb") as file:
+        for data in response.iter_content(chunk_size=_COPY_BUFFER_SIZE):
+            file.write(data)
+
+
+def _download_chunks(
+    url: str,
+    session: requests.Session,
+    partial_path: Path,
+    progress_path: Path,
+    total_size: int,
+    validator: Optional[str],
+    chunk_size: int,
+    max_workers: int,
+) -> None:
+    ranges = [
+        (start, min(start + chunk_size, total_size) - 1)
+        for start in range(0, total_size, chunk_size)
+    ]
+    done = _load_progress(
+        partial_path, progress_path, total_size, validator, chunk_size
+    )
+    if not done:
+        with partial_path.open("wb") as file:
+            file.truncate(total_size)
+
+    lock = threading.Lock()
+
+    def download_chunk(index: int) -> None:
+        start, end = ranges[index]
+        _download_range(url, session, partial_path, start, end, validator)
+        with lock:
+            done.add(index)
+            progress = {
+                "size": total_size,
+                "validator": validator,
+                "chunk_size": chunk_size,
+                "done": sorted(done),
+            }
+            progress_path.write_bytes(json.dumps(progress))
+
+    pending = [index for index in range(len(ranges)) if index not in done]
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = [executor.submit(download_chunk, index) for index in pending]
+    # Every chunk is attempted before failing, so that a later call has less to resume
+    for future in futures:
+        future.result()
+
+
+def _load_progress(
+    partial_path: Path,
+    progress_path: Path,
+    total_size: int,
+    validator: Optional[str],
+    chunk_size: int,
+) -> Set[int]:
+    # Without a validator, the partial file could hold chunks of another version of the file
+    if validator is None or not partial_path.exists() or not progress_path.exists():
+        return set()
+    try:
+        progress = json.loads(progress_path.read_bytes())
+    except json.JSONDecodeError:
+        return set()
+    if (
+        progress.get("size") != total_size
+        or progress.get("validator") != validator
+        or progress.get("chunk_size") != chunk_size
+        or partial_path.stat().st_size != total_size
+    ):
+        # The partial file belongs to another version of the remote file
+        return set()
+    return set(progress["done"])
+
+
+def _is_retryable(exception: BaseException) -> bool:
+    # Client errors, such as an expired url, won't be solved by trying again
+    if isinstance(exception, requests.HTTPError) and exception.response is not None:
+        return not 400 <= exception.response.status_code < 500
+    return isinstance(exception, IOError)
+
+
+@retry(
+    wait=wait_exponential_jitter(initial=1, max=30),
+    stop=stop_after_attempt(MAX_CHUNK_ATTEMPTS),
+    retry=retry_if_exception(_is_retryable),
+    reraise=True,
+)
+def _download_range(
+    url: str,
+    session: requests.Session,
+    partial_path: Path,
+    start: int,
+    end: int,
+    validator: Optional[str],
+) -> None:
+    headers: Dict[str, str] = {"Range": f"bytes={start}-{end}"}
+    if validator is not None:
+        headers["If-Range"] = validator
+    with session.get(url, headers=headers, stream=True) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise IOError(f"Server did not return the range {start}-{end} of {url}")
+        written = 0
+        with partial_path.open("r+b") as file:
+            file.seek(start)
+            for data in response.iter_content(chunk_size=_COPY_BUFFER_SIZE):
+                file.write(data)
+                written += len(data)
+        if written != end - start + 1:
+            raise IOError(
+                f"Received {written} bytes instead of {end - start + 1} for the range {start}-{end} of {url}"
+            )
+
+
+def _get_checksum(path: Path, algorithm: str) -> str:
+    with path.open("rb") as file:
+        chunks = iter(lambda: file.read(_COPY_BUFFER_SIZE), b"")
+        if algorithm == "crc32":
+            crc = 0
+            for data in chunks:
+                crc = zlib.crc32(data, crc)
+            return crc.to_bytes(4, "big").hex()
+        digest = hashlib.new(algorithm)
+        for data in chunks:
+            digest.update(data)
+        return digest.hexdigest()
+
+
+def _verify(
+    partial_path: Path,
+    expected_size: Optional[int],
+    expected_checksum: Optional[Tuple[str, str]],
+) -> None:
+    size = partial_path.stat().st_size
+    if expected_size is not None and size != expected_size:
+        raise DownloadVerificationError(
+            f"Downloaded file has {size} bytes instead of {expected_size}"
+        )
+    if expected_checksum is not None:
+        algorithm, expected = expected_checksum
+        checksum = _get_checksum(partial_path, algorithm)
+        if checksum != expected:
+            raise DownloadVerificationError(
+                f"Downloaded file has {algorithm.upper()} checksum {checksum} instead of {expected}"
+            )
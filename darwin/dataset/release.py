@@ -1,12 +1,14 @@
 import datetime
-import shutil
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import requests
-
 from darwin.dataset.identifier import DatasetIdentifier
+from darwin.dataset.ranged_download import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_WORKERS,
+    download_file,
+)
 
 
 class ReleaseStatus(Enum):
@@ -194,14 +196,27 @@ class Release:
             format=payload.get("format", "json"),
         )
 
-    def download_zip(self, path: Path) -> Path:
+    def download_zip(
+        self,
+        path: Path,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Path:
         """
         Downloads the release content into a zip file located by the given path.
 
+        The zip is fetched in parallel chunks when the server supports it. If a previous download
+        to the same path was interrupted, only its missing chunks are fetched. The size and
+        checksum of the zip are verified before it is moved to ``path``.
+
         Parameters
         ----------
         path : Path
             The path where the zip file will be located.
+        max_workers : int, default: DEFAULT_MAX_WORKERS
+            Number of chunks downloaded at the same time.
+        chunk_size : int, default: DEFAULT_CHUNK_SIZE
+            Size in bytes of each chunk.
 
         Returns
         --------
@@ -212,15 +227,15 @@ class Release:
         ------
         ValueError
             If this ``Release`` object does not have a specified url.
+        DownloadVerificationError
+            If the downloaded zip does not have the expected size or checksum.
         """
         if not self.url:
             raise ValueError("Release must have a valid url to download the zip.")
 
-        with requests.get(self.url, stream=True) as response:
-            with open(path, "wb") as download_file:
-                shutil.copyfileobj(response.raw, download_file)
-
-        return path
+        return download_file(
+            self.url, path, max_workers=max_workers, chunk_size=chunk_size
+        )
 
     @property
     def identifier(self) -> DatasetIdentifier:
@@ -1,4 +1,4 @@
-import os
+import re
 import shutil
 import tempfile
 import time
@@ -15,6 +15,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Union,
 )
@@ -22,8 +23,15 @@ from typing import (
 import orjson as json
 from rich.console import Console
 
-from darwin.dataset.download_manager import download_all_images_from_annotations
+from darwin.dataset.annotation_index import AnnotationIndex, get_annotation_index_path
+from darwin.dataset.download_engine import DownloadEngine
+from darwin.dataset.download_manager import (
+    VideoFrameExtraction,
+    _get_planned_image_paths,
+    download_all_images_from_annotations,
+)
 from darwin.dataset.identifier import DatasetIdentifier
+from darwin.dataset.pull_manifest import PulledItem, PullManifest, get_member_hash
 from darwin.dataset.release import Release
 from darwin.dataset.split_manager import split_dataset
 from darwin.dataset.upload_manager import (
@@ -212,6 +220,10 @@ class RemoteDataset(ABC):
         retry: bool = False,
         retry_timeout: int = 600,
         retry_interval: int = 10,
+        max_workers: Optional[int] = None,
+        max_connections_per_host: Optional[int] = None,
+        incremental: bool = False,
+        video_frame_extraction: Optional[VideoFrameExtraction] = None,
     ) -> Tuple[Optional[Callable[[], Iterator[Any]]], int]:
         """
         Downloads a remote dataset (images and annotations) to the datasets directory.
@@ -223,7 +235,7 @@ class RemoteDataset(ABC):
         blocking : bool, default: True
             If False, the dataset is not downloaded and a generator function is returned instead.
         multi_processed : bool, default: True
-            Uses multiprocessing to download the dataset in parallel. If blocking is False this has no effect.
+            Downloads the files of the dataset concurrently. If blocking is False this has no effect.
         only_annotations : bool, default: False
             Download only the annotations and no corresponding images.
         force_replace : bool, default: False
@@ -244,6 +256,24 @@ class RemoteDataset(ABC):
             Pulls all slots of items into deeper file structure ({prefix}/{item_name}/{slot_name}/{file_name})
         retry: bool
             If True, will repeatedly try to download the release if it is still processing up to a maximum of 5 minutes.
+        max_workers : Optional[int], default: None
+            Number of concurrent downloads, independent from the number of CPUs. Defaults to
+            ``DARWIN_DOWNLOAD_FILES_CONCURRENCY`` if set. If blocking is False this has no effect.
+        max_connections_per_host : Optional[int], default: None
+            Maximum number of simultaneous connections to a single host. Defaults to
+            ``max_workers``. If blocking is False this has no effect.
+        incremental : bool, default: False
+            Only touches the items added, changed or removed since the previous pull of the
+            dataset, as recorded in its pull manifest. The annotations of the other items are
+            kept, and the images folder is not walked: only the files recorded by the previous
+            pull are considered to already exist or, with ``remove_extra``, to be removed.
+            Has no effect with ``subset_filter_annotations_function``. Requires ``blocking``, as
+            the downloaded items are only recorded once their downloads are done.
+        video_frame_extraction : Optional[VideoFrameExtraction], default: None
+            How frames are extracted from the segments of long videos when pulling video frames,
+            for instance to write them as JPEG or with a faster PNG compression. Defaults to PNG
+            frames with the default compression of OpenCV. The time spent in each stage of the
+            extraction is printed after a blocking pull.
 
         Returns
         -------
@@ -260,6 +290,8 @@ class RemoteDataset(ABC):
             If darwin in unable to get ``Team`` configuration.
         ValueError
             If the release is still processing after the maximum retry duration.
+        ValueError
+            If ``incremental`` is given without ``blocking``.
         """
 
         console = self.console or Console()
@@ -269,6 +301,11 @@ class RemoteDataset(ABC):
                 f"The value of retry_timeout '{retry_timeout}' must be greater than or equal to the value of retry_interval '{retry_interval}'."
             )
 
+        if incremental and not blocking:
+            raise ValueError(
+                "Incremental pulls must be blocking, the downloaded items can't be recorded otherwise."
+            )
+
         if release is None:
             release = self.get_release(include_unavailable=retry)
 
@@ -299,74 +336,170 @@ class RemoteDataset(ABC):
         release_dir = self.local_releases_path / release.name
         release_dir.mkdir(parents=True, exist_ok=True)
 
-        with tempfile.TemporaryDirectory() as tmp_dir_str:
+        previous_manifest: Optional[PullManifest] = None
+        pull_options = {
+            "use_folders": use_folders,
+            "video_frames": video_frames,
+            "force_slots": force_slots,
+            "ignore_slots": ignore_slots,
+        }
+        if incremental and subset_filter_annotations_function is None:
+            previous_manifest = PullManifest.load(self.local_path)
+            if previous_manifest and previous_manifest.options != pull_options:
+                # The files of the items were downloaded to other paths
+                previous_manifest = None
+
+        # Download the release from Darwin. The zip is kept in the release folder until
+        # it is extracted, so that pulling again resumes an interrupted download
+        zip_file_path = release.download_zip(release_dir / ".release.zip")
+        with zipfile.ZipFile(
+            zip_file_path
+        ) as z, tempfile.TemporaryDirectory() as tmp_dir_str:
             tmp_dir = Path(tmp_dir_str)
-            # Download the release from Darwin
-            zip_file_path = release.download_zip(tmp_dir / "dataset.zip")
-            with zipfile.ZipFile(zip_file_path) as z:
-                # Extract annotations
+            # If a filtering function is provided, apply it to the extracted annotations
+            if subset_filter_annotations_function is not None:
                 z.extractall(tmp_dir)
-                # If a filtering function is provided, apply it
-                if subset_filter_annotations_function is not None:
-                    subset_filter_annotations_function(tmp_dir)
-                    if subset_folder_name is None:
-                        subset_folder_name = datetime.now().strftime(
-                            "%m/%d/%Y_%H:%M:%S"
-                        )
-                annotations_dir: Path = (
-                    release_dir / (subset_folder_name or "") / "annotations"
-                )
-                # Remove existing annotations if necessary
-                if annotations_dir.exists():
-                    try:
-                        shutil.rmtree(annotations_dir)
-                    except PermissionError:
-                        print(
-                            f"Could not remove dataset in {annotations_dir}. Permission denied."
-                        )
-                annotations_dir.mkdir(parents=True, exist_ok=False)
-                stems: dict = {}
-
+                subset_filter_annotations_function(tmp_dir)
+                if subset_folder_name is None:
+                    subset_folder_name = datetime.now().strftime("%m/%d/%Y_%H:%M:%S")
+            annotations_dir: Path = (
+                release_dir / (subset_folder_name or "") / "annotations"
+            )
+            relative_annotations_dir = str(annotations_dir.relative_to(self.local_path))
+            member_hashes = {
+                member.filename: get_member_hash(member) for member in z.infolist()
+            }
+
+            # Items whose annotations did not change since the previous pull of this release
+            # are kept as they are
+            unchanged_items: Dict[str, PulledItem] = {}
+            previous_items: Dict[str, PulledItem] = {}
+            if (
+                previous_manifest is not None
+                and previous_manifest.annotations_dir == relative_annotations_dir
+                and annotations_dir.exists()
+            ):
+                previous_items = previous_manifest.items
+                unchanged_items = {
+                    key: item
+                    for key, item in previous_items.items()
+                    if member_hashes.get(item.member) == item.hash
+                    and (annotations_dir / item.file).exists()
+                }
+            # Remove existing annotations if necessary
+            elif annotations_dir.exists():
+                try:
+                    shutil.rmtree(annotations_dir)
+                except PermissionError:
+                    print(
+                        f"Could not remove dataset in {annotations_dir}. Permission denied."
+                    )
+            annotations_dir.mkdir(parents=True, exist_ok=True)
+            taken_files: Set[str] = {item.file for item in unchanged_items.values()}
+            # Index the annotations so that local dataset operations don't parse them again
+            annotation_index_path = get_annotation_index_path(annotations_dir)
+            if annotation_index_path.exists() and not previous_items:
+                annotation_index_path.unlink()
+            annotation_index = AnnotationIndex(annotations_dir, annotation_index_path)
+            # Each annotation is parsed once here, indexed, and reused without its annotations
+            # for the class lists and the download planning below
+            annotation_files: List[AnnotationFile] = []
+            pulled_items: Dict[str, PulledItem] = dict(unchanged_items)
+
+            if subset_filter_annotations_function is not None:
                 # If properties were exported, move the metadata.json file to the annotations folder
                 if (tmp_dir / ".v7").exists():
                     metadata_file = tmp_dir / ".v7" / "metadata.json"
                     metadata_dir = annotations_dir / ".v7"
                     metadata_dir.mkdir(parents=True, exist_ok=True)
                     shutil.move(str(metadata_file), str(metadata_dir / "metadata.json"))
+                annotation_paths: Iterable[Path] = tmp_dir.glob("*.json")
+            else:
+                # Otherwise extract the annotations one at a time into the annotations folder,
+                # so that the release is never fully extracted twice on disk
+                extract_dir = annotations_dir / ".extracting"
+                annotation_paths = _extract_annotations(
+                    z,
+                    annotations_dir,
+                    extract_dir,
+                    skip_members={item.member for item in unchanged_items.values()},
+                )
 
-                # Move the annotations into the right folder and rename them to have the image
-                # original filename as contained in the json
-                for annotation_path in tmp_dir.glob("*.json"):
-                    annotation = parse_darwin_json(annotation_path, count=None)
-                    if annotation is None:
-                        continue
-
-                    if video_frames and any(
-                        not slot.frame_urls for slot in annotation.slots
-                    ):
-                        # will raise if not installed via pip install darwin-py[ocv]
-                        try:
-                            from cv2 import (  # pylint: disable=import-outside-toplevel # noqa F401
-                                VideoCapture,
-                            )
-                        except ImportError as e:
-                            raise MissingDependency(
-                                "Missing Dependency: OpenCV required for Video Extraction. Install with `pip install darwin-py\[ocv]`"
-                            ) from e
-                    filename = Path(annotation.filename).stem
-                    if filename in stems:
-                        stems[filename] += 1
-                        filename = f"{filename}_{stems[filename]}"
-                    else:
-                        stems[filename] = 1
-
-                    destination_name = (
-                        annotations_dir / f"{filename}{annotation_path.suffix}"
+            # Move the annotations into the right folder and rename them to have the image
+            # original filename as contained in the json
+            for annotation_path in annotation_paths:
+                annotation = parse_darwin_json(annotation_path, count=None)
+                if annotation is None:
+                    continue
+
+                if video_frames and any(
+                    not slot.frame_urls for slot in annotation.slots
+                ):
+                    # will raise if not installed via pip install darwin-py[ocv]
+                    try:
+                        from cv2 import (  # pylint: disable=import-outside-toplevel # noqa F401
+                            VideoCapture,
+                        )
+                    except ImportError as e:
+                        raise MissingDependency(
+                            "Missing Dependency: OpenCV required for Video Extraction. Install with `pip install darwin-py\[ocv]`"
+                        ) from e
+                item_key = annotation.item_id or annotation_path.name
+                previous_item = previous_items.get(item_key)
+                stem = Path(annotation.filename).stem
+                if (
+                    previous_item is not None
+                    and previous_item.file not in taken_files
+                    and re.fullmatch(
+                        rf"{re.escape(stem)}(_\d+)?{re.escape(annotation_path.suffix)}",
+                        previous_item.file,
                     )
-                    shutil.move(str(annotation_path), str(destination_name))
+                ):
+                    # Keep the name the annotation had in the previous pull
+                    file_name = previous_item.file
+                else:
+                    file_name = _get_unique_file_name(
+                        stem, annotation_path.suffix, taken_files
+                    )
+                taken_files.add(file_name)
+
+                destination_name = annotations_dir / file_name
+                shutil.move(str(annotation_path), str(destination_name))
+                annotation.path = destination_name
+                annotation_index.add(annotation)
+                annotation_files.append(_without_annotations(annotation))
+                pulled_items[item_key] = PulledItem(
+                    member=annotation_path.name,
+                    hash=member_hashes.get(annotation_path.name, ""),
+                    file=file_name,
+                    images=self._get_relative_image_paths(annotation, use_folders),
+                )
+
+            if subset_filter_annotations_function is None:
+                shutil.rmtree(extract_dir, ignore_errors=True)
+        zip_file_path.unlink()
+
+        # Remove the annotations of the items that changed name or are no longer in the release
+        for item in previous_items.values():
+            if item.file not in taken_files:
+                (annotations_dir / item.file).unlink(missing_ok=True)
+
+        manifest = PullManifest(
+            annotations_dir=relative_annotations_dir,
+            options=pull_options,
+            items=pulled_items,
+        )
+        manifest.save(self.local_path)
+
+        # The annotations were indexed as they were moved, this drops the removed ones
+        annotation_index.update()
+        annotation_index.close()
 
         # Extract the list of classes and create the text files
-        make_class_lists(release_dir)
+        if annotations_dir == release_dir / "annotations" and not unchanged_items:
+            make_class_lists(release_dir, annotation_files=annotation_files)
+        else:
+            make_class_lists(release_dir)
 
         if release.latest and is_unix_like_os():
             try:
@@ -385,6 +518,25 @@ class RemoteDataset(ABC):
             # No images will be downloaded
             return None, 0
 
+        if video_frames and video_frame_extraction is None:
+            video_frame_extraction = VideoFrameExtraction()
+
+        existing_images: Optional[Set[Path]] = None
+        if previous_manifest is not None:
+            # Only the files of the items that changed or were removed are considered, the
+            # others are neither downloaded nor removed
+            existing_images = {
+                self.local_images_path / image
+                for key, item in previous_manifest.items.items()
+                if item.downloaded and key not in unchanged_items
+                for image in item.images
+            }
+            for key, item in unchanged_items.items():
+                if not item.downloaded:
+                    annotation = parse_darwin_json(annotations_dir / item.file)
+                    if annotation is not None:
+                        annotation_files.append(_without_annotations(annotation))
+
         # Create the generator with the download instructions
         progress, count = download_all_images_from_annotations(
             client=self.client,
@@ -396,40 +548,69 @@ class RemoteDataset(ABC):
             video_frames=video_frames,
             force_slots=force_slots,
             ignore_slots=ignore_slots,
+            annotation_files=annotation_files,
+            existing_images=existing_images,
+            video_frame_extraction=video_frame_extraction,
         )
         if count == 0:
+            self._mark_downloaded(manifest, annotation_files)
             return None, count
 
         # If blocking is selected, download the dataset on the file system
         if blocking:
-            max_workers = None
-            env_max_workers = os.getenv("DARWIN_DOWNLOAD_FILES_CONCURRENCY")
-            if env_max_workers and int(env_max_workers) > 0:
-                max_workers = int(env_max_workers)
-
             console.print(
                 f"Going to download {str(count)} files to {self.local_images_path.as_posix()} ."
             )
-            successes, errors = exhaust_generator(
-                progress=progress(),
-                count=count,
-                multi_processed=multi_processed,
-                worker_count=max_workers,
-            )
+            if multi_processed:
+                download_engine = DownloadEngine(
+                    self.client,
+                    max_workers=max_workers,
+                    max_connections_per_host=max_connections_per_host,
+                )
+                successes, errors = download_engine.run(progress(), count)
+                console.print(f"Downloaded {download_engine.stats}")
+            else:
+                successes, errors = exhaust_generator(
+                    progress=progress(), count=count, multi_processed=False
+                )
             if errors:
                 self.console.print(
                     f"Encountered errors downloading {len(errors)} files"
                 )
             for error in errors:
                 self.console.print(f"\t - {error}")
-
-            downloaded_file_count = len(
-                [
-                    f
-                    for f in self.local_images_path.rglob("*")
-                    if f.is_file() and not f.name.startswith(".")
-                ]
+            if video_frame_extraction is not None and any(
+                video_frame_extraction.stage_seconds.values()
+            ):
+                console.print(f"Video frame extraction: {video_frame_extraction}")
+
+            # Downloads write the local path of each file back to its annotation, which the
+            # index would otherwise see as a changed file
+            annotation_index = AnnotationIndex(annotations_dir, annotation_index_path)
+            annotation_index.refresh_stats(
+                annotation.path for annotation in annotation_files
             )
+            annotation_index.close()
+
+            if errors:
+                self._mark_downloaded(manifest, annotation_files, check_exists=True)
+            else:
+                self._mark_downloaded(manifest, annotation_files)
+
+            if incremental:
+                downloaded_file_count = sum(
+                    len(item.images)
+                    for item in manifest.items.values()
+                    if item.downloaded
+                )
+            else:
+                downloaded_file_count = len(
+                    [
+                        f
+                        for f in self.local_images_path.rglob("*")
+                        if f.is_file() and not f.name.startswith(".")
+                    ]
+                )
 
             console.print(
                 f"Total file count after download completed {str(downloaded_file_count)}."
@@ -439,6 +620,36 @@ class RemoteDataset(ABC):
         else:
             return progress, count
 
+    def _get_relative_image_paths(
+        self, annotation: AnnotationFile, use_folders: bool
+    ) -> List[str]:
+        try:
+            image_paths = _get_planned_image_paths(
+                annotation, self.local_images_path, use_folders
+            )
+        except ValueError:
+            return []
+        return [str(path.relative_to(self.local_images_path)) for path in image_paths]
+
+    def _mark_downloaded(
+        self,
+        manifest: PullManifest,
+        annotation_files: List[AnnotationFile],
+        check_exists: bool = False,
+    ) -> None:
+        keys_by_file = {item.file: key for key, item in manifest.items.items()}
+        for annotation in annotation_files:
+            item = manifest.items.get(keys_by_file.get(annotation.path.name, ""))
+            if item is None:
+                continue
+            item.downloaded = bool(item.images) and (
+                not check_exists
+                or all(
+                    (self.local_images_path / image).exists() for image in item.images
+                )
+            )
+        manifest.save(self.local_path)
+
     def remove_remote(self) -> None:
         """Archives (soft-deletion) this ``RemoteDataset``."""
         self.client.archive_remote_dataset(self.dataset_id, self.team)
@@ -1013,3 +1224,59 @@ class RemoteDataset(ABC):
         self, annotation_file: AnnotationFile, team_name: str
     ) -> Dict[str, Any]:
         return build_image_annotation(annotation_file, team_name)
+
+
+def _extract_annotations(
+    zip_file: zipfile.ZipFile,
+    annotations_dir: Path,
+    extract_dir: Path,
+    skip_members: Optional[Set[str]] = None,
+) -> Iterator[Path]:
+    """
+    Extracts the annotations of a release zip one at a time, yielding the path of each one.
+
+    The properties metadata file is extracted straight to its place in ``annotations_dir``, and
+    each annotation to ``extract_dir``, which must be on the same file system as
+    ``annotations_dir`` so that moving the annotations there afterwards is a rename. Annotations
+    named in ``skip_members`` are not extracted.
+    """
+    extract_dir.mkdir(parents=True, exist_ok=True)
+    for member in zip_file.infolist():
+        if skip_members and member.filename in skip_members:
+            continue
+        if member.filename == ".v7/metadata.json":
+            metadata_dir = annotations_dir / ".v7"
+            metadata_dir.mkdir(parents=True, exist_ok=True)
+            destination = metadata_dir / "metadata.json"
+        elif "/" not in member.filename and member.filename.endswith(".json"):
+            destination = extract_dir / member.filename
+        else:
+            continue
+
+        with zip_file.open(member) as source, destination.open("wb") as target:
+            shutil.copyfileobj(source, target)
+        if destination.parent == extract_dir:
+            yield destination
+
+
+def _get_unique_file_name(stem: str, suffix: str, taken_files: Set[str]) -> str:
+    """
+    Returns ``{stem}{suffix}``, or ``{stem}_{n}{suffix}`` with the lowest ``n`` from 2 that is not
+    in ``taken_files``.
+    """
+    file_name = f"{stem}{suffix}"
+    index = 1
+    while file_name in taken_files:
+        index += 1
+        file_name = f"{stem}_{index}{suffix}"
+    return file_name
+
+
+def _without_annotations(annotation_file: AnnotationFile) -> AnnotationFile:
+    """
+    Drops the annotations and item properties of a parsed file, keeping its item, slots and
+    classes, so that the files of a whole release can be held in memory while it is downloaded.
+    """
+    annotation_file.annotations = []
+    annotation_file.item_properties = None
+    return annotation_file
@@ -30,7 +30,6 @@ from darwin.dataset.utils import (
     chunk_items,
     get_external_file_name,
     get_external_file_type,
-    is_relative_to,
     parse_external_file_path,
 )
 from darwin.datatypes import (
@@ -969,18 +968,23 @@ def _find_files_to_upload_as_single_file_items(
     ):
         raise ValueError("Cannot specify a path when uploading a LocalFile object.")
 
+    # Position of each search path, to find the first one containing a file among its ancestors
+    # instead of comparing every file with every search path
+    search_file_positions: Dict[Path, int] = {}
+    for position, source_file in enumerate(search_files):
+        search_file_positions.setdefault(Path(source_file), position)
+
     for found_file in find_files(search_files, files_to_exclude=files_to_exclude):
         local_path = path
         if preserve_folders:
-            source_files = [
-                source_file
-                for source_file in search_files
-                if is_relative_to(found_file, source_file)
+            source_file_positions = [
+                search_file_positions[ancestor]
+                for ancestor in (found_file, *found_file.parents)
+                if ancestor in search_file_positions
             ]
-            if source_files:
-                local_path = str(
-                    found_file.relative_to(source_files[0]).parent.as_posix()
-                )
+            if source_file_positions:
+                source_file = search_files[min(source_file_positions)]
+                local_path = str(found_file.relative_to(source_file).parent.as_posix())
                 if local_path == ".":
                     local_path = "/"
         uploading_files.append(
@@ -5,7 +5,11 @@ from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import numpy as np
 
-from darwin.dataset.utils import extract_classes, get_release_path
+from darwin.dataset.utils import (
+    extract_classes_by_type,
+    get_release_path,
+    merge_classes,
+)
 from darwin.datatypes import PathLike
 from darwin.utils import get_annotation_files_from_dir
 
@@ -228,13 +232,19 @@ def _stratified_split(
     if len(stratified_types) == 0:
         return
 
+    # Bounding boxes are also stratified by the polygons, so these are always extracted
+    classes_per_type = extract_classes_by_type(
+        annotation_path, list(set(stratified_types) | {"polygon"})
+    )
     for stratified_type in stratified_types:
         if stratified_type == "bounding_box":
             class_annotation_types = [stratified_type, "polygon"]
         else:
-            class_annotation_types = stratified_type
+            class_annotation_types = [stratified_type]
 
-        _, idx_to_classes = extract_classes(annotation_path, class_annotation_types)
+        _, idx_to_classes = merge_classes(
+            [classes_per_type[atype] for atype in class_annotation_types]
+        )
         if len(idx_to_classes) == 0:
             continue
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 import concurrent.futures
 import os
+import threading
 import time
+from contextlib import nullcontext
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path, PurePosixPath
@@ -12,6 +14,7 @@ from typing import (
     Any,
     BinaryIO,
     Callable,
+    ContextManager,
     Iterator,
     List,
     Optional,
@@ -19,6 +22,7 @@ from typing import (
     Tuple,
     Dict,
 )
+
 import requests
 
 from darwin.datatypes import PathLike, Slot, SourceFile
@@ -34,6 +38,11 @@ if TYPE_CHECKING:
 
 from abc import ABC, abstractmethod
 
+#: Status codes of transient storage failures, after which a file is sent again
+RETRYABLE_UPLOAD_STATUS_CODES: Set[int] = {429, 502, 503, 504}
+#: Number of times a file is sent to the storage before its upload fails
+UPLOAD_ATTEMPTS: int = 5
+
 
 class ItemMergeMode(Enum):
     SLOTS = "slots"
@@ -373,6 +382,16 @@ class FileMonitor(object):
 ByteReadCallback = Callable[[Optional[str], float, float], None]
 ProgressCallback = Callable[[int, float], None]
 FileUploadCallback = Callable[[str, int, int], None]
+StageLimits = Dict[UploadStage, threading.Semaphore]
+
+#: Number of ``register_upload`` requests sent at the same time.
+DEFAULT_REGISTER_WORKERS = 4
+
+#: Number of upload signatures requested at the same time by ``UploadHandler.upload``.
+DEFAULT_SIGN_WORKERS = 8
+
+#: Number of upload confirmations sent at the same time by ``UploadHandler.upload``.
+DEFAULT_CONFIRM_WORKERS = 8
 
 
 class UploadHandler(ABC):
@@ -475,7 +494,32 @@ class UploadHandler(ABC):
         progress_callback: Optional[ProgressCallback] = None,
         file_upload_callback: Optional[FileUploadCallback] = None,
         max_workers: Optional[int] = None,
+        sign_workers: int = DEFAULT_SIGN_WORKERS,
+        confirm_workers: int = DEFAULT_CONFIRM_WORKERS,
     ) -> None:
+        """
+        Uploads the pending files.
+
+        When multi-threaded, the uploads are pipelined: every stage of an upload has its own
+        concurrency limit, so files are signed and confirmed while others are sent to storage,
+        and the storage uploads are never waiting on API round trips.
+
+        Parameters
+        ----------
+        multi_threaded : bool, default: True
+            Whether to upload several files at the same time.
+        progress_callback : Optional[ProgressCallback], default: None
+            Called with the number of pending files and ``1`` each time a file was sent.
+        file_upload_callback : Optional[FileUploadCallback], default: None
+            Called with the name, size and number of bytes sent of a file as it is sent.
+        max_workers : Optional[int], default: None
+            Number of files sent to storage at the same time. Defaults to the default number
+            of workers of a ``ThreadPoolExecutor``.
+        sign_workers : int, default: DEFAULT_SIGN_WORKERS
+            Number of upload signatures requested at the same time.
+        confirm_workers : int, default: DEFAULT_CONFIRM_WORKERS
+            Number of upload confirmations sent at the same time.
+        """
         if not self._progress:
             self.prepare_upload()
 
@@ -506,11 +550,23 @@ class UploadHandler(ABC):
                 )
 
         if multi_threaded and self.progress:
+            upload_workers = (
+                max_workers or concurrent.futures.ThreadPoolExecutor()._max_workers
+            )
+            stage_limits: StageLimits = {
+                UploadStage.REQUEST_SIGNATURE: threading.Semaphore(sign_workers),
+                UploadStage.UPLOAD_TO_S3: threading.Semaphore(upload_workers),
+                UploadStage.CONFIRM_UPLOAD_COMPLETE: threading.Semaphore(
+                    confirm_workers
+                ),
+            }
+            # Enough threads for every stage to run at its limit, with the files waiting for
+            # a stage holding a thread while they wait
             with concurrent.futures.ThreadPoolExecutor(
-                max_workers=max_workers
+                max_workers=upload_workers + sign_workers + confirm_workers
             ) as executor:
                 future_to_progress = {
-                    executor.submit(f, callback) for f in self.progress
+                    executor.submit(f, callback, stage_limits) for f in self.progress
                 }
                 for future in concurrent.futures.as_completed(future_to_progress):
                     try:
@@ -578,11 +634,11 @@ class UploadHandlerV2(UploadHandler):
                     for file_chunk in chunk(self.multi_file_items, chunk_size)
                 ]
             )
-            local_files_for_multi_file_items = [
+            local_files_for_multi_file_items = {
                 file
                 for multi_file_item in self.multi_file_items
                 for file in multi_file_item.files
-            ]
+            }
             single_file_items = [
                 file
                 for file in single_file_items
@@ -601,22 +657,29 @@ class UploadHandlerV2(UploadHandler):
 
         dataset_slug: str = self.dataset_identifier.dataset_slug
         team_slug: Optional[str] = self.dataset_identifier.team_slug
-        for upload_payload in upload_payloads:
-            data: Dict[str, Any] = self.client.api_v2.register_data(
+
+        def register_data(upload_payload: Dict[str, Any]) -> Dict[str, Any]:
+            return self.client.api_v2.register_data(
                 dataset_slug, upload_payload, team_slug=team_slug
             )
-            blocked_items.extend(
-                [ItemPayload.parse_v2(item) for item in data["blocked_items"]]
-            )
-            items.extend([ItemPayload.parse_v2(item) for item in data["items"]])
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=DEFAULT_REGISTER_WORKERS
+        ) as executor:
+            # Results come back in the order of the payloads, keeping the items in order
+            for data in executor.map(register_data, upload_payloads):
+                blocked_items.extend(
+                    [ItemPayload.parse_v2(item) for item in data["blocked_items"]]
+                )
+                items.extend([ItemPayload.parse_v2(item) for item in data["items"]])
         return blocked_items, items
 
     def _upload_files(self) -> Iterator[Callable[[Optional[ByteReadCallback]], None]]:
         def upload_function(
             dataset_slug, local_path, upload_id
         ) -> Callable[[Optional[ByteReadCallback]], None]:
-            return lambda byte_read_callback=None: self._upload_file(
-                dataset_slug, local_path, upload_id, byte_read_callback
+            return lambda byte_read_callback=None, stage_limits=None: self._upload_file(
+                dataset_slug, local_path, upload_id, byte_read_callback, stage_limits
             )
 
         file_lookup = {file.full_path: file for file in self.local_files}
@@ -641,9 +704,12 @@ class UploadHandlerV2(UploadHandler):
         file_path: Path,
         upload_id: str,
         byte_read_callback: Optional[ByteReadCallback],
+        stage_limits: Optional[StageLimits] = None,
     ) -> None:
         try:
-            self._do_upload_file(dataset_slug, file_path, upload_id, byte_read_callback)
+            self._do_upload_file(
+                dataset_slug, file_path, upload_id, byte_read_callback, stage_limits
+            )
         except UploadRequestError as e:
             self.errors.append(e)
         except Exception as e:
@@ -659,13 +725,20 @@ class UploadHandlerV2(UploadHandler):
         file_path: Path,
         upload_id: str,
         byte_read_callback: Optional[ByteReadCallback] = None,
+        stage_limits: Optional[StageLimits] = None,
     ) -> None:
         team_slug: Optional[str] = self.dataset_identifier.team_slug
 
+        def limit(stage: UploadStage) -> ContextManager:
+            if stage_limits is None:
+                return nullcontext()
+            return stage_limits[stage]
+
         try:
-            sign_response: Dict[str, Any] = self.client.api_v2.sign_upload(
-                dataset_slug, upload_id, team_slug=team_slug
-            )
+            with limit(UploadStage.REQUEST_SIGNATURE):
+                sign_response: Dict[str, Any] = self.client.api_v2.sign_upload(
+                    dataset_slug, upload_id, team_slug=team_slug
+                )
         except Exception as e:
             raise UploadRequestError(
                 file_path=file_path, stage=UploadStage.REQUEST_SIGNATURE, error=e
@@ -674,42 +747,68 @@ class UploadHandlerV2(UploadHandler):
         upload_url = sign_response["upload_url"]
 
         try:
-            file_size = file_path.stat().st_size
-            if byte_read_callback:
-                byte_read_callback(str(file_path), file_size, 0)
-
-            def callback(monitor):
-                if byte_read_callback:
-                    byte_read_callback(str(file_path), file_size, monitor.bytes_read)
-
-            with file_path.open("rb") as m:
-                monitor = FileMonitor(m, file_size, callback)
-
-                retries = 0
-                while retries < 5:
-                    upload_response = requests.put(f"{upload_url}", data=monitor)
-                    # If s3 is getting to many request it will return 503, we will sleep and retry
-                    if upload_response.status_code != 503:
-                        break
-
-                    time.sleep(2**retries)
-                    retries += 1
-
-            upload_response.raise_for_status()
+            with limit(UploadStage.UPLOAD_TO_S3):
+                self._put_file(file_path, upload_url, byte_read_callback)
         except Exception as e:
             raise UploadRequestError(
                 file_path=file_path, stage=UploadStage.UPLOAD_TO_S3, error=e
             )
 
         try:
-            self.client.api_v2.confirm_upload(
-                dataset_slug, upload_id, team_slug=team_slug
-            )
+            with limit(UploadStage.CONFIRM_UPLOAD_COMPLETE):
+                self.client.api_v2.confirm_upload(
+                    dataset_slug, upload_id, team_slug=team_slug
+                )
         except Exception as e:
             raise UploadRequestError(
                 file_path=file_path, stage=UploadStage.CONFIRM_UPLOAD_COMPLETE, error=e
             )
 
+    def _put_file(
+        self,
+        file_path: Path,
+        upload_url: str,
+        byte_read_callback: Optional[ByteReadCallback] = None,
+    ) -> None:
+        file_size = file_path.stat().st_size
+        if byte_read_callback:
+            byte_read_callback(str(file_path), file_size, 0)
+
+        def callback(monitor):
+            if byte_read_callback:
+                byte_read_callback(str(file_path), file_size, monitor.bytes_read)
+
+        with file_path.open("rb") as m:
+            monitor = FileMonitor(m, file_size, callback)
+
+            retries = 0
+            while True:
+                last_attempt = retries == UPLOAD_ATTEMPTS - 1
+                try:
+                    # Sent through the client's session to reuse connections to the storage
+                    upload_response = self.client.session.put(
+                        f"{upload_url}", data=monitor
+                    )
+                except (requests.ConnectionError, requests.Timeout):
+                    if last_attempt:
+                        raise
+                else:
+                    # The upload url is a single presigned PUT, which can't be resumed, so
+                    # transient failures (such as s3 answering 503 when it gets too many
+                    # requests) send the whole file again after a backoff
+                    if (
+                        upload_response.status_code not in RETRYABLE_UPLOAD_STATUS_CODES
+                        or last_attempt
+                    ):
+                        break
+
+                time.sleep(2**retries)
+                retries += 1
+                m.seek(0)
+                monitor.bytes_read = 0
+
+        upload_response.raise_for_status()
+
 
 DEFAULT_UPLOAD_CHUNK_SIZE: int = 500
 
@@ -2,7 +2,18 @@ import itertools
 import multiprocessing as mp
 from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Any, Dict, Generator, Iterator, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 from PIL import Image as PILImage
@@ -12,6 +23,7 @@ from rich.progress import ProgressBar, track
 
 import darwin.datatypes as dt
 
+from darwin.dataset.annotation_index import AnnotationIndex
 from darwin.datatypes import PathLike
 from darwin.exceptions import NotFound
 from darwin.importer.formats.darwin import parse_path
@@ -30,6 +42,10 @@ from darwin.utils.utils import stream_darwin_json
 # E.g.: {"partition" => {"class_name" => 123}}
 AnnotationDistribution = Dict[str, Counter]
 
+#: Total size of the annotation files from which ``extract_classes_by_type`` parses them across
+#: processes. Below it, starting the processes takes longer than parsing the files.
+MULTI_PROCESSED_MIN_BYTES = 32 * 1024 * 1024
+
 
 def get_release_path(dataset_path: Path, release_name: Optional[str] = None) -> Path:
     """
@@ -97,29 +113,148 @@ def extract_classes(
     for atype in annotation_types_to_load:
         assert atype in ["bounding_box", "polygon", "tag"]
 
-    classes: Dict[str, Set[int]] = defaultdict(set)
-    indices_to_classes: Dict[int, Set[str]] = defaultdict(set)
+    annotation_index = AnnotationIndex.load(annotations_path)
+    if annotation_index is not None:
+        try:
+            return annotation_index.extract_classes(annotation_types_to_load)
+        finally:
+            annotation_index.close()
 
-    for i, file_name in enumerate(get_annotation_files_from_dir(annotations_path)):
-        annotation_file = parse_path(Path(file_name))
-        if not annotation_file:
-            continue
+    classes_per_type = extract_classes_by_type(
+        annotations_path, annotation_types_to_load, multi_processed=False
+    )
+    return merge_classes(
+        [classes_per_type[atype] for atype in annotation_types_to_load]
+    )
 
-        for annotation in annotation_file.annotations:
-            if (
-                annotation.annotation_class.annotation_type
-                not in annotation_types_to_load
-            ):
-                continue
 
-            class_name = annotation.annotation_class.name
+def _get_file_classes(file_name: str) -> List[Tuple[str, str]]:
+    """Support function for ``pool.imap()`` in ``extract_classes_by_type()``."""
+    annotation_file = parse_path(Path(file_name))
+    if not annotation_file:
+        return []
+    return [
+        (annotation.annotation_class.annotation_type, annotation.annotation_class.name)
+        for annotation in annotation_file.annotations
+    ]
+
+
+def extract_classes_by_type(
+    annotations_path: Path,
+    annotation_types: List[str],
+    multi_processed: bool = True,
+    worker_count: Optional[int] = None,
+) -> Dict[str, Tuple[Dict[str, Set[int]], Dict[int, Set[str]]]]:
+    """
+    Extracts the classes of several annotation types, parsing each json file only once.
+
+    Parameters
+    ----------
+    annotations_path : Path
+        Path to the json files with the GT information of each image.
+    annotation_types : List[str]
+        Types of annotation to extract the classes of.
+    multi_processed : bool, default: True
+        Parses the files in parallel across processes, if they add up to at least
+        ``MULTI_PROCESSED_MIN_BYTES``.
+    worker_count : Optional[int], default: None
+        Number of processes to use. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    Dict[str, Tuple[Dict[str, Set[int]], Dict[int, Set[str]]]]
+        For each annotation type, the same mappings returned by ``extract_classes`` for that
+        type alone.
+    """
+    for atype in annotation_types:
+        assert atype in ["bounding_box", "polygon", "tag"]
+
+    annotation_index = AnnotationIndex.load(annotations_path)
+    if annotation_index is not None:
+        try:
+            return annotation_index.extract_classes_by_type(annotation_types)
+        finally:
+            annotation_index.close()
+
+    classes_per_type: Dict[str, Tuple[Dict[str, Set[int]], Dict[int, Set[str]]]] = {
+        atype: (defaultdict(set), defaultdict(set)) for atype in annotation_types
+    }
+    file_names = list(get_annotation_files_from_dir(annotations_path))
+
+    if worker_count is None:
+        worker_count = mp.cpu_count()
+
+    if (
+        multi_processed
+        and worker_count > 1
+        and len(file_names) > 1
+        and _total_size(file_names) >= MULTI_PROCESSED_MIN_BYTES
+    ):
+        chunksize = max(1, len(file_names) // (worker_count * 4))
+        with mp.Pool(worker_count) as pool:
+            _add_file_classes(
+                classes_per_type,
+                pool.imap(_get_file_classes, file_names, chunksize=chunksize),
+            )
+    else:
+        _add_file_classes(classes_per_type, map(_get_file_classes, file_names))
+
+    return classes_per_type
+
+
+def _total_size(file_names: List[str]) -> int:
+    return sum(Path(file_name).stat().st_size for file_name in file_names)
+
+
+def _add_file_classes(
+    classes_per_type: Dict[str, Tuple[Dict[str, Set[int]], Dict[int, Set[str]]]],
+    file_classes: Iterator[List[Tuple[str, str]]],
+) -> None:
+    for i, annotation_classes in enumerate(file_classes):
+        for atype, class_name in annotation_classes:
+            if atype not in classes_per_type:
+                continue
+            classes, indices_to_classes = classes_per_type[atype]
             indices_to_classes[i].add(class_name)
             classes[class_name].add(i)
 
+
+def merge_classes(
+    classes_to_merge: List[Tuple[Dict[str, Set[int]], Dict[int, Set[str]]]],
+) -> Tuple[Dict[str, Set[int]], Dict[int, Set[str]]]:
+    """
+    Merges the class mappings of several annotation types, as returned by
+    ``extract_classes_by_type``, into the mappings of all of them together.
+
+    Parameters
+    ----------
+    classes_to_merge : List[Tuple[Dict[str, Set[int]], Dict[int, Set[str]]]]
+        The class mappings to merge.
+
+    Returns
+    -------
+    Tuple[Dict[str, Set[int]], Dict[int, Set[str]]]
+        The merged mappings, in the format returned by ``extract_classes``.
+    """
+    classes: Dict[str, Set[int]] = defaultdict(set)
+    unsorted_indices_to_classes: Dict[int, Set[str]] = defaultdict(set)
+    for type_classes, type_indices_to_classes in classes_to_merge:
+        for class_name, indices in type_classes.items():
+            classes[class_name].update(indices)
+        for i, class_names in type_indices_to_classes.items():
+            unsorted_indices_to_classes[i].update(class_names)
+
+    # Keep the images in file order, as if all types had been extracted together
+    indices_to_classes: Dict[int, Set[str]] = defaultdict(set)
+    for i in sorted(unsorted_indices_to_classes):
+        indices_to_classes[i] = unsorted_indices_to_classes[i]
     return classes, indices_to_classes
 
 
-def make_class_lists(release_path: Path) -> None:
+def make_class_lists(
+    release_path: Path,
+    annotation_files: Optional[Iterable[dt.AnnotationFile]] = None,
+) -> None:
     """
     Support function to extract classes and save the output to file.
 
@@ -127,6 +262,9 @@ def make_class_lists(release_path: Path) -> None:
     ----------
     release_path : Path
         Path to the location of the dataset on the file system.
+    annotation_files : Optional[Iterable[dt.AnnotationFile]], default: None
+        Already parsed annotation files of the release. If given, the classes are taken from
+        them instead of parsing the files in the ``annotations`` folder again.
     """
     assert release_path is not None
     if isinstance(release_path, str):
@@ -137,10 +275,29 @@ def make_class_lists(release_path: Path) -> None:
     lists_path = release_path / "lists"
     lists_path.mkdir(exist_ok=True)
 
-    for annotation_type in ["tag", "polygon", "bounding_box"]:
+    annotation_types = ["tag", "polygon", "bounding_box"]
+    classes_per_type: Dict[str, Set[str]]
+    if annotation_files is not None:
+        classes_per_type = {
+            annotation_type: set() for annotation_type in annotation_types
+        }
+        for annotation_file in annotation_files:
+            for annotation_class in annotation_file.annotation_classes:
+                if annotation_class.annotation_type in classes_per_type:
+                    classes_per_type[annotation_class.annotation_type].add(
+                        annotation_class.name
+                    )
+    else:
+        classes_per_type = {
+            annotation_type: set(classes)
+            for annotation_type, (classes, _) in extract_classes_by_type(
+                annotations_path, annotation_types
+            ).items()
+        }
+
+    for annotation_type in annotation_types:
         fname = lists_path / f"classes_{annotation_type}.txt"
-        classes, _ = extract_classes(annotations_path, annotation_type=annotation_type)
-        classes_names = list(classes.keys())
+        classes_names = list(classes_per_type[annotation_type])
         if len(classes_names) > 0:
             classes_names.sort()
             with open(str(fname), "w") as f:
@@ -739,6 +896,13 @@ def compute_max_density(annotations_dir: Path) -> int:
     int
         The maximum density.
     """
+    annotation_index = AnnotationIndex.load(annotations_dir)
+    if annotation_index is not None:
+        try:
+            return annotation_index.max_density()
+        finally:
+            annotation_index.close()
+
     max_density = 0
     for annotation_path in get_annotation_files_from_dir(annotations_dir):
         annotation_density = 0
@@ -789,6 +953,7 @@ def compute_distributions(
     instance_distribution: AnnotationDistribution = {
         partition: Counter() for partition in partitions
     }
+    annotation_index = AnnotationIndex.load(annotations_dir)
 
     for partition in partitions:
         for annotation_type in annotation_types:
@@ -805,19 +970,25 @@ def compute_distributions(
                 if not annotation_filepath.endswith(".json"):
                     annotation_filepath = f"{annotation_filepath}.json"
                 annotation_path: Path = annotations_dir / annotation_filepath
-                annotation_file: Optional[dt.AnnotationFile] = parse_path(
-                    annotation_path
-                )
-                if annotation_file is None:
-                    continue
-
-                annotation_class_names: List[str] = [
-                    annotation.annotation_class.name
-                    for annotation in annotation_file.annotations
-                ]
-
-                class_distribution[partition] += Counter(set(annotation_class_names))
-                instance_distribution[partition] += Counter(annotation_class_names)
+                class_counts: Optional[Counter] = None
+                if annotation_index is not None:
+                    class_counts = annotation_index.class_counts(annotation_path)
+                if class_counts is None:
+                    annotation_file: Optional[dt.AnnotationFile] = parse_path(
+                        annotation_path
+                    )
+                    if annotation_file is None:
+                        continue
+                    class_counts = Counter(
+                        annotation.annotation_class.name
+                        for annotation in annotation_file.annotations
+                    )
+
+                class_distribution[partition] += Counter(set(class_counts))
+                instance_distribution[partition] += class_counts
+
+    if annotation_index is not None:
+        annotation_index.close()
 
     return {"class": class_distribution, "instance": instance_distribution}
 
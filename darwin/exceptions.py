@@ -254,6 +254,12 @@ class RequestEntitySizeExceeded(Exception):
     """
 
 
+class DownloadVerificationError(Exception):
+    """
+    Used when a downloaded file does not have the expected size or checksum.
+    """
+
+
 class MissingSchema(Exception):
     """
     Used to indicate a problem loading or finding the schema
@@ -1,7 +1,19 @@
+import shutil
+import tempfile
 from datetime import date
 from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 from zlib import crc32
 
 import numpy as np
@@ -19,11 +31,16 @@ instead of calling this low-level function directly.
 
 """
 
+_JSON_OPTIONS = json.OPT_INDENT_2 | json.OPT_SERIALIZE_NUMPY
+
 
 def export(annotation_files: Iterator[dt.AnnotationFile], output_dir: Path) -> None:
     """
     Exports the given ``AnnotationFile``\\s into the coco format inside of the given ``output_dir``.
 
+    The ``AnnotationFile``\\s are consumed one at a time, so that memory use is bounded by the
+    largest of them rather than by the whole export.
+
     Parameters
     ----------
     annotation_files : Iterator[dt.AnnotationFile]
@@ -31,13 +48,106 @@ def export(annotation_files: Iterator[dt.AnnotationFile], output_dir: Path) -> N
     output_dir : Path
         The folder where the new coco file will be.
     """
-    output = _build_json(list(annotation_files))
     output_file_path = (output_dir / "output").with_suffix(".json")
-    with open(output_file_path, "w") as f:
-        op = json.dumps(
-            output, option=json.OPT_INDENT_2 | json.OPT_SERIALIZE_NUMPY
-        ).decode("utf-8")
-        f.write(op)
+    with open(output_file_path, "wb") as f:
+        _write_json(annotation_files, f)
+
+
+def _write_json(
+    annotation_files: Iterable[dt.AnnotationFile], output: BinaryIO
+) -> None:
+    """
+    Writes the same document as ``_build_json`` would, with the same layout as
+    ``json.dumps(..., option=json.OPT_INDENT_2)``, without holding the annotation files in memory.
+
+    Images and annotations are written to temporary files as the annotation files are read, while
+    the categories are collected, then everything is copied to ``output`` in order.
+    """
+    categories: Dict[str, int] = {}
+    tag_categories: Dict[str, int] = {}
+    # Seq, offset and length of each image in the images file, to sort them by seq at the end
+    image_index: List[Tuple[Optional[int], int, int]] = []
+    annotation_id = 0
+    annotation_count = 0
+
+    with tempfile.TemporaryFile() as images, tempfile.TemporaryFile() as annotations:
+        for annotation_file in annotation_files:
+            _update_categories(annotation_file, categories, tag_categories)
+
+            image = _dump_array_element(_build_image(annotation_file, tag_categories))
+            image_index.append((annotation_file.seq, images.tell(), len(image)))
+            images.write(image)
+
+            for annotation in annotation_file.annotations:
+                annotation_id += 1
+                annotation_data = _build_annotation(
+                    annotation_file,
+                    annotation_id,
+                    cast(dt.Annotation, annotation),
+                    categories,
+                )
+                if annotation_data:
+                    annotations.write(b",\n" if annotation_count else b"\n")
+                    annotations.write(_dump_array_element(annotation_data))
+                    annotation_count += 1
+
+        output.write(b"{\n")
+        _write_value(output, "info", _build_info())
+        output.write(b",\n")
+        _write_value(output, "licenses", _build_licenses())
+        output.write(b",\n")
+
+        output.write(b'  "images": [')
+        image_index.sort(key=itemgetter(0))
+        for position, (_, offset, length) in enumerate(image_index):
+            output.write(b",\n" if position else b"\n")
+            images.seek(offset)
+            output.write(images.read(length))
+        output.write(b"\n  ]," if image_index else b"],")
+        output.write(b"\n")
+
+        output.write(b'  "annotations": [')
+        annotations.seek(0)
+        shutil.copyfileobj(annotations, output)
+        output.write(b"\n  ]," if annotation_count else b"],")
+        output.write(b"\n")
+
+    sorted_categories = dict(sorted(categories.items(), key=itemgetter(1)))
+    sorted_tag_categories = dict(sorted(tag_categories.items(), key=itemgetter(1)))
+    _write_value(output, "categories", list(_build_categories(sorted_categories)))
+    output.write(b",\n")
+    _write_value(
+        output, "tag_categories", list(_build_tag_categories(sorted_tag_categories))
+    )
+    output.write(b"\n}")
+
+
+def _dump_array_element(value: object) -> bytes:
+    # Indented as an element of an array of the top level object
+    return b"    " + json.dumps(value, option=_JSON_OPTIONS).replace(b"\n", b"\n    ")
+
+
+def _write_value(output: BinaryIO, key: str, value: object) -> None:
+    output.write(b"  " + json.dumps(key) + b": ")
+    output.write(json.dumps(value, option=_JSON_OPTIONS).replace(b"\n", b"\n  "))
+
+
+def _update_categories(
+    annotation_file: dt.AnnotationFile,
+    categories: Dict[str, int],
+    tag_categories: Dict[str, int],
+) -> None:
+    for annotation_class in annotation_file.annotation_classes:
+        if annotation_class.annotation_type in ["polygon", "bounding_box"]:
+            if annotation_class.name not in categories:
+                categories[annotation_class.name] = _calculate_category_id(
+                    annotation_class
+                )
+        elif annotation_class.annotation_type == "tag":
+            if annotation_class.name not in tag_categories:
+                tag_categories[annotation_class.name] = _calculate_category_id(
+                    annotation_class
+                )
 
 
 def _build_json(annotation_files: List[dt.AnnotationFile]) -> Dict[str, Any]:
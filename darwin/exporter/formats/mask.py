@@ -17,6 +17,7 @@ from upolygon import draw_polygon
 import darwin.datatypes as dt
 from darwin.exceptions import DarwinException
 from darwin.utils import convert_polygons_to_sequences
+from darwin.utils.rle import decode_dense_rle
 
 
 def get_palette(mode: dt.MaskTypes.Mode, categories: List[str]) -> dt.MaskTypes.Palette:
@@ -173,14 +174,13 @@ def rle_decode(
     Returns:
         List[int]: The decoded list of integers.
     """
-    if len(rle) % 2 != 0:
-        raise ValueError("RLE must be a list of pairs of integers.")
-
-    output = []
-    for i in range(0, len(rle), 2):
-        output += [label_colours[rle[i]]] * rle[i + 1]
-
-    return output
+    total_pixels = sum(rle[1::2])
+    # Colours aren't limited to the range of a uint8 mask
+    return (
+        decode_dense_rle(rle, total_pixels, 1, label_colours, dtype=np.int64)
+        .ravel()
+        .tolist()
+    )
 
 
 def get_or_generate_colour(cat_name: str, colours: dt.MaskTypes.ColoursDict) -> int:
@@ -402,8 +402,7 @@ def render_raster(
 
         label_colours[label] = colour_to_draw
 
-    decoded = rle_decode(raster_layer.rle, label_colours)
-    mask = np.array(decoded, dtype=np.uint8).reshape(height, width)
+    mask = decode_dense_rle(raster_layer.rle, width, height, label_colours)
 
     return errors, mask, categories, colours
 
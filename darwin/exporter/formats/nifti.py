@@ -35,6 +35,7 @@ import numpy as np
 
 import darwin.datatypes as dt
 from darwin.utils import convert_polygons_to_mask
+from darwin.utils.rle import decode_dense_rle
 
 
 class Plane(Enum):
@@ -735,12 +736,4 @@ def decode_rle(rle_data: List[int], width: int, height: int) -> np.ndarray:
     np.ndarray
         RLE data
     """
-    total_pixels = width * height
-    mask = np.zeros(total_pixels, dtype=np.uint8)
-    pos = 0
-    for i in range(0, len(rle_data), 2):
-        value = rle_data[i]
-        length = rle_data[i + 1]
-        mask[pos : pos + length] = value
-        pos += length
-    return mask.reshape(height, width)
+    return decode_dense_rle(rle_data, width, height)
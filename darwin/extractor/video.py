@@ -1,17 +1,28 @@
 import gzip
 import json
+import multiprocessing as mp
 import os
 import re
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from rich.console import Console
+from tqdm import tqdm
 
 console = Console()
 
+#: Extensions of the videos found in a source directory of a batch extraction.
+BATCH_VIDEO_EXTENSIONS = (".avi", ".hevc", ".m4v", ".mkv", ".mov", ".mp4", ".webm")
 
-def _check_ffmpeg_version():
+#: Number of threads given to each extraction of a batch, unless set otherwise.
+DEFAULT_THREADS_PER_JOB = 4
+
+#: Name of the file listing the registration payloads of a batch extraction.
+REGISTRATION_MANIFEST_NAME = "registration_manifest.json"
+
+
+def _check_ffmpeg_version() -> None:
     """
     Check if FFmpeg version 5 or higher is installed.
     Raises RuntimeError if FFmpeg is not found or version is lower.
@@ -265,26 +276,83 @@ def _calculate_avg_bitrate(index_data: str, segments: List[str]) -> Optional[flo
     return None
 
 
-def _extract_segments(source_file: str, dirs: Dict, segment_length: int) -> Dict:
+_SEGMENT_QUALITIES: Dict[str, Dict[str, Union[int, str]]] = {
+    "high": {"crf": 23, "gop": 15},
+    "low": {
+        "crf": 40,
+        "gop": 15,
+        "scale": "-2:'if(gt(ih,720),max(ceil(ih/4)*2,720),ih)'",
+    },
+}
+
+
+def _get_threads_args(threads: Optional[int], *, output: bool = False) -> List[str]:
+    """
+    Build the ffmpeg options capping the threads used to decode and filter the input,
+    or to encode an output. No options are returned when threads is not set
+    """
+    if not threads:
+        return []
+    if output:
+        return ["-threads", str(threads)]
+    return [
+        "-filter_threads",
+        str(threads),
+        "-filter_complex_threads",
+        str(threads),
+        "-threads",
+        str(threads),
+    ]
+
+
+def _get_hls_output_args(
+    quality_dir: str, opts: Dict, segment_length: int, threads: Optional[int] = None
+) -> List[str]:
+    """Build the ffmpeg output options of an HLS rendition, without its output path"""
+    return [
+        *_get_threads_args(threads, output=True),
+        "-c:v",
+        "libx264",
+        "-crf",
+        str(opts["crf"]),
+        "-g",
+        str(opts["gop"]),
+        "-f",
+        "hls",
+        "-hls_time",
+        str(segment_length),
+        "-hls_list_size",
+        "0",
+        "-start_number",
+        "0",
+        "-hls_segment_filename",
+        os.path.join(quality_dir, "%09d.ts"),
+        "-vsync",
+        "passthrough",
+        "-max_muxing_queue_size",
+        "1024",
+    ]
+
+
+def _get_segments_bitrate(quality_dir: str) -> Optional[float]:
+    """Calculate the average bitrate of the HLS segments of a rendition"""
+    with open(os.path.join(quality_dir, "index.m3u8")) as f:
+        index_data = f.read()
+    segments = sorted(Path(quality_dir).glob("*.ts"))
+    return _calculate_avg_bitrate(index_data, [str(s) for s in segments])
+
+
+def _extract_segments(
+    source_file: str, dirs: Dict, segment_length: int, threads: Optional[int] = None
+) -> Dict:
     """
     Extract HLS segments in high and low quality
     Returns segment info and frame counts per segment
     """
-    qualities = {
-        "high": {"crf": 23, "gop": 15},
-        "low": {
-            "crf": 40,
-            "gop": 15,
-            "scale": "-2:'if(gt(ih,720),max(ceil(ih/4)*2,720),ih)'",
-        },
-    }
-
     bitrates = {}
 
-    for quality, opts in qualities.items():
+    for quality, opts in _SEGMENT_QUALITIES.items():
         quality_dir = dirs["segments_" + quality]
-        segment_pattern = os.path.join(quality_dir, "%09d.ts")
-        index_path = os.path.join(quality_dir, "index.m3u8")
 
         # Build ffmpeg command
         cmd = [
@@ -292,49 +360,31 @@ def _extract_segments(source_file: str, dirs: Dict, segment_length: int) -> Dict
             "-hide_banner",
             "-v",
             "error",
+            *_get_threads_args(threads),
             "-i",
             source_file,
-            "-c:v",
-            "libx264",
-            "-crf",
-            str(opts["crf"]),
-            "-g",
-            str(opts["gop"]),
-            "-f",
-            "hls",
-            "-hls_time",
-            str(segment_length),
-            "-hls_list_size",
-            "0",
-            "-start_number",
-            "0",
-            "-hls_segment_filename",
-            segment_pattern,
-            "-vsync",
-            "passthrough",
-            "-max_muxing_queue_size",
-            "1024",
+            *_get_hls_output_args(quality_dir, opts, segment_length, threads),
         ]
 
         # Add scale filter for low quality
         if "scale" in opts:
             cmd.extend(["-vf", f"scale={opts['scale']}"])
 
-        cmd.append(index_path)
+        cmd.append(os.path.join(quality_dir, "index.m3u8"))
 
         subprocess.run(cmd, check=True)
 
-        # Read index file and calculate bitrate
-        with open(index_path) as f:
-            index_data = f.read()
-            segments = sorted(Path(quality_dir).glob("*.ts"))
-            bitrate = _calculate_avg_bitrate(index_data, [str(s) for s in segments])
-            bitrates[quality] = bitrate
+        bitrates[quality] = _get_segments_bitrate(quality_dir)
 
     return {"bitrates": bitrates}
 
 
-def _extract_thumbnail(source_file: str, output_path: str, total_frames: int) -> str:
+def _extract_thumbnail(
+    source_file: str,
+    output_path: str,
+    total_frames: int,
+    threads: Optional[int] = None,
+) -> str:
     """Extract thumbnail from middle frame"""
     middle_frame = total_frames // 2
 
@@ -343,6 +393,7 @@ def _extract_thumbnail(source_file: str, output_path: str, total_frames: int) ->
         "-hide_banner",
         "-v",
         "error",
+        *_get_threads_args(threads),
         "-i",
         source_file,
         "-vf",
@@ -357,13 +408,16 @@ def _extract_thumbnail(source_file: str, output_path: str, total_frames: int) ->
     return output_path
 
 
-def _get_frames_timestamps(source_file: str) -> List[float]:
+def _get_frames_timestamps(
+    source_file: str, threads: Optional[int] = None
+) -> List[float]:
     """Get frame timestamps using ffmpeg showinfo filter"""
     cmd = [
         "ffmpeg",
         "-hide_banner",
         "-v",
         "info",
+        *_get_threads_args(threads),
         "-i",
         source_file,
         "-vsync",
@@ -376,10 +430,13 @@ def _get_frames_timestamps(source_file: str) -> List[float]:
     ]
 
     result = subprocess.run(cmd, capture_output=True, text=True)
+    return _parse_frames_timestamps(result.stderr)
 
-    # Parse timestamps from stderr
+
+def _parse_frames_timestamps(showinfo_log: str) -> List[float]:
+    """Parse frame timestamps from the log of the ffmpeg showinfo filter"""
     frames = []
-    for line in result.stderr.splitlines():
+    for line in showinfo_log.splitlines():
         if "pts_time:" in line:
             pts_time = line.split("pts_time:")[1].split()[0]
             frames.append(float(pts_time))
@@ -387,21 +444,37 @@ def _get_frames_timestamps(source_file: str) -> List[float]:
     return frames
 
 
-def _extract_frames(source_file: str, output_dir: str, downsampling_step: float):
+def _get_frames_select_filter(downsampling_step: float) -> str:
+    """
+    Build the select filter keeping the frames visible after downsampling.
+    This matches the frame selection logic in the manifest
+    """
+    return (
+        f"select='eq(trunc(trunc((n+1)/{downsampling_step})*{downsampling_step})\\,n)'"
+    )
+
+
+def _extract_frames(
+    source_file: str,
+    output_dir: str,
+    downsampling_step: float,
+    threads: Optional[int] = None,
+):
     """Extract frames using ffmpeg with optional downsampling"""
     frame_pattern = os.path.join(output_dir, "%09d.png")
 
     if downsampling_step > 1:
         # Use select filter to precisely control what frames are extracted
-        # This matches the frame selection logic in the manifest
-        select_expr = f"select='eq(trunc(trunc((n+1)/{downsampling_step})*{downsampling_step})\\,n)'"
+        select_expr = _get_frames_select_filter(downsampling_step)
         cmd = [
             "ffmpeg",
             "-hide_banner",
             "-v",
             "error",
+            *_get_threads_args(threads),
             "-i",
             source_file,
+            *_get_threads_args(threads, output=True),
             "-start_number",
             "0",
             "-vsync",
@@ -419,8 +492,10 @@ def _extract_frames(source_file: str, output_dir: str, downsampling_step: float)
             "-hide_banner",
             "-v",
             "error",
+            *_get_threads_args(threads),
             "-i",
             source_file,
+            *_get_threads_args(threads, output=True),
             "-start_number",
             "0",
             "-vsync",
@@ -433,25 +508,148 @@ def _extract_frames(source_file: str, output_dir: str, downsampling_step: float)
     subprocess.run(cmd, check=True)
 
 
-def _get_segment_frame_counts(segments_dir: str) -> List[int]:
-    """Get frame counts for each segment in order"""
+def _extract_segments_and_frames(
+    source_file: str,
+    dirs: Dict,
+    segment_length: int,
+    downsampling_step: float,
+    threads: Optional[int] = None,
+) -> Tuple[Dict, List[float]]:
+    """
+    Extract HLS segments in high and low quality, frames and frame timestamps
+    with a single ffmpeg filter graph, so that the video is decoded only once.
+
+    Outputs are the same as those of _extract_segments, _extract_frames and
+    _get_frames_timestamps, the decoded frames being split between them.
+
+    Args:
+        source_file: Path to source video file
+        dirs: Directories created by _create_directories
+        segment_length: Length of each segment in seconds
+        downsampling_step: Step between the extracted frames
+        threads: Maximum number of threads of each stage of ffmpeg, defaults to
+            ffmpeg's own choice
+
+    Returns:
+        Tuple of the segment info and of the timestamps of all frames
+    """
+    frames_filter = (
+        _get_frames_select_filter(downsampling_step)
+        if downsampling_step > 1
+        else "null"
+    )
+    filter_graph = ";".join(
+        [
+            "[0:v]showinfo,split=3[high][low_in][frames_in]",
+            f"[low_in]scale={_SEGMENT_QUALITIES['low']['scale']}[low]",
+            f"[frames_in]{frames_filter}[frames]",
+        ]
+    )
+
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        # showinfo logs frame timestamps at info level
+        "-v",
+        "info",
+        *_get_threads_args(threads),
+        "-i",
+        source_file,
+        "-filter_complex",
+        filter_graph,
+    ]
+    for quality, opts in _SEGMENT_QUALITIES.items():
+        quality_dir = dirs["segments_" + quality]
+        cmd.extend(
+            [
+                "-map",
+                f"[{quality}]",
+                # Filter graph outputs replace the default stream selection, audio included
+                "-map",
+                "0:a?",
+                "-c:a",
+                "aac",
+                *_get_hls_output_args(quality_dir, opts, segment_length, threads),
+                os.path.join(quality_dir, "index.m3u8"),
+            ]
+        )
+    cmd.extend(
+        [
+            "-map",
+            "[frames]",
+            *_get_threads_args(threads, output=True),
+            "-start_number",
+            "0",
+            "-vsync",
+            "passthrough",
+            "-f",
+            "image2",
+            os.path.join(dirs["sections"], "%09d.png"),
+        ]
+    )
+
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+
+    bitrates = {
+        quality: _get_segments_bitrate(dirs["segments_" + quality])
+        for quality in _SEGMENT_QUALITIES
+    }
+    return {"bitrates": bitrates}, _parse_frames_timestamps(result.stderr)
+
+
+def _count_packets(source_file: str) -> int:
+    """Count the video packets of a file, which reads it without decoding it"""
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-count_packets",
+        "-show_entries",
+        "stream=nb_read_packets",
+        "-of",
+        "json",
+        source_file,
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    return int(json.loads(result.stdout)["streams"][0]["nb_read_packets"])
+
+
+def _get_segment_frame_counts(segments_dir: str, decode: bool = True) -> List[int]:
+    """
+    Get frame counts for each segment in order.
+    Without decode, packets are counted instead, which only holds for segments
+    encoded with one frame per packet such as those of _extract_segments_and_frames
+    """
+    count = _count_frames if decode else _count_packets
     segments = sorted(Path(segments_dir).glob("*.ts"))
     segment_frame_counts = []
     for segment in segments:
-        count = _count_frames(str(segment))
-        segment_frame_counts.append(count)
+        segment_frame_counts.append(count(str(segment)))
     return segment_frame_counts
 
 
 def _create_frames_manifest(
-    source_file: str, segments_dir: str, downsampling_step: float, manifest_path: str
+    source_file: str,
+    segments_dir: str,
+    downsampling_step: float,
+    manifest_path: str,
+    frames_timestamps: Optional[List[float]] = None,
+    threads: Optional[int] = None,
 ) -> Dict:
     """
     Create frames manifest mapping frames to segments
     Format: FRAME_NO_IN_SEGMENT:SEGMENT_NO:VISIBILITY_FLAG:TIMESTAMP
+
+    Frame timestamps already collected while extracting segments are used when
+    given, in which case the segments are not decoded again to count their frames
     """
-    frames_timestamps = _get_frames_timestamps(source_file)
-    segment_frame_counts = _get_segment_frame_counts(segments_dir)
+    if frames_timestamps is None:
+        frames_timestamps = _get_frames_timestamps(source_file, threads)
+        segment_frame_counts = _get_segment_frame_counts(segments_dir)
+    else:
+        segment_frame_counts = _get_segment_frame_counts(segments_dir, decode=False)
 
     file_lines = []
     visible_frames = 0
@@ -572,6 +770,8 @@ def extract_artifacts(
     fps: float = 0.0,
     segment_length: int = 2,
     repair: bool = False,
+    single_decode: bool = False,
+    threads: Optional[int] = None,
 ) -> Dict:
     """
     Extracts video artifacts including segments, frames, thumbnail for
@@ -584,6 +784,10 @@ def extract_artifacts(
         fps: Desired frames per second (0.0 for native fps), defaults to 0.0
         segment_length: Length of each segment in seconds, defaults to 2
         repair: If True, attempt to repair video if errors are detected, defaults to False
+        single_decode: If True, extract segments, frames and frame timestamps with a
+            single ffmpeg filter graph decoding the video once, defaults to False
+        threads: Maximum number of threads used by each ffmpeg stage, defaults to
+            ffmpeg's own choice
 
     Returns:
         Dict containing metadata and paths to generated artifacts
@@ -615,15 +819,30 @@ def extract_artifacts(
     console.print(f"Downsampling step: {downsampling_step}")
     console.print(f"Source file size: {source_file_size} bytes")
 
-    console.print("\nExtracting video segments...")
+    frames_timestamps = None
+    if single_decode:
+        console.print("\nExtracting video segments and frames...")
 
-    segments_metadata = _extract_segments(
-        source_file=source_file, dirs=dirs, segment_length=segment_length
-    )
+        segments_metadata, frames_timestamps = _extract_segments_and_frames(
+            source_file=source_file,
+            dirs=dirs,
+            segment_length=segment_length,
+            downsampling_step=downsampling_step,
+            threads=threads,
+        )
+    else:
+        console.print("\nExtracting video segments...")
+
+        segments_metadata = _extract_segments(
+            source_file=source_file,
+            dirs=dirs,
+            segment_length=segment_length,
+            threads=threads,
+        )
 
-    console.print("\nExtracting frames...")
+        console.print("\nExtracting frames...")
 
-    _extract_frames(source_file, dirs["sections"], downsampling_step)
+        _extract_frames(source_file, dirs["sections"], downsampling_step, threads)
 
     console.print("\nCreating frames manifest...")
 
@@ -632,6 +851,8 @@ def extract_artifacts(
         segments_dir=dirs["segments_high"],
         downsampling_step=downsampling_step,
         manifest_path=os.path.join(dirs["base_dir"], "frames_manifest.txt"),
+        frames_timestamps=frames_timestamps,
+        threads=threads,
     )
 
     console.print("\nExtracting thumbnail...")
@@ -640,6 +861,7 @@ def extract_artifacts(
         source_file=source_file,
         output_path=os.path.join(dirs["base_dir"], "thumbnail.jpg"),
         total_frames=manifest_metadata["total_frames"],
+        threads=threads,
     )
 
     console.print("\nExtracting audio peaks...")
@@ -664,6 +886,9 @@ def extract_artifacts(
         "repaired": repaired,
         "source_file": source_file,
         "storage_key_prefix": storage_key_prefix,
+        # Options of the extraction not found in the registration payload
+        "segment_length": segment_length,
+        "repair": repair,
         "registration_payload": {
             "type": "video",
             "width": metadata["width"],
@@ -708,3 +933,254 @@ def extract_artifacts(
         json.dump(result_metadata, f, indent=2)
 
     return result_metadata
+
+
+def extract_artifacts_batch(
+    source: str,
+    output_dir: str,
+    storage_key_prefix: str,
+    *,
+    fps: float = 0.0,
+    segment_length: int = 2,
+    repair: bool = False,
+    single_decode: bool = False,
+    max_workers: Optional[int] = None,
+    threads_per_job: Optional[int] = None,
+    force: bool = False,
+) -> Dict:
+    """
+    Extracts the artifacts of many videos for read-only registration in the Darwin
+    platform, running several extractions at the same time in separate processes.
+
+    The artifacts of each video are written to a directory of output_dir named after
+    its path relative to the source, under the same storage key prefix. Videos whose
+    metadata.json is newer than them and was extracted with the same storage key prefix,
+    fps, segment length and repair option are skipped. The registration payloads of all videos are written to
+    a combined registration manifest in output_dir.
+
+    Args:
+        source: Directory searched recursively for videos, or manifest file listing one
+            video path per line, relative paths being relative to the manifest
+        output_dir: Directory to store generated artifacts
+        storage_key_prefix: Prefix for storage keys
+        fps: Desired frames per second (0.0 for native fps), defaults to 0.0
+        segment_length: Length of each segment in seconds, defaults to 2
+        repair: If True, attempt to repair videos if errors are detected, defaults to False
+        single_decode: If True, decode each video once, see extract_artifacts, defaults
+            to False
+        max_workers: Number of videos extracted at the same time, defaults to the number
+            of CPUs divided by threads_per_job
+        threads_per_job: Maximum number of threads used by each ffmpeg stage of an
+            extraction, defaults to the number of CPUs divided by max_workers, or to
+            DEFAULT_THREADS_PER_JOB if neither is set
+        force: If True, extract videos even if their artifacts are up to date, defaults
+            to False
+
+    Returns:
+        Dict containing the registration manifest
+
+    Raises:
+        FileNotFoundError: If source does not exist
+        ValueError: If two videos of the source would share the same artifacts directory
+    """
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"Source not found: {source}")
+
+    _check_ffmpeg_version()
+    max_workers, threads_per_job = _get_batch_workers(
+        max_workers, threads_per_job, os.cpu_count() or 1
+    )
+    storage_key_prefix = storage_key_prefix.strip("/")
+
+    results: Dict[str, Dict] = {}
+    jobs = []
+    for source_file, name in _find_batch_sources(source):
+        job_output_dir = os.path.join(output_dir, name)
+        job_storage_key_prefix = f"{storage_key_prefix}/{name}"
+        metadata = None
+        if not force:
+            metadata = _get_up_to_date_metadata(
+                source_file,
+                job_output_dir,
+                job_storage_key_prefix,
+                fps,
+                segment_length,
+                repair,
+            )
+        if metadata:
+            results[name] = _get_manifest_item(metadata)
+            continue
+        jobs.append(
+            {
+                "name": name,
+                "source_file": source_file,
+                "output_dir": job_output_dir,
+                "storage_key_prefix": job_storage_key_prefix,
+                "fps": fps,
+                "segment_length": segment_length,
+                "repair": repair,
+                "single_decode": single_decode,
+                "threads": threads_per_job,
+            }
+        )
+
+    console.print(
+        f"Extracting {len(jobs)} videos ({len(results)} up to date) with "
+        f"{max_workers} jobs of {threads_per_job} threads..."
+    )
+
+    failed = []
+    if jobs:
+        job_results = _run_batch_jobs(jobs, max_workers)
+        for name, item, error in tqdm(
+            job_results, total=len(jobs), desc="Extracting video artifacts"
+        ):
+            if item:
+                results[name] = item
+            else:
+                failed.append({"name": name, "error": error})
+
+    registration_manifest = {
+        "items": [results[name] for name in sorted(results)],
+        "failed": sorted(failed, key=lambda failure: failure["name"]),
+    }
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, REGISTRATION_MANIFEST_NAME), "w") as f:
+        json.dump(registration_manifest, f, indent=2)
+
+    if failed:
+        console.print(f"Failed to extract {len(failed)} videos:")
+        for failure in registration_manifest["failed"]:
+            console.print(f"  {failure['name']}: {failure['error']}")
+
+    return registration_manifest
+
+
+def _get_batch_workers(
+    max_workers: Optional[int], threads_per_job: Optional[int], cpu_count: int
+) -> Tuple[int, int]:
+    """
+    Split the CPUs between the jobs of a batch extraction, so that they are all
+    used without running more threads than CPUs
+    """
+    if threads_per_job is None:
+        if max_workers is None:
+            threads_per_job = min(DEFAULT_THREADS_PER_JOB, cpu_count)
+        else:
+            threads_per_job = max(cpu_count // max_workers, 1)
+    if max_workers is None:
+        max_workers = max(cpu_count // threads_per_job, 1)
+    return max_workers, threads_per_job
+
+
+def _find_batch_sources(source: str) -> List[Tuple[str, str]]:
+    """
+    Find the videos of a batch extraction, with the names of their artifacts
+    directories relative to the output directory
+    """
+    if os.path.isdir(source):
+        base_dir = Path(source)
+        source_files = sorted(
+            path
+            for path in base_dir.rglob("*")
+            if path.is_file() and path.suffix.lower() in BATCH_VIDEO_EXTENSIONS
+        )
+    else:
+        base_dir = Path(source).parent
+        with open(source) as f:
+            source_files = [
+                Path(os.path.normpath(base_dir / line.strip()))
+                for line in f
+                if line.strip()
+            ]
+
+    sources = []
+    names = set()
+    for source_file in source_files:
+        if source_file.is_relative_to(base_dir):
+            name = source_file.relative_to(base_dir).as_posix()
+        else:
+            name = source_file.name
+        if name in names:
+            raise ValueError(f"Several videos of {source} are named {name}")
+        names.add(name)
+        sources.append((str(source_file), name))
+    return sources
+
+
+def _get_up_to_date_metadata(
+    source_file: str,
+    output_dir: str,
+    storage_key_prefix: str,
+    fps: float,
+    segment_length: int,
+    repair: bool,
+) -> Optional[Dict]:
+    """
+    Read the metadata.json of a video if it is newer than the video and was
+    extracted with the same storage key prefix, fps, segment length and repair
+    option, otherwise return None
+    """
+    metadata_path = os.path.join(output_dir, "metadata.json")
+    try:
+        if os.path.getmtime(metadata_path) < os.path.getmtime(source_file):
+            return None
+        with open(metadata_path) as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        metadata.get("storage_key_prefix") != storage_key_prefix
+        or metadata.get("registration_payload", {}).get("fps") != fps
+        or metadata.get("segment_length") != segment_length
+        or metadata.get("repair") != repair
+    ):
+        return None
+    return metadata
+
+
+def _get_manifest_item(metadata: Dict) -> Dict:
+    """Build the entry of a video in the registration manifest"""
+    return {
+        "source_file": metadata["source_file"],
+        "storage_key_prefix": metadata["storage_key_prefix"],
+        "registration_payload": metadata["registration_payload"],
+    }
+
+
+def _run_batch_jobs(
+    jobs: List[Dict], max_workers: int
+) -> Iterator[Tuple[str, Optional[Dict], Optional[str]]]:
+    """Run the jobs of a batch extraction, yielding their results as they finish"""
+    if max_workers > 1 and len(jobs) > 1:
+        with mp.Pool(min(max_workers, len(jobs)), initializer=_silence_console) as pool:
+            yield from pool.imap_unordered(_extract_batch_job, jobs)
+    else:
+        yield from map(_extract_batch_job, jobs)
+
+
+def _silence_console() -> None:
+    """Silence the progress of the extractions running in worker processes"""
+    console.quiet = True
+
+
+def _extract_batch_job(job: Dict) -> Tuple[str, Optional[Dict], Optional[str]]:
+    """
+    Extract the artifacts of a video of a batch, returning its name with either
+    its registration manifest entry or the error that stopped its extraction
+    """
+    try:
+        metadata = extract_artifacts(
+            source_file=job["source_file"],
+            output_dir=job["output_dir"],
+            storage_key_prefix=job["storage_key_prefix"],
+            fps=job["fps"],
+            segment_length=job["segment_length"],
+            repair=job["repair"],
+            single_decode=job["single_decode"],
+            threads=job["threads"],
+        )
+    except Exception as e:
+        return job["name"], None, str(e) or type(e).__name__
+    return job["name"], _get_manifest_item(metadata), None
@@ -230,3 +230,33 @@ def list_items_unstable(
         except ValidationError as e:
             exceptions.append(e)
     return items, exceptions
+
+
+def get_item_ids_unstable(
+    api_client: ClientCore,
+    team_slug: str,
+    params: JSONDict,
+) -> List[UUID]:
+    """
+    Returns a list of item ids for the dataset from the advanced filters 'unstable' endpoint,
+    without validating the items
+
+    Parameters
+    ----------
+    client: Client
+        The client to use for the request
+    team_slug: str
+        The slug of the team to get item ids for
+    params: JSONType
+        Must include at least dataset_ids
+
+    Returns
+    -------
+    List[UUID]
+        A list of item ids
+    """
+    if "dataset_ids" not in params:
+        raise ValueError("dataset_ids must be provided")
+    response = api_client.post(f"/unstable/teams/{team_slug}/items/list", params)
+    assert isinstance(response, dict)
+    return [UUID(item["id"]) for item in response["items"]]
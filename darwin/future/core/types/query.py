@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+import copy
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
 
 from pydantic import field_validator
 from typing_extensions import Self
@@ -274,6 +288,24 @@ class Query(Generic[T], ABC):
 
 
 class PaginatedQuery(Query[T]):
+    """
+    A Query fetching its results one page at a time, see Query.
+
+    Pages are fetched one after the other by default. Passing ``prefetch`` to ``collect_all``
+    or ``stream`` keeps up to that many page requests in flight at the same time instead, which
+    hides the latency of each request when listing many results. ``stream`` also yields the
+    results as their pages arrive without keeping them in ``results``, so that its memory use
+    is bounded by the prefetched pages.
+
+    Examples:
+        # Collect all items, fetching 8 pages at the same time
+        items = client.team.items.collect_all(prefetch=8)
+
+        # Iterate over all items without keeping them in memory
+        for item in client.team.items.stream(prefetch=8):
+            ...
+    """
+
     def __init__(
         self,
         client: ClientCore,
@@ -288,8 +320,10 @@ class PaginatedQuery(Query[T]):
 
     def collect(self, force: bool = False) -> List[T]:
         if force or self._changed_since_last:
-            self.page = Page()
+            self.page = Page(size=self.page.size)
             self.completed = False
+            self.results = {}
+            self._changed_since_last = False
         if self.completed:
             return self._unwrap(self.results)
         new_results = self._collect()
@@ -300,15 +334,86 @@ class PaginatedQuery(Query[T]):
             self.page.increment()
         return self._unwrap(self.results)
 
-    def collect_all(self, force: bool = False) -> List[T]:
-        if force:
-            self.page = Page()
+    def collect_all(self, force: bool = False, prefetch: int = 1) -> List[T]:
+        """
+        Collects the results of all the pages of the query not collected yet.
+
+        Args:
+            force (bool, optional): Collects the results again from the first page.
+                Defaults to False.
+            prefetch (int, optional): Number of page requests in flight at the same time.
+                Defaults to 1.
+
+        Returns:
+            List[T]: All the results of the query
+        """
+        if force or self._changed_since_last:
+            self.page = Page(size=self.page.size)
             self.completed = False
             self.results = {}
+            self._changed_since_last = False
+        if prefetch > 1 and not self.completed:
+            for page, page_results in self._iter_pages(self.page, prefetch):
+                self.results = {**self.results, **page_results}
+                self.page = page
+            self.completed = True
         while not self.completed:
             self.collect()
         return self._unwrap(self.results)
 
+    def stream(self, prefetch: int = 1) -> Generator[T, None, None]:
+        """
+        Iterates over all the results of the query from its first page, yielding the results
+        of each page as it arrives. Results are not kept in ``results``.
+
+        Args:
+            prefetch (int, optional): Number of page requests in flight at the same time.
+                Defaults to 1.
+
+        Returns:
+            Generator[T, None, None]: The results of the query, in order. Closing it stops
+                requesting pages.
+        """
+        for _, page_results in self._iter_pages(Page(size=self.page.size), prefetch):
+            yield from page_results.values()
+
+    def _iter_pages(
+        self, first_page: Page, prefetch: int
+    ) -> Iterator[tuple[Page, Dict[int, T]]]:
+        """
+        Yields the pages of the query from first_page with their results, in order, until a
+        page is not full. Up to prefetch pages are requested at the same time, the requests
+        past the last page being cancelled or discarded.
+        """
+        next_page = first_page.model_copy()
+
+        def next_request() -> tuple[Page, Future[Dict[int, T]]]:
+            page = next_page.model_copy()
+            next_page.increment()
+            return page, executor.submit(self._collect_page, page)
+
+        executor = ThreadPoolExecutor(max(prefetch, 1))
+        in_flight: Deque[tuple[Page, Future[Dict[int, T]]]] = deque()
+        try:
+            while True:
+                while len(in_flight) < prefetch or not in_flight:
+                    in_flight.append(next_request())
+                page, future = in_flight.popleft()
+                page_results = future.result()
+                yield page, page_results
+                if len(page_results) < page.size:
+                    return
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+            executor.shutdown()
+
+    def _collect_page(self, page: Page) -> Dict[int, T]:
+        """Collects the results of a page, without changing the page of the query"""
+        query = copy.copy(self)
+        query.page = page
+        return query._collect()
+
     def __getitem__(self, index: int) -> T:
         if index not in self.results:
             temp_page = self.page
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List
 from uuid import UUID
 
+from tqdm import tqdm
+
 from darwin.future.core.items import get_item, move_items_to_stage
 from darwin.future.core.types.query import QueryFilter
 from darwin.future.data_objects.workflow import WFEdgeCore, WFStageCore
@@ -12,6 +15,15 @@ from darwin.future.meta.objects.base import MetaBase
 from darwin.future.meta.queries.item import ItemQuery
 from darwin.future.meta.queries.item_id import ItemIDQuery
 
+#: Number of items whose processing status is checked at the same time.
+STATUS_CHECK_MAX_WORKERS = 16
+
+#: Number of items moved to a stage by each request.
+MOVE_CHUNK_SIZE = 1000
+
+#: Number of requests moving items to a stage sent at the same time.
+MOVE_MAX_WORKERS = 4
+
 
 class Stage(MetaBase[WFStageCore]):
     """
@@ -84,32 +96,49 @@ class Stage(MetaBase[WFStageCore]):
         item_ids: list[str],
         wait_max_attempts: int = 5,
         wait_time: float = 0.5,
+        max_workers: int = STATUS_CHECK_MAX_WORKERS,
     ) -> bool:
         """
         Checks if all items are complete. If not, waits and tries again. Raises error if max attempts reached.
 
+        The statuses of the items are fetched concurrently, and each attempt only checks again
+        the items that were not complete at the previous one.
+
         Args:
             slug (str): Team slug
             item_ids (list[str]): List of item ids
             max_attempts (int, optional): Max number of attempts. Defaults to 5.
             wait_time (float, optional): Wait time between attempts. Defaults to 0.5.
+            max_workers (int, optional): Number of statuses fetched at the same time.
+                Defaults to STATUS_CHECK_MAX_WORKERS.
         """
-        for attempt in range(1, wait_max_attempts + 1):
-            # check if all items are complete
-            for item_id in item_ids[:]:
-                if get_item(self.client, slug, item_id).processing_status != "complete":
-                    break
-                item_ids.remove(item_id)
-            else:
+
+        def is_complete(item_id: str) -> bool:
+            return get_item(self.client, slug, item_id).processing_status == "complete"
+
+        pending = list(item_ids)
+        with ThreadPoolExecutor(max_workers) as executor:
+            for attempt in range(1, wait_max_attempts + 1):
+                completed = tqdm(
+                    executor.map(is_complete, pending),
+                    total=len(pending),
+                    desc="Checking item processing status",
+                    leave=False,
+                )
+                pending = [
+                    item_id
+                    for item_id, complete in zip(pending, completed)
+                    if not complete
+                ]
                 # if all items are complete, return.
-                return True
-            # if not complete, wait
-            time.sleep(wait_time * attempt)
-        else:
-            # if max attempts reached, raise error
-            raise MaxRetriesError(
-                f"Max attempts reached. {len(item_ids)} items pending completion check."
-            )
+                if not pending:
+                    return True
+                # if not complete, wait
+                time.sleep(wait_time * attempt)
+        # if max attempts reached, raise error
+        raise MaxRetriesError(
+            f"Max attempts reached. {len(pending)} items pending completion check."
+        )
 
     def move_attached_files_to_stage(
         self,
@@ -119,6 +148,9 @@ class Stage(MetaBase[WFStageCore]):
         wait_time: float = 0.5,
     ) -> Stage:
         """
+        Moves the items attached to the stage to another stage, in requests of MOVE_CHUNK_SIZE
+        items sent concurrently.
+
         Args:
             wait (bool, optional): Waits for Item 'processing_status' to complete. Defaults to True.
         """
@@ -146,14 +178,27 @@ class Stage(MetaBase[WFStageCore]):
                 wait_time=wait_time,
             )
 
-        move_items_to_stage(
-            self.client,
-            team_slug,
-            workflow_id,
-            dataset_id,
-            new_stage_id,
-            {"item_ids": ids},
-        )
+        chunks = [
+            ids[start : start + MOVE_CHUNK_SIZE]
+            for start in range(0, len(ids), MOVE_CHUNK_SIZE)
+        ]
+        with ThreadPoolExecutor(MOVE_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    move_items_to_stage,
+                    self.client,
+                    team_slug,
+                    workflow_id,
+                    dataset_id,
+                    new_stage_id,
+                    {"item_ids": chunk},
+                ): len(chunk)
+                for chunk in chunks
+            }
+            with tqdm(total=len(ids), desc="Moving items", leave=False) as progress:
+                for future in as_completed(futures):
+                    future.result()
+                    progress.update(futures[future])
         return self
 
     @property
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 from functools import reduce
-from typing import Dict, Literal, Protocol, Union
+from typing import Dict, Iterator, List, Literal, Optional, Protocol, Union
+from uuid import UUID
 
 from darwin.future.core.items.archive_items import archive_list_of_items
 from darwin.future.core.items.assign_items import assign_items
 from darwin.future.core.items.delete_items import delete_list_of_items
-from darwin.future.core.items.get import list_items, list_items_unstable
+from darwin.future.core.items.get import (
+    get_item_ids,
+    get_item_ids_unstable,
+    list_items,
+    list_items_unstable,
+)
 from darwin.future.core.items.move_items_to_folder import move_list_of_items_to_folder
 from darwin.future.core.items.restore_items import restore_list_of_items
 from darwin.future.core.items.set_item_layout import set_item_layout
@@ -18,11 +24,28 @@ from darwin.future.core.types.common import JSONDict, QueryString
 from darwin.future.core.types.query import PaginatedQuery, QueryFilter
 from darwin.future.data_objects.advanced_filters import GroupFilter, SubjectFilter
 from darwin.future.data_objects.item import ItemLayout
+from darwin.future.data_objects.page import Page
 from darwin.future.data_objects.sorting import SortingMethods
+from darwin.future.data_objects.typing import UnknownType
 from darwin.future.data_objects.workflow import WFStageCore
 from darwin.future.exceptions import BadRequest
 from darwin.future.meta.objects.item import Item
 
+#: Simple filters of an item query that the bulk item actions accept as lists of values.
+BULK_ACTION_FILTERS = frozenset(
+    {
+        "item_ids",
+        "item_names",
+        "item_paths",
+        "slot_types",
+        "statuses",
+        "workflow_stage_ids",
+    }
+)
+
+#: Number of item ids sent by each request of a bulk action that lists the ids of the items.
+BULK_ACTION_CHUNK_SIZE = 1000
+
 
 class hasStage(Protocol):
     # Using Protocol to avoid circular imports between item.py and stage.py
@@ -91,10 +114,8 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        delete_list_of_items(self.client, team_slug, dataset_ids, filters)
+        for filters in self._bulk_action_filters():
+            delete_list_of_items(self.client, team_slug, dataset_ids, filters)
 
     def move_to_folder(self, path: str) -> None:
         if "team_slug" not in self.meta_params:
@@ -114,10 +135,80 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        move_list_of_items_to_folder(self.client, team_slug, dataset_ids, path, filters)
+        for filters in self._bulk_action_filters():
+            move_list_of_items_to_folder(
+                self.client, team_slug, dataset_ids, path, filters
+            )
+
+    def _bulk_action_filters(self) -> Iterator[Dict[str, UnknownType]]:
+        """Yields the filters of the requests applying a bulk action to the items of the query
+
+        The filters of the query are passed to the bulk action endpoint when it accepts them all,
+        so that it is sent in a single request without listing the items. Otherwise, the ids of
+        the items are listed without loading the items, and sent in chunks of
+        BULK_ACTION_CHUNK_SIZE ids.
+
+        Returns:
+            Iterator[Dict[str, UnknownType]]: The filters of each request
+        """
+        server_side_filters = self._get_server_side_filters()
+        if server_side_filters:
+            yield server_side_filters
+            return
+
+        # Ids are all listed before acting on any of them, as the action may change which
+        # items match the query, and so the pages of the listing
+        ids = [str(item_id) for item_id in self._collect_item_ids()]
+        for start in range(0, len(ids), BULK_ACTION_CHUNK_SIZE):
+            yield {"item_ids": ids[start : start + BULK_ACTION_CHUNK_SIZE]}
+
+    def _get_server_side_filters(self) -> Optional[Dict[str, UnknownType]]:
+        if self._advanced_filters is not None:
+            return None
+        filters: Dict[str, UnknownType] = {}
+        for query_filter in self.filters:
+            if query_filter.name.startswith("sort["):
+                continue
+            name = query_filter.name.removesuffix("[]")
+            if query_filter.modifier is not None or name not in BULK_ACTION_FILTERS:
+                return None
+            # Like in the query string of the listing, a later filter replaces an earlier one
+            filters[name] = [query_filter.param]
+        return filters
+
+    def _collect_item_ids(self) -> List[UUID]:
+        dataset_ids = (
+            self.meta_params["dataset_ids"]
+            if "dataset_ids" in self.meta_params
+            else self.meta_params["dataset_id"]
+        )
+        team_slug = self.meta_params["team_slug"]
+        page = Page(size=self.page.size)
+        item_ids: List[UUID] = []
+        while True:
+            if self._advanced_filters is None:
+                params = reduce(
+                    lambda s1, s2: s1 + s2,
+                    [
+                        page.to_query_string(),
+                        *[QueryString(f.to_dict()) for f in self.filters],
+                    ],
+                )
+                page_ids = get_item_ids(self.client, team_slug, dataset_ids, params)
+            else:
+                page_ids = get_item_ids_unstable(
+                    self.client,
+                    team_slug,
+                    {
+                        "dataset_ids": [dataset_ids],
+                        "page": page.model_dump(),
+                        "filter": self._advanced_filters.model_dump(),
+                    },
+                )
+            item_ids.extend(page_ids)
+            if len(page_ids) < page.size:
+                return item_ids
+            page.increment()
 
     def _build_params(self) -> Union[QueryString, JSONDict]:
         if self._advanced_filters is None:
@@ -159,10 +250,8 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        set_item_priority(self.client, team_slug, dataset_ids, priority, filters)
+        for filters in self._bulk_action_filters():
+            set_item_priority(self.client, team_slug, dataset_ids, priority, filters)
 
     def restore(self) -> None:
         if "team_slug" not in self.meta_params:
@@ -179,10 +268,8 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        restore_list_of_items(self.client, team_slug, dataset_ids, filters)
+        for filters in self._bulk_action_filters():
+            restore_list_of_items(self.client, team_slug, dataset_ids, filters)
 
     def archive(self) -> None:
         if "team_slug" not in self.meta_params:
@@ -199,10 +286,8 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        archive_list_of_items(self.client, team_slug, dataset_ids, filters)
+        for filters in self._bulk_action_filters():
+            archive_list_of_items(self.client, team_slug, dataset_ids, filters)
 
     def set_layout(self, layout: ItemLayout) -> None:
         if "team_slug" not in self.meta_params:
@@ -221,10 +306,8 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        set_item_layout(self.client, team_slug, dataset_ids, layout, filters)
+        for filters in self._bulk_action_filters():
+            set_item_layout(self.client, team_slug, dataset_ids, layout, filters)
 
     def tag(self, tag_id: int) -> None:
         if "team_slug" not in self.meta_params:
@@ -244,10 +327,8 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        tag_items(self.client, team_slug, dataset_ids, tag_id, filters)
+        for filters in self._bulk_action_filters():
+            tag_items(self.client, team_slug, dataset_ids, tag_id, filters)
 
     def untag(self, tag_id: int) -> None:
         if "team_slug" not in self.meta_params:
@@ -267,10 +348,8 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-        untag_items(self.client, team_slug, dataset_ids, tag_id, filters)
+        for filters in self._bulk_action_filters():
+            untag_items(self.client, team_slug, dataset_ids, tag_id, filters)
 
     def assign(self, assignee_id: int, workflow_id: str | None = None) -> None:
         if not assignee_id:
@@ -298,13 +377,10 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-
-        assign_items(
-            self.client, team_slug, dataset_ids, assignee_id, workflow_id, filters
-        )
+        for filters in self._bulk_action_filters():
+            assign_items(
+                self.client, team_slug, dataset_ids, assignee_id, workflow_id, filters
+            )
 
     def set_stage(
         self, stage_or_stage_id: hasStage | str, workflow_id: str | None = None
@@ -344,13 +420,10 @@ class ItemQuery(PaginatedQuery[Item]):
             else self.meta_params["dataset_id"]
         )
         team_slug = self.meta_params["team_slug"]
-        self.collect_all()
-        ids = [item.id for item in self]
-        filters = {"item_ids": [str(item) for item in ids]}
-
-        set_stage_to_items(
-            self.client, team_slug, dataset_ids, stage_id, workflow_id, filters
-        )
+        for filters in self._bulk_action_filters():
+            set_stage_to_items(
+                self.client, team_slug, dataset_ids, stage_id, workflow_id, filters
+            )
 
     def where(
         self,
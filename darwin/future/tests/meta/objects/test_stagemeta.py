@@ -1,11 +1,15 @@
+import json
+from types import SimpleNamespace
 from typing import List
+from unittest.mock import patch
 from uuid import UUID
 
 import responses
-from pytest import fixture
+from pytest import fixture, raises
 from responses.matchers import query_param_matcher
 
 from darwin.future.data_objects.workflow import WFEdgeCore, WFStageCore, WFTypeCore
+from darwin.future.exceptions import MaxRetriesError
 from darwin.future.meta.client import Client
 from darwin.future.meta.objects.stage import Stage
 from darwin.future.meta.queries.item import ItemQuery
@@ -152,6 +156,82 @@ def test_move_attached_files_to_stage_wait(
         )
 
 
+def test_move_attached_files_to_stage_in_chunks(
+    base_meta_client: Client, stage_meta: Stage, UUIDs_str: List[str]
+) -> None:
+    with responses.RequestsMock() as rsps, patch(
+        "darwin.future.meta.objects.stage.MOVE_CHUNK_SIZE", 4
+    ), patch(
+        "darwin.future.meta.objects.stage.get_item",
+        return_value=SimpleNamespace(processing_status="complete"),
+    ):
+        rsps.add(
+            rsps.GET,
+            base_meta_client.config.api_endpoint
+            + "v2/teams/default-team/items/list_ids",
+            json={"item_ids": UUIDs_str},
+            status=200,
+        )
+        rsps.add(
+            rsps.POST,
+            base_meta_client.config.api_endpoint + "v2/teams/default-team/items/stage",
+            json={},
+            status=200,
+        )
+        stage_meta.move_attached_files_to_stage(stage_meta.id, wait=True)
+
+        payloads = [
+            json.loads(call.request.body)
+            for call in rsps.calls
+            if call.request.method == "POST"
+        ]
+    assert sorted(len(payload["filters"]["item_ids"]) for payload in payloads) == [
+        2,
+        4,
+        4,
+    ]
+    assert sorted(
+        item_id for payload in payloads for item_id in payload["filters"]["item_ids"]
+    ) == sorted(UUIDs_str)
+
+
+def test_check_all_items_complete_rechecks_pending_items(
+    stage_meta: Stage, UUIDs_str: List[str]
+) -> None:
+    checked: List[str] = []
+
+    def get_item(client, slug, item_id):
+        checked.append(item_id)
+        # The first item is still processing at the first check
+        complete = item_id != UUIDs_str[0] or checked.count(item_id) > 1
+        return SimpleNamespace(
+            processing_status="complete" if complete else "processing"
+        )
+
+    with patch(
+        "darwin.future.meta.objects.stage.get_item", side_effect=get_item
+    ), patch("time.sleep") as sleep:
+        assert stage_meta.check_all_items_complete("default-team", UUIDs_str)
+
+    assert sorted(checked) == sorted(UUIDs_str + [UUIDs_str[0]])
+    sleep.assert_called_once_with(0.5)
+
+
+def test_check_all_items_complete_raises_after_max_attempts(
+    stage_meta: Stage, UUIDs_str: List[str]
+) -> None:
+    with patch(
+        "darwin.future.meta.objects.stage.get_item",
+        return_value=SimpleNamespace(processing_status="processing"),
+    ) as get_item, patch("time.sleep"):
+        with raises(MaxRetriesError):
+            stage_meta.check_all_items_complete(
+                "default-team", UUIDs_str, wait_max_attempts=3
+            )
+
+    assert get_item.call_count == 3 * len(UUIDs_str)
+
+
 def test_get_stage_id(stage_meta: Stage) -> None:
     assert stage_meta.id == UUID("00000000-0000-0000-0000-000000000000")
 
@@ -1,11 +1,15 @@
 from typing import List
+from unittest.mock import patch
 
 import pytest
 import responses
 from responses.matchers import json_params_matcher, query_param_matcher
 
 from darwin.future.core.client import ClientCore
+from darwin.future.core.types.query import Modifier, QueryFilter
+from darwin.future.data_objects import advanced_filters as AF
 from darwin.future.data_objects.item import ItemLayout
+from darwin.future.data_objects.page import Page
 from darwin.future.exceptions import BadRequest
 from darwin.future.meta.objects.item import Item
 from darwin.future.meta.queries.item import ItemQuery
@@ -45,13 +49,13 @@ def test_delete(
     with responses.RequestsMock() as rsps:
         rsps.add(
             rsps.GET,
-            item_query.client.config.api_endpoint + "v2/teams/test/items",
+            item_query.client.config.api_endpoint + "v2/teams/test/items/list_ids",
             match=[
                 query_param_matcher(
                     {"page[offset]": "0", "page[size]": "500", "dataset_ids": "1"}
                 )
             ],
-            json={"items": items_json, "errors": []},
+            json={"item_ids": [item["id"] for item in items_json]},
         )
         team_slug = items[0].meta_params["team_slug"]
         dataset_id = items[0].meta_params["dataset_id"]
@@ -80,13 +84,13 @@ def test_move_to_folder(
     with responses.RequestsMock() as rsps:
         rsps.add(
             rsps.GET,
-            item_query.client.config.api_endpoint + "v2/teams/test/items",
+            item_query.client.config.api_endpoint + "v2/teams/test/items/list_ids",
             match=[
                 query_param_matcher(
                     {"page[offset]": "0", "page[size]": "500", "dataset_ids": "1"}
                 )
             ],
-            json={"items": items_json, "errors": []},
+            json={"item_ids": [item["id"] for item in items_json]},
         )
         team_slug = items[0].meta_params["team_slug"]
         dataset_id = items[0].meta_params["dataset_id"]
@@ -117,13 +121,13 @@ def test_move_to_folder_raises_on_incorrect_parameters(
     with responses.RequestsMock() as rsps:
         rsps.add(
             rsps.GET,
-            item_query.client.config.api_endpoint + "v2/teams/test/items",
+            item_query.client.config.api_endpoint + "v2/teams/test/items/list_ids",
             match=[
                 query_param_matcher(
                     {"page[offset]": "0", "page[size]": "500", "dataset_ids": "1"}
                 )
             ],
-            json={"items": items_json, "errors": []},
+            json={"item_ids": [item["id"] for item in items_json]},
         )
         team_slug = items[0].meta_params["team_slug"]
         dataset_id = items[0].meta_params["dataset_id"]
@@ -155,13 +159,13 @@ def test_set_priority(
     with responses.RequestsMock() as rsps:
         rsps.add(
             rsps.GET,
-            item_query.client.config.api_endpoint + "v2/teams/test/items",
+            item_query.client.config.api_endpoint + "v2/teams/test/items/list_ids",
             match=[
                 query_param_matcher(
                     {"page[offset]": "0", "page[size]": "500", "dataset_ids": "1"}
                 )
             ],
-            json={"items": items_json, "errors": []},
+            json={"item_ids": [item["id"] for item in items_json]},
         )
         team_slug = items[0].meta_params["team_slug"]
         dataset_id = items[0].meta_params["dataset_id"]
@@ -193,13 +197,13 @@ def test_set_priority_raises_on_incorrect_parameters(
     with responses.RequestsMock() as rsps:
         rsps.add(
             rsps.GET,
-            item_query.client.config.api_endpoint + "v2/teams/test/items",
+            item_query.client.config.api_endpoint + "v2/teams/test/items/list_ids",
             match=[
                 query_param_matcher(
                     {"page[offset]": "0", "page[size]": "500", "dataset_ids": "1"}
                 )
             ],
-            json={"items": items_json, "errors": []},
+            json={"item_ids": [item["id"] for item in items_json]},
         )
         team_slug = items[0].meta_params["team_slug"]
         dataset_id = items[0].meta_params["dataset_id"]
@@ -232,13 +236,13 @@ def test_restore(
     with responses.RequestsMock() as rsps:
         rsps.add(
             rsps.GET,
-            item_query.client.config.api_endpoint + "v2/teams/test/items",
+            item_query.client.config.api_endpoint + "v2/teams/test/items/list_ids",
             match=[
                 query_param_matcher(
                     {"page[offset]": "0", "page[size]": "500", "dataset_ids": "1"}
                 )
             ],
-            json={"items": items_json, "errors": []},
+            json={"item_ids": [item["id"] for item in items_json]},
         )
         team_slug = items[0].meta_params["team_slug"]
         dataset_id = items[0].meta_params["dataset_id"]
@@ -267,13 +271,13 @@ def test_archive(
     with responses.RequestsMock() as rsps:
         rsps.add(
             rsps.GET,
-            item_query.client.config.api_endpoint + "v2/teams/test/items",
+            item_query.client.config.api_endpoint + "v2/teams/test/items/list_ids",
             match=[
                 query_param_matcher(
                     {"page[offset]": "0", "page[size]": "500", "dataset_ids": "1"}
                 )
             ],
-            json={"items": items_json, "errors": []},
+            json={"item_ids": [item["id"] for item in items_json]},
         )
         team_slug = items[0].meta_params["team_slug"]
         dataset_id = items[0].meta_params["dataset_id"]
@@ -302,13 +306,13 @@ def test_set_layout(
     with responses.RequestsMock() as rsps:
         rsps.add(
             rsps.GET,
-            item_query.client.config.api_endpoint + "v2/teams/test/items",
+            item_query.client.config.api_endpoint + "v2/teams/test/items/list_ids",
             match=[
                 query_param_matcher(
                     {"page[offset]": "0", "page[size]": "500", "dataset_ids": "1"}
                 )
             ],
-            json={"items": items_json, "errors": []},
+            json={"item_ids": [item["id"] for item in items_json]},
         )
         team_slug = items[0].meta_params["team_slug"]
         dataset_id = items[0].meta_params["dataset_id"]
@@ -348,13 +352,13 @@ def test_tag(item_query: ItemQuery, items_json: List[dict], items: List[Item]) -
     with responses.RequestsMock() as rsps:
         rsps.add(
             rsps.GET,
-            item_query.client.config.api_endpoint + "v2/teams/test/items",
+            item_query.client.config.api_endpoint + "v2/teams/test/items/list_ids",
             match=[
                 query_param_matcher(
                     {"page[offset]": "0", "page[size]": "500", "dataset_ids": "1"}
                 )
             ],
-            json={"items": items_json, "errors": []},
+            json={"item_ids": [item["id"] for item in items_json]},
         )
         team_slug = items[0].meta_params["team_slug"]
         dataset_id = items[0].meta_params["dataset_id"]
@@ -397,13 +401,13 @@ def test_untag(
     with responses.RequestsMock() as rsps:
         rsps.add(
             rsps.GET,
-            item_query.client.config.api_endpoint + "v2/teams/test/items",
+            item_query.client.config.api_endpoint + "v2/teams/test/items/list_ids",
             match=[
                 query_param_matcher(
                     {"page[offset]": "0", "page[size]": "500", "dataset_ids": "1"}
                 )
             ],
-            json={"items": items_json, "errors": []},
+            json={"item_ids": [item["id"] for item in items_json]},
         )
         team_slug = items[0].meta_params["team_slug"]
         dataset_id = items[0].meta_params["dataset_id"]
@@ -450,3 +454,99 @@ def test_sort_method(base_client: ClientCore):
     assert len(item_query.filters) == 2
     assert item_query.filters[0].name == "sort[accuracy]"
     assert item_query.filters[0].param == "desc"
+
+
+def test_bulk_action_passes_query_filters_to_server(item_query: ItemQuery) -> None:
+    item_query.sort(updated_at="desc")
+    item_query += QueryFilter(name="workflow_stage_ids", param="stage-id")
+    item_query += QueryFilter(name="statuses[]", param="new")
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            rsps.DELETE,
+            item_query.client.config.api_endpoint + "v2/teams/test/items",
+            match=[
+                json_params_matcher(
+                    {
+                        "filters": {
+                            "workflow_stage_ids": ["stage-id"],
+                            "statuses": ["new"],
+                            "dataset_ids": [1],
+                        }
+                    }
+                )
+            ],
+            json={},
+        )
+        item_query.delete()
+
+
+def test_bulk_action_sends_listed_ids_in_chunks(
+    item_query: ItemQuery, items_json: List[dict]
+) -> None:
+    item_ids = [item["id"] for item in items_json]
+    item_query.page = Page(size=2)
+    # Modifiers are not understood by the bulk endpoints
+    item_query += QueryFilter(name="statuses", param="new", modifier=Modifier.NOT_EQUAL)
+    with responses.RequestsMock() as rsps, patch(
+        "darwin.future.meta.queries.item.BULK_ACTION_CHUNK_SIZE", 3
+    ):
+        for offset in range(0, 6, 2):
+            rsps.add(
+                rsps.GET,
+                item_query.client.config.api_endpoint + "v2/teams/test/items/list_ids",
+                match=[
+                    query_param_matcher(
+                        {
+                            "page[offset]": str(offset),
+                            "page[size]": "2",
+                            "dataset_ids": "1",
+                            "statuses": "new",
+                        }
+                    )
+                ],
+                json={"item_ids": item_ids[offset : offset + 2]},
+            )
+        for chunk in (item_ids[:3], item_ids[3:]):
+            rsps.add(
+                rsps.POST,
+                item_query.client.config.api_endpoint
+                + "v2/teams/test/items/slots/tags",
+                match=[
+                    json_params_matcher(
+                        {
+                            "filters": {"item_ids": chunk, "dataset_ids": [1]},
+                            "annotation_class_id": 1,
+                        }
+                    )
+                ],
+                json={},
+            )
+        item_query.tag(1)
+
+
+def test_bulk_action_lists_ids_of_advanced_filters(
+    item_query: ItemQuery, items_json: List[dict]
+) -> None:
+    item_query.where(AF.ProcessingStatus.any_of(["complete"]))
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            rsps.POST,
+            item_query.client.config.api_endpoint + "unstable/teams/test/items/list",
+            json={"items": [{"id": item["id"]} for item in items_json]},
+        )
+        rsps.add(
+            rsps.POST,
+            item_query.client.config.api_endpoint + "v2/teams/test/items/archive",
+            match=[
+                json_params_matcher(
+                    {
+                        "filters": {
+                            "item_ids": [item["id"] for item in items_json],
+                            "dataset_ids": [1],
+                        }
+                    }
+                )
+            ],
+            json={},
+        )
+        item_query.archive()
@@ -1,4 +1,8 @@
+import json
+import threading
+import time
 from typing import List
+from urllib.parse import parse_qs, urlparse
 from uuid import UUID, uuid4
 
 import pytest
@@ -225,3 +229,103 @@ def test_sort_method(base_client: ClientCore):
     assert len(item_id_query.filters) == 2
     assert item_id_query.filters[0].name == "sort[accuracy]"
     assert item_id_query.filters[0].param == "desc"
+
+
+class _ListIdsServer:
+    """Answers list_ids requests from a list of ids, recording concurrent requests"""
+
+    def __init__(self, str_ids: List[str], delay: float = 0.05) -> None:
+        self.str_ids = str_ids
+        self.delay = delay
+        self.offsets: List[int] = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        query = parse_qs(urlparse(request.url).query)
+        offset = int(query["page[offset]"][0])
+        size = int(query["page[size]"][0])
+        with self.lock:
+            self.offsets.append(offset)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        body = {"item_ids": self.str_ids[offset : offset + size]}
+        return 200, {}, json.dumps(body)
+
+
+def _add_list_ids(rsps, base_client: ClientCore, server: _ListIdsServer) -> None:
+    rsps.add_callback(
+        responses.GET,
+        base_client.config.api_endpoint + "v2/teams/test_team/items/list_ids",
+        callback=server,
+    )
+
+
+def test_collect_all_prefetches_pages(
+    base_client: ClientCore, base_ItemIDQuery: ItemIDQuery
+) -> None:
+    uuids = [uuid4() for _ in range(23)]
+    server = _ListIdsServer([str(uuid) for uuid in uuids])
+    base_ItemIDQuery.page = Page(size=5)
+    with responses.RequestsMock() as rsps:
+        _add_list_ids(rsps, base_client, server)
+        ids = base_ItemIDQuery.collect_all(prefetch=3)
+
+    assert [x.id for x in ids] == uuids
+    assert server.max_active == 3
+    # Pages past the last one are only requested while it was in flight
+    assert sorted(server.offsets)[:5] == [0, 5, 10, 15, 20]
+    assert len(server.offsets) <= 7
+    assert base_ItemIDQuery.page.offset == 20
+    assert base_ItemIDQuery.completed is True
+
+
+def test_stream_yields_results_without_keeping_them(
+    base_client: ClientCore, base_ItemIDQuery: ItemIDQuery
+) -> None:
+    uuids = [uuid4() for _ in range(12)]
+    server = _ListIdsServer([str(uuid) for uuid in uuids], delay=0)
+    base_ItemIDQuery.page = Page(size=5)
+    with responses.RequestsMock() as rsps:
+        _add_list_ids(rsps, base_client, server)
+        ids = [x.id for x in base_ItemIDQuery.stream(prefetch=2)]
+
+    assert ids == uuids
+    assert base_ItemIDQuery.results == {}
+    assert base_ItemIDQuery.completed is False
+
+
+def test_stream_stops_requesting_pages_when_closed(
+    base_client: ClientCore, base_ItemIDQuery: ItemIDQuery
+) -> None:
+    server = _ListIdsServer([str(uuid4()) for _ in range(100)], delay=0)
+    base_ItemIDQuery.page = Page(size=5)
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        _add_list_ids(rsps, base_client, server)
+        stream = base_ItemIDQuery.stream(prefetch=2)
+        first_ids = [next(stream) for _ in range(6)]
+        stream.close()
+        requested = len(server.offsets)
+
+    assert len(first_ids) == 6
+    assert requested <= 4
+
+
+def test_collect_all_restarts_after_new_filter(
+    base_client: ClientCore, base_ItemIDQuery: ItemIDQuery
+) -> None:
+    uuids = [uuid4() for _ in range(8)]
+    server = _ListIdsServer([str(uuid) for uuid in uuids], delay=0)
+    base_ItemIDQuery.page = Page(size=5)
+    with responses.RequestsMock() as rsps:
+        _add_list_ids(rsps, base_client, server)
+        base_ItemIDQuery.collect()
+        base_ItemIDQuery.where(statuses="new")
+        ids = base_ItemIDQuery.collect_all()
+
+    assert [x.id for x in ids] == uuids
+    assert server.offsets == [0, 0, 5]
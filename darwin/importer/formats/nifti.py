@@ -53,29 +53,9 @@ def parse_path(
         Returns ``None`` if the given file is not in ``json`` format, or ``List[dt.AnnotationFile]``
         otherwise.
     """
-    if not isinstance(path, Path):
-        path = Path(path)
-    if path.suffix != ".json":
-        console.print(
-            "Skipping file: {} (not a json file)".format(path), style="bold yellow"
-        )
-        return None
-    data = attempt_decode(path)
-    try:
-        validate(data, schema=nifti_import_schema)
-    except Exception:
-        console.print(
-            "Skipping file: {} (invalid json file, see schema for details)".format(
-                path
-            ),
-            style="bold yellow",
-        )
-        return None
-    nifti_annotations = data.get("data")
-    if nifti_annotations is None or nifti_annotations == []:
-        console.print(
-            "Skipping file: {} (no data found)".format(path), style="bold yellow"
-        )
+    path = Path(path)
+    nifti_annotations = _read_nifti_annotations(path)
+    if nifti_annotations is None:
         return None
     annotation_files = []
     for nifti_annotation in nifti_annotations:
@@ -86,7 +66,7 @@ def parse_path(
             Path(nifti_annotation["label"]),
             Path(nifti_annotation["image"]),
             path,
-            class_map=nifti_annotation.get("class_map"),
+            class_map=nifti_annotation["class_map"],
             mode=nifti_annotation.get("mode", "image"),
             slot_names=nifti_annotation.get("slot_names", []),
             is_mpr=nifti_annotation.get("is_mpr", False),
@@ -98,6 +78,76 @@ def parse_path(
     return annotation_files
 
 
+def parse_path_headers(path: Path) -> Optional[List[dt.AnnotationFile]]:
+    """
+    Reads which files the given ``nifti`` import file targets, without loading its volumes.
+
+    Parameters
+    ----------
+    path : Path
+        The ``Path`` to the ``nifti`` import file.
+
+    Returns
+    -------
+    Optional[List[dt.AnnotationFile]]
+        Returns ``None`` if the given file cannot be imported, or a ``dt.AnnotationFile`` without
+        annotations for each targeted file otherwise.
+    """
+    path = Path(path)
+    nifti_annotations = _read_nifti_annotations(path, verbose=False)
+    if nifti_annotations is None:
+        return None
+    annotation_files = []
+    for nifti_annotation in nifti_annotations:
+        remote_path, filename = _get_remote_location(Path(nifti_annotation["image"]))
+        annotation_files.append(
+            dt.AnnotationFile(
+                path=path,
+                filename=filename,
+                remote_path=remote_path,
+                annotation_classes=set(),
+                annotations=[],
+            )
+        )
+    return annotation_files
+
+
+def _read_nifti_annotations(
+    path: Path, verbose: bool = True
+) -> Optional[List[dt.JSONFreeForm]]:
+    if path.suffix != ".json":
+        if verbose:
+            console.print(
+                "Skipping file: {} (not a json file)".format(path), style="bold yellow"
+            )
+        return None
+    data = attempt_decode(path)
+    try:
+        validate(data, schema=nifti_import_schema)
+    except Exception:
+        if verbose:
+            console.print(
+                "Skipping file: {} (invalid json file, see schema for details)".format(
+                    path
+                ),
+                style="bold yellow",
+            )
+        return None
+    nifti_annotations = data.get("data")
+    if nifti_annotations is None or nifti_annotations == []:
+        if verbose:
+            console.print(
+                "Skipping file: {} (no data found)".format(path), style="bold yellow"
+            )
+        return None
+    return nifti_annotations
+
+
+def _get_remote_location(filename: Path) -> Tuple[str, str]:
+    remote_path = "/" if filename.parent == Path(".") else filename.parent
+    return str(remote_path), filename.name
+
+
 def _parse_nifti(
     nifti_path: Path,
     filename: Path,
@@ -173,19 +223,18 @@ def _parse_nifti(
             dt.AnnotationClass(class_name, "mask", "mask")
             for class_name in class_map.values()
         }
-    remote_path = "/" if filename.parent == "." else filename.parent
-    filename = Path(filename.name)
+    remote_path, file_name = _get_remote_location(filename)
     return dt.AnnotationFile(
         path=json_path,
-        filename=str(filename),
-        remote_path=str(remote_path),
+        filename=file_name,
+        remote_path=remote_path,
         annotation_classes=annotation_classes,
         annotations=video_annotations,
         slots=[
             dt.Slot(
                 name=slot_name,
                 type="dicom",
-                source_files=[dt.SourceFile(file_name=str(filename), url=None)],
+                source_files=[dt.SourceFile(file_name=file_name, url=None)],
             )
             for slot_name in slot_names
         ],
@@ -1,4 +1,5 @@
 import concurrent.futures
+import threading
 import uuid
 import json
 import copy
@@ -14,6 +15,7 @@ from typing import (
     Dict,
     Generator,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -55,6 +57,7 @@ from darwin.datatypes import PathLike
 from darwin.exceptions import IncompatibleOptions, RequestEntitySizeExceeded
 from darwin.utils import secure_continue_request
 from darwin.utils.flatten_list import flatten_list
+from darwin.utils.rle import get_dense_rle_labels
 
 logger = getLogger(__name__)
 
@@ -76,6 +79,14 @@ FILENAME_OVERHEAD = 5
 MAX_URL_LENGTH = 2000
 BASE_URL_LENGTH = 200
 
+# Maximum size in bytes of the payload of an import request
+MAX_PAYLOAD_SIZE = 32_000_000
+
+# Number of items checked at the same time for annotations an import would overwrite
+OVERWRITE_CHECK_MAX_WORKERS = 16
+# Number of items listed for each kind of overwrite before asking to proceed with an import
+OVERWRITE_WARNING_MAX_LISTED_FILES = 100
+
 DEPRECATION_MESSAGE = """
 
 This function is going to be turned into private. This means that breaking
@@ -398,6 +409,74 @@ def _get_team_properties_annotation_lookup(
     return team_properties_annotation_lookup, team_item_properties_lookup
 
 
+class _ImportPropertiesCache:
+    """
+    Caches the team properties and the ``.v7/metadata.json`` files for the duration of an import,
+    so that they are fetched and parsed once instead of once per item.
+
+    The team properties are fetched again only after properties were created or updated.
+    """
+
+    def __init__(self, client: "Client", team_slug: str):
+        self.client = client
+        self.team_slug = team_slug
+        self._team_properties_lookups: Optional[
+            Tuple[
+                Dict[Tuple[str, Optional[int]], FullProperty], Dict[str, FullProperty]
+            ]
+        ] = None
+        self._metadata: Dict[Path, Tuple[List[PropertyClass], List[Dict[str, str]]]] = (
+            {}
+        )
+        self._metadata_paths: Dict[Path, Union[Path, bool]] = {}
+        self._lock = threading.Lock()
+
+    def get_team_properties_lookups(
+        self,
+    ) -> Tuple[Dict[Tuple[str, Optional[int]], FullProperty], Dict[str, FullProperty]]:
+        """
+        Returns the lookups of ``_get_team_properties_annotation_lookup``, fetching the team
+        properties only if they changed since they were last fetched.
+        """
+        with self._lock:
+            if self._team_properties_lookups is None:
+                self._team_properties_lookups = _get_team_properties_annotation_lookup(
+                    self.client, self.team_slug
+                )
+            return self._team_properties_lookups
+
+    def invalidate_team_properties(self) -> None:
+        """
+        Marks the team properties as changed, after properties were created or updated.
+        """
+        with self._lock:
+            self._team_properties_lookups = None
+
+    def get_metadata_path(self, path: Path) -> Union[Path, bool]:
+        """
+        Returns the result of ``is_properties_enabled`` for the given annotation file, checking
+        each directory once.
+        """
+        directory = path.parent if path.is_file() else path
+        with self._lock:
+            if directory not in self._metadata_paths:
+                self._metadata_paths[directory] = is_properties_enabled(directory)
+            return self._metadata_paths[directory]
+
+    def parse_metadata_file(
+        self, metadata_path: Union[Path, bool]
+    ) -> Tuple[List[PropertyClass], List[Dict[str, str]]]:
+        """
+        Returns the result of ``_parse_metadata_file``, parsing each metadata file once.
+        """
+        if not isinstance(metadata_path, Path):
+            return _parse_metadata_file(metadata_path)
+        with self._lock:
+            if metadata_path not in self._metadata:
+                self._metadata[metadata_path] = _parse_metadata_file(metadata_path)
+            return self._metadata[metadata_path]
+
+
 def _update_payload_with_properties(
     annotations: List[Dict[str, Unknown]],
     annotation_id_property_map: Dict[str, Dict[str, Dict[str, Set[str]]]],
@@ -434,6 +513,7 @@ def _serialize_item_level_properties(
     dataset: "RemoteDataset",
     import_annotators: bool,
     import_reviewers: bool,
+    properties_cache: Optional[_ImportPropertiesCache] = None,
 ) -> List[Dict[str, Any]]:
     """
     Returns serialized item-level properties to be added to the annotation import payload.
@@ -444,6 +524,7 @@ def _serialize_item_level_properties(
         dataset (RemoteDataset): The remote dataset instance.
         import_annotators (bool): Flag indicating whether to import annotators.
         import_reviewers (bool): Flag indicating whether to import reviewers.
+        properties_cache (Optional[_ImportPropertiesCache]): Cache of the team properties of the import.
 
     Returns:
         List[Dict[str, Any]]: A list of serialized item-level properties for the annotation import payload.
@@ -454,9 +535,8 @@ def _serialize_item_level_properties(
     serialized_item_level_properties: List[Dict[str, Any]] = []
     actors: List[dt.DictFreeForm] = []
     # Get team properties
-    _, team_item_properties_lookup = _get_team_properties_annotation_lookup(
-        client, dataset.team
-    )
+    properties_cache = properties_cache or _ImportPropertiesCache(client, dataset.team)
+    _, team_item_properties_lookup = properties_cache.get_team_properties_lookups()
     for item_property_value in item_property_values:
         item_property = team_item_properties_lookup[item_property_value["name"]]
         item_property_id = item_property.id
@@ -542,6 +622,7 @@ def _import_properties(
     annotations: List[dt.Annotation],
     annotation_class_ids_map: Dict[Tuple[str, str], str],
     dataset: "RemoteDataset",
+    properties_cache: Optional[_ImportPropertiesCache] = None,
 ) -> Dict[str, Dict[str, Dict[str, Set[str]]]]:
     """
     Creates/Updates missing/mismatched properties from annotation & metadata.json file to team-properties.
@@ -555,6 +636,7 @@ def _import_properties(
         annotations (List[dt.Annotation]): List of annotations
         annotation_class_ids_map (Dict[Tuple[str, str], str]): Dict of annotation class names/types to annotation class ids
         dataset (RemoteDataset): RemoteDataset object
+        properties_cache (Optional[_ImportPropertiesCache]): Cache of the team properties and metadata files of the import
 
     Raises:
         ValueError: raise error if annotation class not present in metadata and in team-properties
@@ -567,14 +649,18 @@ def _import_properties(
     """
     annotation_property_map: Dict[str, Dict[str, Dict[str, Set[str]]]] = {}
 
+    properties_cache = properties_cache or _ImportPropertiesCache(client, dataset.team)
+
     # Parse metadata
-    metadata_property_classes, metadata_item_props = _parse_metadata_file(metadata_path)
+    metadata_property_classes, metadata_item_props = (
+        properties_cache.parse_metadata_file(metadata_path)
+    )
 
     # Get team properties
     (
         team_properties_annotation_lookup,
         team_item_properties_lookup,
-    ) = _get_team_properties_annotation_lookup(client, dataset.team)
+    ) = properties_cache.get_team_properties_lookups()
 
     # Build metadata lookups
     (
@@ -878,10 +964,12 @@ def _import_properties(
             updated_properties.append(prop)
 
     # get latest team properties
+    if created_properties or updated_properties:
+        properties_cache.invalidate_team_properties()
     (
         team_properties_annotation_lookup,
         team_item_properties_lookup,
-    ) = _get_team_properties_annotation_lookup(client, dataset.team)
+    ) = properties_cache.get_team_properties_lookups()
 
     # Update item-level properties from annotations
     _, item_properties_to_update_from_annotations = _create_update_item_properties(
@@ -910,10 +998,12 @@ def _import_properties(
             updated_properties.append(prop)
 
     # get latest team properties
+    if item_properties_to_update_from_annotations:
+        properties_cache.invalidate_team_properties()
     (
         team_properties_annotation_lookup,
         team_item_properties_lookup,
-    ) = _get_team_properties_annotation_lookup(client, dataset.team)
+    ) = properties_cache.get_team_properties_lookups()
 
     # loop over metadata_cls_id_prop_lookup, and update additional metadata property values
     for (annotation_class_id, prop_name), m_prop in metadata_cls_id_prop_lookup.items():
@@ -966,6 +1056,7 @@ def _import_properties(
             prop = client.update_property(
                 team_slug=full_property.slug, params=full_property
             )
+            properties_cache.invalidate_team_properties()
 
     # update annotation_property_map with property ids from created_properties & updated_properties
     for annotation_id, _ in annotation_property_map.items():
@@ -1005,9 +1096,10 @@ def _import_properties(
                             ].add(prop_val.id)
                             break
                     break
-    _assign_item_properties_to_dataset(
+    if _assign_item_properties_to_dataset(
         item_properties, team_item_properties_lookup, client, dataset, console
-    )
+    ):
+        properties_cache.invalidate_team_properties()
 
     return annotation_property_map
 
@@ -1125,7 +1217,7 @@ def _assign_item_properties_to_dataset(
     client: "Client",
     dataset: "RemoteDataset",
     console: Console,
-) -> None:
+) -> bool:
     """
     Ensures that all item-level properties to be imported are assigned to the target dataset
 
@@ -1135,7 +1227,11 @@ def _assign_item_properties_to_dataset(
         client (Client): Darwin Client object
         dataset (RemoteDataset): RemoteDataset object
         console (Console): Rich Console
+
+    Returns:
+        bool: Whether any property was updated
     """
+    updated = False
     if item_properties:
         item_properties_set = {prop["name"] for prop in item_properties}
         for item_property in item_properties_set:
@@ -1145,7 +1241,10 @@ def _assign_item_properties_to_dataset(
                         team_item_properties_lookup[team_prop].dataset_ids or []
                     )
                     if dataset.dataset_id not in prop_datasets:
-                        updated_property = team_item_properties_lookup[team_prop]
+                        # Copied, as the lookup may be shared by the items of the import
+                        updated_property = team_item_properties_lookup[
+                            team_prop
+                        ].model_copy(deep=True)
                         updated_property.dataset_ids.append(dataset.dataset_id)
                         updated_property.property_values = (
                             []
@@ -1155,6 +1254,8 @@ def _assign_item_properties_to_dataset(
                             style="info",
                         )
                         client.update_property(dataset.team, updated_property)
+                        updated = True
+    return updated
 
 
 def import_annotations(  # noqa: C901
@@ -1169,6 +1270,7 @@ def import_annotations(  # noqa: C901
     overwrite: bool = False,
     use_multi_cpu: bool = False,
     cpu_limit: Optional[int] = None,
+    batch_size: int = 1,
 ) -> None:
     """
     Imports the given given Annotations into the given Dataset.
@@ -1210,6 +1312,10 @@ def import_annotations(  # noqa: C901
         If ``cpu_limit`` is greater than the number of available CPU cores, it will be set to the number of available cores.
         If ``cpu_limit`` is less than 1, it will be set to CPU count - 2.
         If ``cpu_limit`` is omitted, it will be set to CPU count - 2.
+    batch_size : int, default: 1
+        The maximum number of items whose annotations are imported concurrently, in batches
+        gathered across all the files and kept under ``MAX_PAYLOAD_SIZE`` bytes. If ``1``, the
+        files are imported one after the other, or across ``cpu_limit`` threads.
     Raises
     -------
     ValueError
@@ -1265,31 +1371,51 @@ def import_annotations(  # noqa: C901
     local_files = []
     local_files_missing_remotely = []
 
-    remote_files_targeted_by_import = _get_remote_files_targeted_by_import(
-        importer, file_paths, dataset, console, use_multi_cpu, cpu_limit
-    )
-    (
-        legacy_remote_file_slot_affine_maps,
-        pixdims_and_primary_planes,
-    ) = _get_remote_medical_file_transform_requirements(remote_files_targeted_by_import)
+    is_nifti = importer.__module__ == "darwin.importer.formats.nifti"
+    if is_nifti:
+        from darwin.importer.formats.nifti import parse_path_headers
 
-    if importer.__module__ == "darwin.importer.formats.nifti":
-        maybe_parsed_files: Optional[Iterable[dt.AnnotationFile]] = _find_and_parse(
+        # NIfTI volumes are parsed with the transforms of their remote files, so these
+        # are found from the headers of the import files, without loading the volumes
+        maybe_parsed_files: Optional[Iterable[dt.AnnotationFile]] = [
+            annotation_file
+            for path in _get_files_for_parsing(file_paths)
+            for annotation_file in parse_path_headers(path) or []
+        ]
+    else:
+        maybe_parsed_files = _find_and_parse(
             importer,
             file_paths,
             console,
             use_multi_cpu,
             cpu_limit,
+        )
+
+    remote_files_targeted_by_import = _get_remote_files_targeted_by_import(
+        importer,
+        file_paths,
+        dataset,
+        console,
+        use_multi_cpu,
+        cpu_limit,
+        parsed_files=maybe_parsed_files or [],
+    )
+
+    if is_nifti:
+        (
             legacy_remote_file_slot_affine_maps,
             pixdims_and_primary_planes,
+        ) = _get_remote_medical_file_transform_requirements(
+            remote_files_targeted_by_import
         )
-    else:
-        maybe_parsed_files: Optional[Iterable[dt.AnnotationFile]] = _find_and_parse(
+        maybe_parsed_files = _find_and_parse(
             importer,
             file_paths,
             console,
             use_multi_cpu,
             cpu_limit,
+            legacy_remote_file_slot_affine_maps,
+            pixdims_and_primary_planes,
         )
 
     if not maybe_parsed_files:
@@ -1451,13 +1577,27 @@ def import_annotations(  # noqa: C901
         if not continue_to_overwrite:
             return
 
-    def import_annotation(parsed_file):
-        image_id = remote_files[parsed_file.full_path]["item_id"]
+    missing_full_paths = {
+        missing_file.full_path for missing_file in local_files_missing_remotely
+    }
+
+    # Shared by all the items, so team properties and metadata files are not fetched per item
+    properties_cache = _ImportPropertiesCache(dataset.client, dataset.team)
+
+    def get_default_slot_name(parsed_file):
         default_slot_name = remote_files[parsed_file.full_path]["slot_names"][0]
         if parsed_file.slots and parsed_file.slots[0].name:
             default_slot_name = parsed_file.slots[0].name
+        return default_slot_name
+
+    def print_errors(parsed_file, errors):
+        console.print(f"Errors importing {parsed_file.filename}", style="error")
+        for error in errors:
+            console.print(f"\t{error}", style="error")
 
-        metadata_path = is_properties_enabled(parsed_file.path)
+    def import_annotation(parsed_file):
+        image_id = remote_files[parsed_file.full_path]["item_id"]
+        metadata_path = properties_cache.get_metadata_path(parsed_file.path)
 
         errors, _ = _import_annotations(
             dataset.client,
@@ -1466,21 +1606,70 @@ def import_annotations(  # noqa: C901
             attributes,
             parsed_file.annotations,
             parsed_file.item_properties,
-            default_slot_name,
+            get_default_slot_name(parsed_file),
             dataset,
             append,
             delete_for_empty,
             import_annotators,
             import_reviewers,
             metadata_path,
+            properties_cache,
         )
 
         if errors:
-            console.print(f"Errors importing {parsed_file.filename}", style="error")
-            for error in errors:
-                console.print(f"\t{error}", style="error")
+            print_errors(parsed_file, errors)
 
-    def process_local_file(local_file):
+    def get_import_payloads(round_files, progress):
+        for item_id, parsed_file in round_files:
+            try:
+                payload = _get_import_payload(
+                    dataset.client,
+                    remote_classes,
+                    attributes,
+                    parsed_file.annotations,
+                    parsed_file.item_properties,
+                    get_default_slot_name(parsed_file),
+                    dataset,
+                    append,
+                    import_annotators,
+                    import_reviewers,
+                    properties_cache.get_metadata_path(parsed_file.path),
+                    properties_cache,
+                )
+            except Exception as e:
+                # A file that can't be serialized is reported and skipped, like a failed import
+                print_errors(parsed_file, [e])
+                progress.update()
+                continue
+            yield item_id, payload
+
+    def import_annotations_in_batches(parsed_files):
+        # Files targeting an item already in a round are imported in a later round, in their
+        # original order, so that the payloads of an item are imported in order
+        rounds = _split_repeated_items(
+            [
+                (remote_files[parsed_file.full_path]["item_id"], parsed_file)
+                for parsed_file in parsed_files
+            ]
+        )
+        progress = tqdm(
+            total=len(parsed_files), desc="Importing annotations in batches"
+        )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
+            for round_files in rounds:
+                files_by_item_id = dict(round_files)
+                # Payloads are serialized as their batch is filled, so only the payloads of
+                # the batch being imported are held in memory
+                for batch in _get_import_batches(
+                    get_import_payloads(round_files, progress), batch_size
+                ):
+                    item_errors = _import_batch(dataset, batch, executor)
+                    for item_id, errors in item_errors.items():
+                        print_errors(files_by_item_id[item_id], errors)
+                    progress.update(len(batch))
+        progress.close()
+
+    def get_files_to_track(local_file):
         if local_file is None:
             parsed_files = []
         elif not isinstance(local_file, List):
@@ -1488,32 +1677,25 @@ def import_annotations(  # noqa: C901
         else:
             parsed_files = local_file
 
-        # Remove files missing on the server
-        missing_files = [
-            missing_file.full_path for missing_file in local_files_missing_remotely
-        ]
-        parsed_files = [
-            parsed_file
-            for parsed_file in parsed_files
-            if parsed_file.full_path not in missing_files
-        ]
-
-        files_to_not_track = [
-            file_to_track
-            for file_to_track in parsed_files
-            if not (file_to_track.annotations or file_to_track.item_properties)
-            and (not delete_for_empty)
-        ]
-
-        for file in files_to_not_track:
-            console.print(
-                f"{file.filename} has no annotations. Skipping upload...",
-                style="warning",
-            )
+        files_to_track = []
+        for parsed_file in parsed_files:
+            # Remove files missing on the server
+            if parsed_file.full_path in missing_full_paths:
+                continue
+            if (
+                not (parsed_file.annotations or parsed_file.item_properties)
+                and not delete_for_empty
+            ):
+                console.print(
+                    f"{parsed_file.filename} has no annotations. Skipping upload...",
+                    style="warning",
+                )
+                continue
+            files_to_track.append(parsed_file)
+        return files_to_track
 
-        files_to_track = [
-            file for file in parsed_files if file not in files_to_not_track
-        ]
+    def process_local_file(local_file):
+        files_to_track = get_files_to_track(local_file)
         if files_to_track:
             _warn_unsupported_annotations(files_to_track)
 
@@ -1543,7 +1725,17 @@ def import_annotations(  # noqa: C901
                 ):
                     import_annotation(file)
 
-    if use_multi_cpu:
+    if batch_size > 1:
+        # Items are batched across all the local files, which often hold a single item each
+        files_to_track = [
+            file
+            for local_file in local_files
+            for file in get_files_to_track(local_file)
+        ]
+        if files_to_track:
+            _warn_unsupported_annotations(files_to_track)
+            import_annotations_in_batches(files_to_track)
+    elif use_multi_cpu:
         with concurrent.futures.ThreadPoolExecutor(max_workers=cpu_limit) as executor:
             futures = [
                 executor.submit(process_local_file, local_file)
@@ -1790,8 +1982,8 @@ def _parse_empty_masks(
         # build a dict of frame_index: set of dense_rle_ids (for each frame in VideoAnnotation object)
         raster_layer_dense_rle_ids_frames = {}
         for frame_index, _rl in raster_layer.frames.items():
-            raster_layer_dense_rle_ids_frames[frame_index] = set(
-                _rl.data["dense_rle"][::2]
+            raster_layer_dense_rle_ids_frames[frame_index] = get_dense_rle_labels(
+                _rl.data["dense_rle"]
             )
 
         # check every frame
@@ -1821,7 +2013,9 @@ def _parse_empty_masks(
         assert isinstance(raster_layer, dt.Annotation)
 
         # build a set of dense_rle_ids (for the Annotation object)
-        raster_layer_dense_rle_ids = set(raster_layer.data["dense_rle"][::2])
+        raster_layer_dense_rle_ids = get_dense_rle_labels(
+            raster_layer.data["dense_rle"]
+        )
 
         # check the annotation (i.e. mask)
         # - if the 'annotation_class_id' is in raster_layer's mask_annotation_ids_mapping dict
@@ -1856,10 +2050,40 @@ def _import_annotations(
     import_annotators: bool,
     import_reviewers: bool,
     metadata_path: Union[Path, bool] = False,
+    properties_cache: Optional[_ImportPropertiesCache] = None,
 ) -> Tuple[dt.ErrorList, dt.Success]:
-    errors: dt.ErrorList = []
-    success: dt.Success = dt.Success.SUCCESS
+    payload = _get_import_payload(
+        client,
+        remote_classes,
+        attributes,
+        annotations,
+        item_properties,
+        default_slot_name,
+        dataset,
+        append,
+        import_annotators,
+        import_reviewers,
+        metadata_path,
+        properties_cache,
+    )
+    return _send_import_payload(dataset, id, payload)
 
+
+def _get_import_payload(
+    client: "Client",
+    remote_classes: dt.DictFreeForm,
+    attributes: dt.DictFreeForm,
+    annotations: List[dt.Annotation],
+    item_properties: List[Dict[str, str]],
+    default_slot_name: str,
+    dataset: "RemoteDataset",
+    append: bool,
+    import_annotators: bool,
+    import_reviewers: bool,
+    metadata_path: Union[Path, bool] = False,
+    properties_cache: Optional[_ImportPropertiesCache] = None,
+) -> dt.DictFreeForm:
+    properties_cache = properties_cache or _ImportPropertiesCache(client, dataset.team)
     raster_layer: Optional[dt.Annotation] = None
     raster_layer_dense_rle_ids: Optional[Set[str]] = None
     raster_layer_dense_rle_ids_frames: Optional[Dict[int, Set[str]]] = None
@@ -1949,17 +2173,31 @@ def _import_annotations(
         annotations,  # type: ignore
         annotation_class_ids_map,
         dataset,
+        properties_cache,
     )
 
     _update_payload_with_properties(serialized_annotations, annotation_id_property_map)
     serialized_item_level_properties = _serialize_item_level_properties(
-        item_properties, client, dataset, import_annotators, import_reviewers
+        item_properties,
+        client,
+        dataset,
+        import_annotators,
+        import_reviewers,
+        properties_cache,
     )
 
     payload: dt.DictFreeForm = {"annotations": serialized_annotations}
     if serialized_item_level_properties:
         payload["properties"] = serialized_item_level_properties
     payload["overwrite"] = _get_overwrite_value(append)
+    return payload
+
+
+def _send_import_payload(
+    dataset: "RemoteDataset", id: Union[str, int], payload: dt.DictFreeForm
+) -> Tuple[dt.ErrorList, dt.Success]:
+    errors: dt.ErrorList = []
+    success: dt.Success = dt.Success.SUCCESS
 
     try:
         dataset.import_annotation(id, payload=payload)
@@ -1981,6 +2219,114 @@ def _import_annotations(
     return errors, success
 
 
+def _get_import_batches(
+    payloads: Iterable[Tuple[dt.ItemId, dt.DictFreeForm]],
+    batch_size: int,
+    max_payload_size: int = MAX_PAYLOAD_SIZE,
+) -> Iterator[List[Tuple[dt.ItemId, dt.DictFreeForm]]]:
+    """
+    Groups the import payloads of several items into batches of at most ``batch_size`` items whose
+    combined size stays under ``max_payload_size``, sized the same way as ``_split_payloads``.
+    Payloads are only read from ``payloads`` as the current batch is filled.
+
+    Parameters
+    ----------
+    payloads : Iterable[Tuple[dt.ItemId, dt.DictFreeForm]]
+        The id of each item and its import payload.
+    batch_size : int
+        The maximum number of items in a batch.
+    max_payload_size : int, default: MAX_PAYLOAD_SIZE
+        The maximum size in bytes of the payloads of a batch.
+
+    Yields
+    ------
+    List[Tuple[dt.ItemId, dt.DictFreeForm]]
+        The batches. Items whose payload alone exceeds ``max_payload_size`` are in batches of their
+        own, so they can be split by ``_send_import_payload``.
+    """
+    current_batch: List[Tuple[dt.ItemId, dt.DictFreeForm]] = []
+    current_batch_size = 0
+
+    for item_id, payload in payloads:
+        payload_size = _get_payload_size(payload)
+        if current_batch and (
+            len(current_batch) >= batch_size
+            or current_batch_size + payload_size >= max_payload_size
+        ):
+            yield current_batch
+            current_batch = []
+            current_batch_size = 0
+        current_batch.append((item_id, payload))
+        current_batch_size += payload_size
+
+    if current_batch:
+        yield current_batch
+
+
+def _split_repeated_items(entries: List[Tuple]) -> List[List[Tuple]]:
+    """
+    Splits entries starting with an item id into rounds in which each item appears at most once,
+    the n-th entry of an item being in the n-th round. The order of the entries is kept within
+    each round.
+
+    Parameters
+    ----------
+    entries : List[Tuple]
+        Entries whose first element is the id of an item.
+
+    Returns
+    -------
+    List[List[Tuple]]
+        The rounds of entries.
+    """
+    rounds: List[List[Tuple]] = []
+    occurrences: Dict[dt.ItemId, int] = defaultdict(int)
+    for entry in entries:
+        round_index = occurrences[entry[0]]
+        occurrences[entry[0]] += 1
+        if round_index == len(rounds):
+            rounds.append([])
+        rounds[round_index].append(entry)
+    return rounds
+
+
+def _import_batch(
+    dataset: "RemoteDataset",
+    batch: List[Tuple[dt.ItemId, dt.DictFreeForm]],
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> Dict[dt.ItemId, dt.ErrorList]:
+    """
+    Imports the annotations of a batch of distinct items through the import endpoint of each item.
+
+    The requests of the batch are sent concurrently on ``executor``, over the pooled connections
+    of the client, so the time to import a batch is about one round-trip instead of one per item.
+
+    Parameters
+    ----------
+    dataset : RemoteDataset
+        The dataset of the items.
+    batch : List[Tuple[dt.ItemId, dt.DictFreeForm]]
+        The id of each item and its import payload. An item must appear only once.
+    executor : Optional[concurrent.futures.Executor], default: None
+        The executor sending the requests. If ``None`` they are sent one after the other.
+
+    Returns
+    -------
+    Dict[dt.ItemId, dt.ErrorList]
+        The errors of each item that could not be imported.
+    """
+
+    def import_item(
+        entry: Tuple[dt.ItemId, dt.DictFreeForm]
+    ) -> Tuple[dt.ErrorList, dt.Success]:
+        return _send_import_payload(dataset, *entry)
+
+    results = executor.map(import_item, batch) if executor else map(import_item, batch)
+    return {
+        item_id: errors for (item_id, _), (errors, _) in zip(batch, results) if errors
+    }
+
+
 # mypy: ignore-errors
 def _console_theme() -> Theme:
     return Theme(
@@ -1993,17 +2339,62 @@ def _console_theme() -> Theme:
     )
 
 
+def _get_item_overwrite_state(
+    client: "Client",
+    dataset: "RemoteDataset",
+    item_id: str,
+    check_item_properties: bool,
+) -> Tuple[bool, bool]:
+    """
+    Returns whether a dataset item has annotations, and whether it has populated item-level
+    properties, that an import would overwrite.
+
+    Parameters
+    ----------
+    client : Client
+        The Darwin Client object.
+    dataset : RemoteDataset
+        The dataset of the item.
+    item_id : str
+        The ID of the item.
+    check_item_properties : bool
+        Whether to check the item-level properties, which is only needed if the import sets any.
+
+    Returns
+    -------
+    Tuple[bool, bool]
+        Whether the item has annotations, and whether it has populated item-level properties.
+    """
+    remote_annotations = client.api_v2._get_remote_annotations(item_id, dataset.team)
+    if not check_item_properties:
+        return bool(remote_annotations), False
+
+    response: Dict[str, List[Dict[str, str]]] = (
+        client.api_v2._get_properties_state_for_item(item_id, dataset.team)
+    )
+    has_item_properties = any(
+        property_data["values"] for property_data in response["properties"]
+    )
+    return bool(remote_annotations), has_item_properties
+
+
 def _overwrite_warning(
     client: "Client",
     dataset: "RemoteDataset",
     local_files: List[dt.AnnotationFile],
     remote_files: Dict[str, Dict[str, Any]],
     console: Console,
+    max_workers: int = OVERWRITE_CHECK_MAX_WORKERS,
+    max_listed_files: Optional[int] = OVERWRITE_WARNING_MAX_LISTED_FILES,
 ) -> bool:
     """
     Determines if any dataset items targeted for import already have annotations or item-level properties that will be overwritten.
     If they do, a warning is displayed to the user and they are prompted to confirm if they want to proceed with the import.
 
+    The items are checked concurrently. Once ``max_listed_files`` items to list were found for
+    every kind of overwrite that can still occur, the remaining items are not checked, since the
+    user would be asked the same question.
+
     Parameters
     ----------
     client : Client
@@ -2016,60 +2407,123 @@ def _overwrite_warning(
         A dictionary of the remote files in the dataset.
     console : Console
         The console object.
+    max_workers : int, default: OVERWRITE_CHECK_MAX_WORKERS
+        Maximum number of items checked at the same time.
+    max_listed_files : Optional[int], default: OVERWRITE_WARNING_MAX_LISTED_FILES
+        Maximum number of items listed for each kind of overwrite. All the items are checked and
+        listed if ``None``.
 
     Returns
     -------
     bool
         True if the user wants to proceed with the import, False otherwise.
     """
-    files_with_annotations_to_overwrite = []
-    files_with_item_properties_to_overwrite = []
-
+    # Several annotation files can target the same item, which only needs to be checked once
+    item_ids: Dict[str, str] = {}
+    full_paths_with_item_properties: Set[str] = set()
     for local_file in local_files:
-        item_id = remote_files.get(local_file.full_path)["item_id"]  # type: ignore
+        item_ids[local_file.full_path] = remote_files[local_file.full_path]["item_id"]
+        if local_file.item_properties:
+            full_paths_with_item_properties.add(local_file.full_path)
 
-        # Check if the item has annotations that will be overwritten
-        remote_annotations = client.api_v2._get_remote_annotations(
-            item_id,
-            dataset.team,
+    files_with_annotations_to_overwrite: Set[str] = set()
+    files_with_item_properties_to_overwrite: Set[str] = set()
+    unchecked_files_with_item_properties = len(full_paths_with_item_properties)
+
+    def is_listing_complete() -> bool:
+        if max_listed_files is None:
+            return False
+        return len(files_with_annotations_to_overwrite) >= max_listed_files and (
+            len(files_with_item_properties_to_overwrite) >= max_listed_files
+            or unchecked_files_with_item_properties == 0
         )
-        if (
-            remote_annotations
-            and local_file.full_path not in files_with_annotations_to_overwrite
-        ):
-            files_with_annotations_to_overwrite.append(local_file.full_path)
 
-        # Check if the item has item-level properties that will be overwritten
-        if local_file.item_properties:
-            response: Dict[str, List[Dict[str, str]]] = (
-                client.api_v2._get_properties_state_for_item(item_id, dataset.team)
+    stopped_early = False
+    items_to_check = iter(item_ids.items())
+    pending: Dict[concurrent.futures.Future, str] = {}
+
+    def submit_next_check(executor: concurrent.futures.ThreadPoolExecutor) -> None:
+        # Checks are submitted as others complete, so none are left queued when stopping early
+        for full_path, item_id in items_to_check:
+            future = executor.submit(
+                _get_item_overwrite_state,
+                client,
+                dataset,
+                item_id,
+                full_path in full_paths_with_item_properties,
             )
-            item_property_ids_with_populated_values = [
-                property_data["id"]
-                for property_data in response["properties"]
-                if property_data["values"]
-            ]
-            if item_property_ids_with_populated_values:
-                files_with_item_properties_to_overwrite.append(local_file.full_path)
+            pending[future] = full_path
+            return
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers
+    ) as executor, tqdm(
+        total=len(item_ids), desc="Checking for annotations to overwrite"
+    ) as progress:
+        for _ in range(max_workers):
+            submit_next_check(executor)
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                full_path = pending.pop(future)
+                has_annotations, has_item_properties = future.result()
+                if has_annotations:
+                    files_with_annotations_to_overwrite.add(full_path)
+                if has_item_properties:
+                    files_with_item_properties_to_overwrite.add(full_path)
+                if full_path in full_paths_with_item_properties:
+                    unchecked_files_with_item_properties -= 1
+                progress.update()
+            if progress.n < len(item_ids) and is_listing_complete():
+                stopped_early = True
+                break
+            for _ in done:
+                submit_next_check(executor)
 
     if files_with_annotations_to_overwrite or files_with_item_properties_to_overwrite:
+        # Keep the order of the local files in the listings
+        ordered_full_paths = list(item_ids)
+        count_prefix = "At least" if stopped_early else "The following"
+
         # Overwriting of annotations
         if files_with_annotations_to_overwrite:
+            files = [
+                full_path
+                for full_path in ordered_full_paths
+                if full_path in files_with_annotations_to_overwrite
+            ][:max_listed_files]
             console.print(
-                f"The following {len(files_with_annotations_to_overwrite)} dataset item(s) have annotations that will be overwritten by this import:",
+                f"{count_prefix} {len(files_with_annotations_to_overwrite)} dataset item(s) have annotations that will be overwritten by this import:",
                 style="warning",
             )
-            for file in files_with_annotations_to_overwrite:
+            for file in files:
                 console.print(f"- {file}", style="warning")
+            if len(files) < len(files_with_annotations_to_overwrite):
+                console.print(
+                    f"- ... and {len(files_with_annotations_to_overwrite) - len(files)} more",
+                    style="warning",
+                )
 
         # Overwriting of item-level-properties
         if files_with_item_properties_to_overwrite:
+            files = [
+                full_path
+                for full_path in ordered_full_paths
+                if full_path in files_with_item_properties_to_overwrite
+            ][:max_listed_files]
             console.print(
-                f"The following {len(files_with_item_properties_to_overwrite)} dataset item(s) have item-level properties that will be overwritten by this import:",
+                f"{count_prefix} {len(files_with_item_properties_to_overwrite)} dataset item(s) have item-level properties that will be overwritten by this import:",
                 style="warning",
             )
-            for file in files_with_item_properties_to_overwrite:
+            for file in files:
                 console.print(f"- {file}", style="warning")
+            if len(files) < len(files_with_item_properties_to_overwrite):
+                console.print(
+                    f"- ... and {len(files_with_item_properties_to_overwrite) - len(files)} more",
+                    style="warning",
+                )
 
         proceed = input("Do you want to proceed with the import? [y/N] ")
         if proceed.lower() != "y":
@@ -2293,8 +2747,12 @@ def _warn_for_annotations_with_multiple_instance_ids(
             )
 
 
+def _get_payload_size(payload: Dict[str, Any]) -> int:
+    return len(json.dumps(payload).encode("utf-8"))
+
+
 def _split_payloads(
-    payload: Dict[str, Any], max_payload_size: int = 32_000_000
+    payload: Dict[str, Any], max_payload_size: int = MAX_PAYLOAD_SIZE
 ) -> List[Dict[str, Any]]:
     """
     This function takes an input payload and splits it into smaller payloads, ensuring each chunk does not exceed the specified maximum size.
@@ -2323,7 +2781,7 @@ def _split_payloads(
     current_payload_size = 0
 
     for annotation in payload["annotations"]:
-        annotation_size = len(json.dumps({"annotations": [annotation]}).encode("utf-8"))
+        annotation_size = _get_payload_size({"annotations": [annotation]})
         if current_payload_size + annotation_size < max_payload_size:
             current_payload["annotations"].append(annotation)
             current_payload_size += annotation_size
@@ -2353,6 +2811,7 @@ def _get_remote_files_targeted_by_import(
     console: Optional[Console] = None,
     use_multi_cpu: bool = True,
     cpu_limit: int = 1,
+    parsed_files: Optional[Iterable[dt.AnnotationFile]] = None,
 ) -> List[DatasetItem]:
     """
     Parses local annotations files for import and returns a list of remote dataset items
@@ -2372,6 +2831,9 @@ def _get_remote_files_targeted_by_import(
         Whether to use multi-CPU processing
     cpu_limit: int
         The number of CPUs to use for processing
+    parsed_files: Optional[Iterable[dt.AnnotationFile]]
+        The files already parsed from ``file_paths``, so they are not parsed again. Only their
+        ``filename`` and ``full_path`` are used. If not given, ``file_paths`` are parsed
     Returns
     -------
     List[DatasetItem]
@@ -2381,18 +2843,20 @@ def _get_remote_files_targeted_by_import(
     ValueError
         If no files could be parsed or if the URL becomes too long even with minimum chunk size
     """
-    maybe_parsed_files = _find_and_parse(
-        importer,
-        file_paths,
-        console,
-        use_multi_cpu,
-        cpu_limit,
-    )
+    maybe_parsed_files = parsed_files
+    if maybe_parsed_files is None:
+        maybe_parsed_files = _find_and_parse(
+            importer,
+            file_paths,
+            console,
+            use_multi_cpu,
+            cpu_limit,
+        )
     if not maybe_parsed_files:
         raise ValueError("Not able to parse any files.")
 
     remote_filenames = list({file.filename for file in maybe_parsed_files})
-    remote_filepaths = [file.full_path for file in maybe_parsed_files]
+    remote_filepaths = {file.full_path for file in maybe_parsed_files}
 
     all_remote_files: List[DatasetItem] = []
     current_chunk: List[str] = []
@@ -312,6 +312,12 @@ class Options:
             default=10,
             help="Time to wait between retries of checking if the release is ready for download.",
         )
+        parser_pull.add_argument(
+            "--incremental",
+            action="store_true",
+            default=False,
+            help="Only update the items added, changed or removed since the previous pull.",
+        )
         slots_group = parser_pull.add_mutually_exclusive_group()
         slots_group.add_argument(
             "--force-slots",
@@ -390,6 +396,13 @@ class Options:
             help="Limits amount of cores used on machine to process results, default to single core",
         )
 
+        parser_import.add_argument(
+            "--batch-size",
+            type=int,
+            default=1,
+            help="Number of items whose annotations are imported concurrently, default to one item at a time",
+        )
+
         # Convert
         parser_convert = dataset_action.add_parser(
             "convert", help="Converts darwin json to other annotation formats."
@@ -600,6 +613,80 @@ class Options:
             action="store_true",
             help="Checks video for errors and attempts to repair them",
         )
+        parser_video.add_argument(
+            "--single-decode",
+            action="store_true",
+            help="Extracts segments and frames while decoding the video only once",
+        )
+
+        # Video artifacts of many videos
+        parser_video_batch = extract_subparsers.add_parser(
+            "video-artifacts-batch",
+            help="Extract video artifacts of many videos for read-only registration in the Darwin platform",
+            description="Process the videos of a directory or of a manifest file in parallel jobs, "
+            "skipping the videos whose artifacts are up to date, and write a registration manifest "
+            "listing the registration payloads of all videos.",
+        )
+        parser_video_batch.add_argument(
+            "source",
+            type=str,
+            help="Directory of the videos, or file listing one video path per line",
+        )
+        parser_video_batch.add_argument(
+            "-p",
+            "--storage-key-prefix",
+            type=str,
+            required=True,
+            help="Storage key prefix for generated files",
+        )
+        parser_video_batch.add_argument(
+            "-o",
+            "--output-dir",
+            type=str,
+            required=True,
+            help="Output directory for artifacts",
+        )
+        parser_video_batch.add_argument(
+            "-f",
+            "--fps",
+            type=float,
+            default=0.0,
+            help="Desired output FPS (0.0 for native)",
+        )
+        parser_video_batch.add_argument(
+            "-s",
+            "--segment-length",
+            type=int,
+            default=2,
+            help="Length of each segment in seconds",
+        )
+        parser_video_batch.add_argument(
+            "--repair",
+            action="store_true",
+            help="Checks videos for errors and attempts to repair them",
+        )
+        parser_video_batch.add_argument(
+            "--single-decode",
+            action="store_true",
+            help="Extracts segments and frames while decoding each video only once",
+        )
+        parser_video_batch.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            help="Number of videos processed at the same time. Defaults to the number of CPUs divided by the threads per job",
+        )
+        parser_video_batch.add_argument(
+            "-t",
+            "--threads-per-job",
+            type=int,
+            help="Maximum number of threads of each job. Defaults to the number of CPUs divided by the jobs",
+        )
+        parser_video_batch.add_argument(
+            "--force",
+            action="store_true",
+            help="Processes videos even if their artifacts are up to date",
+        )
 
         argcomplete.autocomplete(self.parser)
 
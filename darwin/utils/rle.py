@@ -0,0 +1,87 @@
+from typing import Dict, Optional, Sequence, Set, Union
+
+import numpy as np
+import numpy.typing as npt
+
+
+def decode_dense_rle(
+    rle: Sequence[int],
+    width: int,
+    height: int,
+    label_map: Optional[Dict[int, int]] = None,
+    dtype: npt.DTypeLike = np.uint8,
+) -> np.ndarray:
+    """
+    Decodes a dense run-length encoding, as found in the ``dense_rle`` of raster layers, into a
+    mask.
+
+    Parameters
+    ----------
+    rle : Sequence[int]
+        Pairs of ``label, run length`` integers, covering the mask row by row.
+    width : int
+        Width of the mask.
+    height : int
+        Height of the mask.
+    label_map : Optional[Dict[int, int]], default: None
+        Value to write in the mask for each label. Labels are written as they are if not given.
+    dtype : npt.DTypeLike, default: np.uint8
+        Type of the mask, which must hold every value written to it.
+
+    Returns
+    -------
+    np.ndarray
+        The mask of shape ``(height, width)``.
+
+    Raises
+    ------
+    ValueError
+        If ``rle`` does not have an even number of integers, has negative run lengths or does not
+        cover exactly ``width * height`` pixels.
+    KeyError
+        If a label is not in ``label_map``.
+    """
+    if len(rle) % 2 != 0:
+        raise ValueError("RLE must be a list of pairs of integers.")
+
+    total_pixels = width * height
+    pairs = np.asarray(rle, dtype=np.int64).reshape(-1, 2)
+    if (pairs[:, 1] < 0).any():
+        raise ValueError("RLE run lengths must not be negative.")
+    decoded_pixels = int(pairs[:, 1].sum())
+    if decoded_pixels != total_pixels:
+        raise ValueError(
+            f"RLE covers {decoded_pixels} pixels instead of the {total_pixels} of a {width}x{height} mask."
+        )
+
+    labels, counts = pairs[:, 0], pairs[:, 1]
+    if label_map is not None:
+        unique_labels, label_indices = np.unique(labels, return_inverse=True)
+        values = np.array(
+            [label_map[label] for label in unique_labels.tolist()], dtype=dtype
+        )[label_indices]
+    else:
+        values = labels.astype(dtype)
+
+    # The runs cover the mask exactly, so the repeated values are the only array of pixels
+    return np.repeat(values, counts).reshape(height, width)
+
+
+def get_dense_rle_labels(rle: Union[Sequence[int], np.ndarray]) -> Set[int]:
+    """
+    Returns the labels found in a dense run-length encoding.
+
+    Parameters
+    ----------
+    rle : Union[Sequence[int], np.ndarray]
+        Pairs of ``label, run length`` integers.
+
+    Returns
+    -------
+    Set[int]
+        The distinct labels.
+    """
+    if isinstance(rle, np.ndarray):
+        return set(np.unique(rle[::2]).tolist())
+    # Building a set straight from a list is faster than converting it to an array first
+    return set(rle[::2])
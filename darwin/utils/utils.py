@@ -319,7 +319,7 @@ def find_files(
         else:
             raise UnsupportedFileType(path)
 
-    files_to_exclude_full_paths = [str(Path(f)) for f in files_to_exclude]
+    files_to_exclude_full_paths = {str(Path(f)) for f in files_to_exclude}
     filtered_files = [
         f for f in found_files if str(f) not in files_to_exclude_full_paths
     ]
@@ -9,6 +9,7 @@ from rich.console import Console
 from darwin.cli_functions import (
     delete_files,
     extract_video_artifacts,
+    extract_video_artifacts_batch,
     set_file_status,
     upload_data,
 )
@@ -446,5 +447,21 @@ class TestExtractVideo:
                 fps=30.0,
                 segment_length=2,
                 repair=False,
+                single_decode=False,
                 storage_key_prefix="test/prefix",
             )
+
+    def test_extract_video_batch_exits_on_failures(self, tmp_path):
+        with patch(
+            "darwin.extractor.video.extract_artifacts_batch",
+            return_value={
+                "items": [{}],
+                "failed": [{"name": "broken.mp4", "error": "Invalid data"}],
+            },
+        ) as mock_extract, patch("sys.exit") as exit:
+            extract_video_artifacts_batch(
+                str(tmp_path), str(tmp_path), storage_key_prefix="test/prefix"
+            )
+
+        assert mock_extract.call_args.kwargs["max_workers"] is None
+        exit.assert_called_once_with(1)
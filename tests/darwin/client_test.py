@@ -1,3 +1,6 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import List
 
@@ -608,7 +611,7 @@ class TestClientRetry:
         mock_response.headers = {}
         mock_response.raise_for_status.side_effect = HTTPError(response=mock_response)
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value = mock_response
 
             with pytest.raises(RetryError):
@@ -680,3 +683,146 @@ class TestClientRetry:
 
             assert mock_get.call_count == MAX_RETRIES
             assert mock_sleep.called
+
+
+class _JsonHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b'{"result": "' + b"x" * 5000 + b'"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+class TestClientTransport:
+    @pytest.fixture
+    def client(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _JsonHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        config = Mock(spec=Config)
+        api_url = f"http://127.0.0.1:{server.server_address[1]}/api/"
+        config.get.side_effect = lambda key, default=None: {
+            "global/api_endpoint": api_url,
+            "global/payload_compression_level": "0",
+        }.get(key, default)
+        config.get_team.return_value = Mock(api_key="test-key", slug="test-team")
+        yield Client(config=config, default_team="test-team")
+
+        server.shutdown()
+        server.server_close()
+
+    def test_all_verbs_reuse_pooled_connection(self, client):
+        client._get("/get")
+        client._post("/post", {"test": "data"})
+        client._put("/put", {"test": "data"})
+        client._delete("/delete")
+
+        assert client.connection_stats.requests == 4
+        assert client.connection_stats.new_connections == 1
+        assert client.connection_stats.reused_connections == 3
+
+    def test_debug_logs_are_truncated(self, client, caplog):
+        with caplog.at_level(logging.DEBUG, logger="darwin"):
+            client._post("/post", {"items": list(range(10000))})
+
+        message = caplog.records[-1].getMessage()
+        assert "Client POST request response" in message
+        assert len(message) < 3000
+
+    def test_debug_logs_are_not_formatted_when_disabled(self, client):
+        client.log = Mock(spec=logging.Logger)
+        client.log.isEnabledFor.return_value = False
+
+        client._post("/post", {"test": "data"})
+
+        client.log.debug.assert_not_called()
+
+
+class TestGetHeaders:
+    @pytest.fixture
+    def client(self) -> Client:
+        config = Config(path=None)
+        config.set_team(team="team-a", api_key="key-a", datasets_dir="/tmp/a")
+        config.set_team(team="team-b", api_key="key-b", datasets_dir="/tmp/b")
+        config.set_global(
+            api_endpoint="http://localhost/api/",
+            base_url="http://localhost",
+            default_team="team-a",
+        )
+        return Client(config=config)
+
+    def test_caches_headers_per_team(self, client: Client) -> None:
+        with patch.object(
+            client.config, "get_team", wraps=client.config.get_team
+        ) as get_team:
+            headers = client._get_headers()
+            assert client._get_headers() is headers
+            assert client._get_headers("team-a") is headers
+            assert client._get_headers("team-b")["Authorization"] == "ApiKey key-b"
+            assert client._get_headers("team-b") is client._get_headers("team-b")
+
+        assert headers["Authorization"] == "ApiKey key-a"
+        assert get_team.call_count == 2
+
+    def test_keeps_compressed_and_auth_token_headers_apart(
+        self, client: Client
+    ) -> None:
+        compressed = client._get_headers(compressed=True)
+        auth_token = client._get_headers(auth_token=True)
+
+        assert compressed["X-Darwin-Payload-Compression-Version"] == "1"
+        assert "X-Darwin-Payload-Compression-Version" not in client._get_headers()
+        assert auth_token == {"Content-Type": "application/json"}
+
+    def test_invalidates_cache_when_config_changes(self, client: Client) -> None:
+        assert client._get_headers("team-b")["Authorization"] == "ApiKey key-b"
+
+        client.config.set_team(team="team-b", api_key="new-key", datasets_dir="/tmp")
+        assert client._get_headers("team-b")["Authorization"] == "ApiKey new-key"
+
+        client.config.put("teams/team-b/api_key", "newer-key")
+        assert client._get_headers("team-b")["Authorization"] == "ApiKey newer-key"
+
+    def test_reads_config_again_only_after_it_changes(self, client: Client) -> None:
+        with patch.object(client.config, "get", wraps=client.config.get) as get:
+            headers = client._get_headers()
+            config_reads = get.call_count
+            assert config_reads > 0
+
+            for _ in range(10):
+                assert client._get_headers() is headers
+            assert get.call_count == config_reads
+
+            revision = client.config.revision
+            client.config.put("teams/team-a/api_key", "new-key")
+            assert client.config.revision != revision
+            assert client._get_headers()["Authorization"] == "ApiKey new-key"
+            assert get.call_count > config_reads
+
+    @responses.activate
+    def test_request_overhead_does_not_grow_with_config_reads(
+        self, client: Client
+    ) -> None:
+        # Microbenchmark of the client side of requests, without network. The config reads are
+        # counted instead of timed, so that it doesn't depend on the machine
+        responses.add(responses.GET, "http://localhost/api/ping", json={})
+        with patch.object(client.config, "get", wraps=client.config.get) as get:
+            client._get("/ping")
+            config_reads = get.call_count
+
+            for _ in range(1000):
+                client._get("/ping")
+
+        assert len(responses.calls) == 1001
+        assert get.call_count == config_reads
@@ -0,0 +1,170 @@
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import orjson as json
+import pytest
+
+from darwin.dataset.annotation_index import AnnotationIndex, get_annotation_index_path
+from darwin.dataset.utils import compute_max_density, extract_classes
+from darwin.utils import parse_darwin_json
+
+
+def _payload(name: str, path: str, annotations: List[Dict[str, Any]]) -> Dict:
+    return {
+        "version": "2.0",
+        "schema_ref": "https://darwin-public.s3.eu-west-1.amazonaws.com/darwin_json/2.0/schema.json",
+        "item": {
+            "name": name,
+            "path": path,
+            "slots": [
+                {
+                    "type": "image",
+                    "slot_name": "0",
+                    "width": 640,
+                    "height": 480,
+                    "source_files": [
+                        {"file_name": name, "url": f"https://example.com/{name}"}
+                    ],
+                }
+            ],
+        },
+        "annotations": annotations,
+    }
+
+
+def _write(path: Path, payload: Dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(json.dumps(payload))
+
+
+POLYGON = {"name": "cat", "polygon": {"paths": [[{"x": 0, "y": 0}]]}}
+BOUNDING_BOX = {"name": "dog", "bounding_box": {"x": 0, "y": 0, "w": 1, "h": 1}}
+TAG = {"name": "outdoor", "tag": {}}
+
+
+@pytest.fixture
+def annotations_path(tmp_path: Path) -> Path:
+    annotations_path = tmp_path / "annotations"
+    _write(annotations_path / "a.json", _payload("a.jpg", "/", [POLYGON, TAG]))
+    _write(
+        annotations_path / "sub" / "b.json",
+        _payload("b.png", "/folder", [POLYGON, POLYGON, BOUNDING_BOX]),
+    )
+    _write(annotations_path / ".v7" / "metadata.json", {"classes": []})
+    return annotations_path
+
+
+def _build_index(annotations_path: Path) -> AnnotationIndex:
+    index = AnnotationIndex(annotations_path)
+    index.update()
+    return index
+
+
+class TestAnnotationIndex:
+    def test_is_stored_next_to_the_annotations_folder(self, annotations_path: Path):
+        _build_index(annotations_path).close()
+
+        assert get_annotation_index_path(annotations_path) == (
+            annotations_path.parent / "annotations.index.sqlite"
+        )
+        assert get_annotation_index_path(annotations_path).is_file()
+
+    def test_load_returns_none_without_index(self, annotations_path: Path):
+        assert AnnotationIndex.load(annotations_path) is None
+
+    def test_matches_unindexed_functions(self, annotations_path: Path):
+        expected_classes = extract_classes(annotations_path, ["polygon", "tag"])
+        expected_density = compute_max_density(annotations_path)
+        _build_index(annotations_path).close()
+
+        with patch("darwin.dataset.utils.parse_path") as parse_mock, patch(
+            "darwin.dataset.utils.parse_darwin_json"
+        ) as parse_json_mock:
+            assert extract_classes(annotations_path, ["polygon", "tag"]) == (
+                expected_classes
+            )
+            assert compute_max_density(annotations_path) == expected_density == 2
+
+        parse_mock.assert_not_called()
+        parse_json_mock.assert_not_called()
+
+    def test_entries(self, annotations_path: Path, tmp_path: Path):
+        index = _build_index(annotations_path)
+        entries = index.entries()
+        index.close()
+
+        entry = entries[str(annotations_path / "sub" / "b.json")]
+        assert entry.annotation_count == 3
+        assert entry.density == 2
+        assert (entry.image_width, entry.image_height) == (640, 480)
+        assert entry.image_path(tmp_path, with_folders=True) == (
+            tmp_path / "folder" / "b.png"
+        )
+        assert entry.image_path(tmp_path, with_folders=False) == tmp_path / "b.png"
+        assert len(entries) == 2
+
+    def test_update_only_parses_changed_files(self, annotations_path: Path):
+        _build_index(annotations_path).close()
+
+        changed_path = annotations_path / "a.json"
+        _write(changed_path, _payload("a.jpg", "/", [BOUNDING_BOX]))
+        stat = changed_path.stat()
+        os.utime(changed_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        (annotations_path / "sub" / "b.json").unlink()
+        _write(annotations_path / "c.json", _payload("c.jpg", "/", [TAG]))
+
+        with patch(
+            "darwin.dataset.annotation_index.parse_darwin_json",
+            wraps=parse_darwin_json,
+        ) as parse_mock:
+            index = AnnotationIndex.load(annotations_path)
+
+        assert index is not None
+        parsed_paths = {call.args[0] for call in parse_mock.call_args_list}
+        assert parsed_paths == {changed_path, annotations_path / "c.json"}
+        assert index.annotation_file_paths() == [
+            str(annotations_path / "a.json"),
+            str(annotations_path / "c.json"),
+        ]
+        classes, _ = index.extract_classes(["bounding_box", "tag"])
+        assert dict(classes) == {"dog": {0}, "outdoor": {1}}
+        index.close()
+
+    def test_update_uses_already_parsed_files(self, annotations_path: Path):
+        annotation_files = [
+            parse_darwin_json(annotations_path / "a.json"),
+            parse_darwin_json(annotations_path / "sub" / "b.json"),
+        ]
+
+        with patch("darwin.dataset.annotation_index.parse_darwin_json") as parse_mock:
+            index = AnnotationIndex(annotations_path)
+            index.update(annotation_files=annotation_files)
+
+        parse_mock.assert_not_called()
+        assert len(index.entries()) == 2
+        index.close()
+
+    def test_add_indexes_files_one_at_a_time(self, annotations_path: Path):
+        index = AnnotationIndex(annotations_path)
+        for path in (annotations_path / "a.json", annotations_path / "sub" / "b.json"):
+            index.add(parse_darwin_json(path))
+        index.close()
+
+        changed_path = annotations_path / "a.json"
+        stat = changed_path.stat()
+        os.utime(changed_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        index = AnnotationIndex(annotations_path)
+        index.refresh_stats([changed_path])
+        index.close()
+
+        with patch("darwin.dataset.annotation_index.parse_darwin_json") as parse_mock:
+            index = AnnotationIndex.load(annotations_path)
+
+        assert index is not None
+        parse_mock.assert_not_called()
+        entries = index.entries()
+        assert entries[str(annotations_path / "sub" / "b.json")].annotation_count == 3
+        assert len(entries) == 2
+        index.close()
@@ -13,12 +13,15 @@ from darwin.dataset.utils import (
     compute_distributions,
     exhaust_generator,
     extract_classes,
+    extract_classes_by_type,
     get_annotations,
     get_external_file_type,
     get_release_path,
+    merge_classes,
     parse_external_file_path,
     sanitize_filename,
 )
+from darwin.importer.formats.darwin import parse_path
 from tests.fixtures import *
 
 
@@ -308,6 +311,112 @@ class TestExtractClasses:
         assert index_dict[1] == {"class_1", "class_5", "class_6"}
 
 
+class TestExtractClassesByType:
+    @pytest.fixture
+    def annotations_path(self, tmp_path: Path):
+        annotations_path = tmp_path / "annotations"
+        annotations_path.mkdir(parents=True)
+        for i, annotations in enumerate(
+            [
+                [
+                    {"name": "class_1", "polygon": {"paths": [[]]}},
+                    {
+                        "name": "class_2",
+                        "bounding_box": {"x": 0, "y": 0, "w": 100, "h": 100},
+                    },
+                    {"name": "class_4", "tag": {}},
+                ],
+                [{"name": "class_3", "tag": {}}],
+                [
+                    {
+                        "name": "class_2",
+                        "bounding_box": {"x": 0, "y": 0, "w": 100, "h": 100},
+                    },
+                    {"name": "class_5", "polygon": {"paths": [[]]}},
+                ],
+            ]
+        ):
+            _create_annotation_file(
+                annotations_path,
+                f"{i}.json",
+                {
+                    "version": "2.0",
+                    "schema_ref": "https://darwin-public.s3.eu-west-1.amazonaws.com/darwin_json/2.0/schema.json",
+                    "item": {
+                        "name": f"{i}.jpg",
+                        "path": "/",
+                        "slots": [
+                            {
+                                "type": "image",
+                                "slot_name": "0",
+                                "source_files": [
+                                    {
+                                        "file_name": f"{i}.jpg",
+                                        "url": f"https://example.com/{i}.jpg",
+                                    }
+                                ],
+                            }
+                        ],
+                    },
+                    "annotations": annotations,
+                },
+            )
+        yield annotations_path
+
+    @pytest.mark.parametrize("multi_processed", [True, False])
+    def test_matches_extract_classes_per_type(
+        self, annotations_path: Path, multi_processed: bool
+    ):
+        annotation_types = ["tag", "polygon", "bounding_box"]
+        with patch("darwin.dataset.utils.MULTI_PROCESSED_MIN_BYTES", 0):
+            classes_per_type = extract_classes_by_type(
+                annotations_path,
+                annotation_types,
+                multi_processed=multi_processed,
+                worker_count=2,
+            )
+
+        for annotation_type in annotation_types:
+            classes, indices_to_classes = extract_classes(
+                annotations_path, annotation_type
+            )
+            assert classes_per_type[annotation_type] == (classes, indices_to_classes)
+        assert dict(classes_per_type["bounding_box"][0]) == {"class_2": {0, 2}}
+
+    def test_parses_small_annotations_in_process(self, annotations_path: Path):
+        with patch("darwin.dataset.utils.mp.Pool") as pool_mock:
+            classes_per_type = extract_classes_by_type(
+                annotations_path, ["bounding_box"], worker_count=2
+            )
+
+        pool_mock.assert_not_called()
+        assert dict(classes_per_type["bounding_box"][0]) == {"class_2": {0, 2}}
+
+    def test_parses_each_file_once(self, annotations_path: Path):
+        with patch(
+            "darwin.dataset.utils.parse_path", wraps=parse_path
+        ) as parse_path_mock:
+            extract_classes_by_type(
+                annotations_path,
+                ["tag", "polygon", "bounding_box"],
+                multi_processed=False,
+            )
+        assert parse_path_mock.call_count == 3
+
+    def test_merge_classes_keeps_file_order(self, annotations_path: Path):
+        classes_per_type = extract_classes_by_type(
+            annotations_path, ["bounding_box", "polygon"], multi_processed=False
+        )
+        classes, indices_to_classes = merge_classes(
+            [classes_per_type["bounding_box"], classes_per_type["polygon"]]
+        )
+
+        assert (classes, indices_to_classes) == extract_classes(
+            annotations_path, ["bounding_box", "polygon"]
+        )
+        assert list(indices_to_classes.keys()) == [0, 2]
+
+
 class TestSanitizeFilename:
     def test_normal_filenames_stay_untouched(self):
         assert sanitize_filename("test.jpg") == "test.jpg"
@@ -0,0 +1,137 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, Set
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from darwin.dataset.download_engine import (
+    DEFAULT_DOWNLOAD_WORKERS,
+    DownloadEngine,
+    DownloadStats,
+    get_download_workers,
+)
+
+BODY = b"x" * 1000
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+    client_ports: Set[int] = set()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+            cls.client_ports.add(self.client_address[1])
+        time.sleep(0.02)
+        with cls.lock:
+            cls.active -= 1
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    _Handler.active = _Handler.max_active = 0
+    _Handler.client_ports = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/file"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client() -> MagicMock:
+    client = MagicMock()
+    client.session = requests.Session()
+    return client
+
+
+def _throw():
+    raise Exception("Test")
+
+
+class TestGetDownloadWorkers:
+    def test_defaults_independently_of_cpu_count(self, monkeypatch):
+        monkeypatch.delenv("DARWIN_DOWNLOAD_FILES_CONCURRENCY", raising=False)
+        assert get_download_workers() == DEFAULT_DOWNLOAD_WORKERS
+
+    def test_reads_environment(self, monkeypatch):
+        monkeypatch.setenv("DARWIN_DOWNLOAD_FILES_CONCURRENCY", "3")
+        assert get_download_workers() == 3
+        assert get_download_workers(5) == 5
+
+    def test_rejects_non_positive_workers(self):
+        with pytest.raises(ValueError):
+            get_download_workers(0)
+
+
+class TestDownloadEngine:
+    def test_passes_back_results_and_exceptions(self, client: MagicMock):
+        engine = DownloadEngine(client, max_workers=2)
+        functions = [lambda: 1] * 5 + [_throw]
+
+        successes, errors = engine.run(functions, 6, progress=False)
+
+        assert successes == [1] * 5
+        assert len(errors) == 1 and errors[0].args[0] == "Test"
+        assert (engine.stats.files, engine.stats.errors) == (5, 1)
+
+    def test_reuses_a_capped_number_of_connections_per_host(
+        self, client: MagicMock, server_url: str
+    ):
+        adapters = dict(client.session.adapters)
+        engine = DownloadEngine(client, max_workers=8, max_connections_per_host=2)
+        functions = [lambda: client.session.get(server_url).content] * 20
+
+        successes, errors = engine.run(functions, 20, progress=False)
+
+        assert errors == []
+        assert successes == [BODY] * 20
+        assert _Handler.max_active <= 2
+        assert len(_Handler.client_ports) <= 2
+        assert engine.stats.bytes == 20 * len(BODY)
+        # The adapters of the client are sized, not replaced
+        assert client.session.adapters == adapters
+        assert client.session.hooks["response"] == []
+
+    def test_keeps_the_retries_of_the_client_adapters(
+        self, client: MagicMock, server_url: str
+    ):
+        adapter = HTTPAdapter(max_retries=Retry(total=3))
+        client.session.mount("http://", adapter)
+        engine = DownloadEngine(client, max_workers=4, max_connections_per_host=2)
+
+        engine.run([lambda: client.session.get(server_url).content] * 4, 4, False)
+
+        assert client.session.adapters["http://"] is adapter
+        assert adapter.max_retries.total == 3
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 2
+
+
+class TestDownloadStats:
+    def test_throughput(self):
+        stats = DownloadStats(files=10, bytes=5_000_000, seconds=2)
+
+        assert stats.files_per_second == 5
+        assert stats.megabytes_per_second == 2.5
+        assert str(stats) == "10 files (5.0 MB) in 2.0s: 5.0 files/s, 2.5 MB/s"
+
+    def test_empty_run(self):
+        assert DownloadStats().files_per_second == 0
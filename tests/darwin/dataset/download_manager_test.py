@@ -1,15 +1,26 @@
+import pickle
 from pathlib import Path
 from typing import Callable, List
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import numpy as np
+import orjson as json
 import pytest
 import responses
 
 from darwin.dataset import download_manager as dm
-from darwin.datatypes import AnnotationClass, AnnotationFile, Slot, SourceFile
+from darwin.datatypes import (
+    AnnotationClass,
+    AnnotationFile,
+    ManifestItem,
+    SegmentManifest,
+    Slot,
+    SourceFile,
+)
 from tests.fixtures import *
 from darwin.client import Client
 from darwin.config import Config
+from darwin.utils import parse_darwin_json
 
 
 @pytest.fixture
@@ -442,3 +453,131 @@ def test__check_for_duplicate_local_filepaths_multiple_duplicates(capsys):
     )
     assert "path/to/file1.jpg is duplicated 2 times" in captured.out
     assert "path/to/file3.jpg is duplicated 3 times" in captured.out
+
+
+def _write_multi_slot_annotation(annotation_path: Path) -> AnnotationFile:
+    raw_annotation = {
+        "version": "2.0",
+        "schema_ref": "https://darwin-public.s3.eu-west-1.amazonaws.com/darwin_json/2.0/schema.json",
+        "item": {
+            "name": "item",
+            "path": "/",
+            "slots": [
+                {
+                    "type": "image",
+                    "slot_name": slot_name,
+                    "source_files": [
+                        {"file_name": f"{slot_name}.jpg", "url": f"http://{slot_name}"}
+                    ],
+                }
+                for slot_name in ["0", "1", "2"]
+            ],
+        },
+        "annotations": [],
+    }
+    annotation_path.write_bytes(json.dumps(raw_annotation))
+    return parse_darwin_json(annotation_path)
+
+
+def test_local_paths_are_written_once_per_annotation(tmp_path: Path) -> None:
+    annotation_path = tmp_path / "item.json"
+    annotation = _write_multi_slot_annotation(annotation_path)
+    download_funcs = dm._download_all_slots_from_json_annotation(
+        annotation, MagicMock(), tmp_path / "images", video_frames=False
+    )
+
+    def download(url: str, path: Path, client) -> None:
+        if url == "http://1":
+            raise Exception("Failed download")
+
+    with patch.object(dm, "_download_image", side_effect=download), patch.object(
+        dm, "_update_local_paths", wraps=dm._update_local_paths
+    ) as update_mock:
+        for download_func in download_funcs:
+            try:
+                download_func()
+            except Exception:
+                pass
+
+    update_mock.assert_called_once()
+    slots = json.loads(annotation_path.read_bytes())["item"]["slots"]
+    local_paths = [slot["source_files"][0].get("local_path") for slot in slots]
+    assert local_paths == [
+        str(tmp_path / "images" / "item" / "0" / "0.jpg"),
+        None,
+        str(tmp_path / "images" / "item" / "2" / "2.jpg"),
+    ]
+
+
+def test_local_path_updates_can_be_sent_to_other_processes(tmp_path: Path) -> None:
+    annotation_path = tmp_path / "item.json"
+    local_path_updates = dm._LocalPathUpdates(
+        _write_multi_slot_annotation(annotation_path)
+    )
+    for _ in range(3):
+        local_path_updates.add()
+
+    # Each copy can't see the downloads of the others, so it writes its path right away
+    for slot_name in ["0", "2"]:
+        copy = pickle.loads(pickle.dumps(local_path_updates))
+        copy.done(f"http://{slot_name}", tmp_path / f"{slot_name}.jpg")
+
+    slots = json.loads(annotation_path.read_bytes())["item"]["slots"]
+    local_paths = [slot["source_files"][0].get("local_path") for slot in slots]
+    assert local_paths == [str(tmp_path / "0.jpg"), None, str(tmp_path / "2.jpg")]
+
+
+@pytest.mark.parametrize(
+    "extraction, extension",
+    [
+        (dm.VideoFrameExtraction(), ".png"),
+        (dm.VideoFrameExtraction(png_compression=0), ".png"),
+        (dm.VideoFrameExtraction("jpeg", jpeg_quality=80), ".jpg"),
+        (dm.VideoFrameExtraction("npy"), ".npy"),
+    ],
+)
+def test_extract_frames_from_segment(
+    tmp_path: Path, extraction: dm.VideoFrameExtraction, extension: str
+) -> None:
+    pytest.importorskip("cv2")
+    frames = [np.full((4, 4, 3), index, dtype=np.uint8) for index in range(3)]
+    capture = MagicMock()
+    capture.isOpened.return_value = True
+    capture.read.side_effect = [(True, frame) for frame in frames] + [(False, None)]
+    manifest = SegmentManifest(
+        slot="0",
+        segment=0,
+        total_frames=3,
+        items=[
+            ManifestItem(0, 0, 0, True, 0.0, 10),
+            ManifestItem(1, 1, 0, False, 0.1, None),
+            ManifestItem(2, 2, 0, True, 0.2, 11),
+        ],
+    )
+
+    with patch("cv2.VideoCapture", return_value=capture):
+        dm._extract_frames_from_segment(tmp_path / ".0000000.ts", manifest, extraction)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f"0000010{extension}",
+        f"0000011{extension}",
+    ]
+    if extension == ".npy":
+        assert (np.load(tmp_path / "0000011.npy") == frames[2]).all()
+    assert extraction.stage_seconds["encode"] > 0
+
+
+def test_video_frame_extraction_can_be_sent_to_other_processes() -> None:
+    extraction = dm.VideoFrameExtraction("jpeg", jpeg_quality=80)
+    extraction.add_time("decode", 1.0)
+
+    copy = pickle.loads(pickle.dumps(extraction))
+    copy.add_time("decode", 2.0)
+
+    assert (copy.frame_format, copy.jpeg_quality) == ("jpeg", 80)
+    assert copy.stage_seconds["decode"] == 3.0
+
+
+def test_video_frame_extraction_rejects_unknown_format() -> None:
+    with pytest.raises(ValueError):
+        dm.VideoFrameExtraction("gif")
@@ -0,0 +1,248 @@
+import base64
+import hashlib
+import re
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+
+import pytest
+import requests
+
+from darwin.dataset.ranged_download import (
+    download_file,
+    get_partial_path,
+    get_progress_path,
+)
+from darwin.exceptions import DownloadVerificationError
+
+CONTENT = bytes(range(256)) * 40
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    supports_ranges = True
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    full_headers: Dict[str, str] = {}
+    failing_starts: Set[int] = set()
+    requested_ranges: List[str] = []
+    if_ranges: List[Optional[str]] = []
+
+    def do_GET(self):
+        cls = type(self)
+        range_header = self.headers.get("Range")
+        match = re.match(r"bytes=(\d+)-(\d+)", range_header or "")
+        if not cls.supports_ranges or not match:
+            self._send(200, CONTENT, cls.full_headers)
+            return
+
+        start, end = int(match.group(1)), int(match.group(2))
+        cls.requested_ranges.append(range_header)
+        cls.if_ranges.append(self.headers.get("If-Range"))
+        if start in cls.failing_starts:
+            self._send(404, b"")
+            return
+        self._send(
+            206,
+            CONTENT[start : end + 1],
+            {"Content-Range": f"bytes {start}-{end}/{len(CONTENT)}"},
+        )
+
+    def _send(self, status: int, body: bytes, headers: Optional[dict] = None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        if type(self).etag:
+            self.send_header("ETag", type(self).etag)
+        if type(self).last_modified:
+            self.send_header("Last-Modified", type(self).last_modified)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def url() -> Iterator[str]:
+    _RangeHandler.supports_ranges = True
+    _RangeHandler.etag = None
+    _RangeHandler.last_modified = None
+    _RangeHandler.full_headers = {}
+    _RangeHandler.failing_starts = set()
+    _RangeHandler.requested_ranges = []
+    _RangeHandler.if_ranges = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/release.zip"
+    server.shutdown()
+    server.server_close()
+
+
+class TestDownloadFile:
+    def test_downloads_in_parallel_chunks(self, url: str, tmp_path: Path):
+        path = tmp_path / "release.zip"
+
+        assert download_file(url, path, chunk_size=1000, max_workers=4) == path
+
+        assert path.read_bytes() == CONTENT
+        # The first request probes the size, then each chunk is requested
+        assert len(_RangeHandler.requested_ranges) == 1 + 11
+        assert not get_partial_path(path).exists()
+        assert not get_progress_path(path).exists()
+
+    @pytest.mark.parametrize(
+        "etag, last_modified, if_range",
+        [
+            ('"v1"', None, '"v1"'),
+            (None, "Wed, 21 Oct 2015 07:28:00 GMT", "Wed, 21 Oct 2015 07:28:00 GMT"),
+            (
+                'W/"v1"',
+                "Wed, 21 Oct 2015 07:28:00 GMT",
+                "Wed, 21 Oct 2015 07:28:00 GMT",
+            ),
+        ],
+    )
+    def test_resumes_interrupted_download(
+        self,
+        url: str,
+        tmp_path: Path,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        if_range: str,
+    ):
+        path = tmp_path / "release.zip"
+        _RangeHandler.etag = etag
+        _RangeHandler.last_modified = last_modified
+        _RangeHandler.failing_starts = {3000}
+
+        with pytest.raises(requests.HTTPError):
+            download_file(url, path, chunk_size=1000, max_workers=1)
+
+        assert not path.exists()
+        assert get_partial_path(path).exists()
+        assert get_progress_path(path).exists()
+
+        _RangeHandler.failing_starts = set()
+        _RangeHandler.requested_ranges = []
+        _RangeHandler.if_ranges = []
+        download_file(url, path, chunk_size=1000, max_workers=1)
+
+        assert path.read_bytes() == CONTENT
+        # The other chunks were downloaded by the first attempt
+        assert _RangeHandler.requested_ranges == ["bytes=0-0", "bytes=3000-3999"]
+        assert _RangeHandler.if_ranges == [None, if_range]
+
+    def test_restarts_interrupted_download_without_validator(
+        self, url: str, tmp_path: Path
+    ):
+        path = tmp_path / "release.zip"
+        _RangeHandler.failing_starts = {3000}
+
+        with pytest.raises(requests.HTTPError):
+            download_file(url, path, chunk_size=1000, max_workers=1)
+
+        _RangeHandler.failing_starts = set()
+        _RangeHandler.requested_ranges = []
+        download_file(url, path, chunk_size=1000, max_workers=1)
+
+        assert path.read_bytes() == CONTENT
+        # The partial file may hold chunks of another version, so every chunk is requested again
+        assert len(_RangeHandler.requested_ranges) == 1 + 11
+
+    def test_restarts_interrupted_download_of_another_version(
+        self, url: str, tmp_path: Path
+    ):
+        path = tmp_path / "release.zip"
+        _RangeHandler.etag = '"v1"'
+        _RangeHandler.failing_starts = {3000}
+
+        with pytest.raises(requests.HTTPError):
+            download_file(url, path, chunk_size=1000, max_workers=1)
+
+        _RangeHandler.etag = '"v2"'
+        _RangeHandler.failing_starts = set()
+        _RangeHandler.requested_ranges = []
+        download_file(url, path, chunk_size=1000, max_workers=1)
+
+        assert path.read_bytes() == CONTENT
+        assert len(_RangeHandler.requested_ranges) == 1 + 11
+
+    def test_streams_without_range_support(self, url: str, tmp_path: Path):
+        path = tmp_path / "release.zip"
+        _RangeHandler.supports_ranges = False
+
+        download_file(url, path, chunk_size=1000)
+
+        assert path.read_bytes() == CONTENT
+
+    def test_does_not_verify_etag_as_md5(self, url: str, tmp_path: Path):
+        path = tmp_path / "release.zip"
+        # Looks like an MD5 checksum, but isn't one, e.g. for an encrypted S3 object
+        _RangeHandler.etag = f'"{hashlib.md5(b"other").hexdigest()}"'
+
+        download_file(url, path, chunk_size=4096)
+
+        assert path.read_bytes() == CONTENT
+
+    def test_verifies_expected_md5(self, url: str, tmp_path: Path):
+        path = tmp_path / "release.zip"
+
+        download_file(
+            url, path, chunk_size=4096, expected_md5=hashlib.md5(CONTENT).hexdigest()
+        )
+        assert path.read_bytes() == CONTENT
+
+        path.unlink()
+        with pytest.raises(DownloadVerificationError):
+            download_file(
+                url,
+                path,
+                chunk_size=4096,
+                expected_md5=hashlib.md5(b"other").hexdigest(),
+            )
+        assert not path.exists()
+        assert not get_partial_path(path).exists()
+
+    @pytest.mark.parametrize(
+        "header, algorithm",
+        [("Content-MD5", "md5"), ("x-amz-checksum-sha256", "sha256")],
+    )
+    def test_verifies_checksum_header(
+        self, url: str, tmp_path: Path, header: str, algorithm: str
+    ):
+        path = tmp_path / "release.zip"
+        _RangeHandler.supports_ranges = False
+
+        def encode(body: bytes) -> str:
+            return base64.b64encode(hashlib.new(algorithm, body).digest()).decode()
+
+        _RangeHandler.full_headers = {header: encode(CONTENT)}
+        download_file(url, path)
+        assert path.read_bytes() == CONTENT
+
+        path.unlink()
+        _RangeHandler.full_headers = {header: encode(b"other")}
+        with pytest.raises(DownloadVerificationError):
+            download_file(url, path)
+        assert not path.exists()
+
+    def test_verifies_crc32_header(self, url: str, tmp_path: Path):
+        path = tmp_path / "release.zip"
+        _RangeHandler.supports_ranges = False
+        crc = zlib.crc32(CONTENT).to_bytes(4, "big")
+        _RangeHandler.full_headers = {
+            "x-amz-checksum-crc32": base64.b64encode(crc).decode()
+        }
+
+        download_file(url, path)
+
+        assert path.read_bytes() == CONTENT
+
+    def test_verifies_expected_size(self, url: str, tmp_path: Path):
+        with pytest.raises(DownloadVerificationError):
+            download_file(url, tmp_path / "release.zip", expected_size=1)
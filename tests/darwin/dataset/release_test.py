@@ -1,10 +1,8 @@
-import shutil
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-import requests
 
 from darwin.dataset.release import Release, ReleaseStatus
 from tests.fixtures import *
@@ -30,8 +28,16 @@ def release(dataset_slug: str, team_slug_darwin_json_v2: str) -> Release:
 
 class TestRelease:
     def test_downloads_zip(self, release: Release, tmp_path: Path):
-        with patch.object(requests, "get") as get:
-            with patch.object(shutil, "copyfileobj") as copyfileobj:
-                release.download_zip(tmp_path / "test.zip")
-                get.assert_called_once_with("http://test.v7labs.com/", stream=True)
-                copyfileobj.assert_called_once()
+        with patch("darwin.dataset.release.download_file") as download_file:
+            release.download_zip(tmp_path / "test.zip")
+            download_file.assert_called_once_with(
+                "http://test.v7labs.com/",
+                tmp_path / "test.zip",
+                max_workers=8,
+                chunk_size=16 * 1024 * 1024,
+            )
+
+    def test_requires_url(self, release: Release, tmp_path: Path):
+        release.url = None
+        with pytest.raises(ValueError):
+            release.download_zip(tmp_path / "test.zip")
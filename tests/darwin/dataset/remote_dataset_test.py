@@ -4,7 +4,7 @@ import types
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 from unittest.mock import MagicMock, patch
 
 import orjson as json
@@ -14,6 +14,7 @@ from pydantic import ValidationError
 from darwin.client import Client
 from darwin.config import Config
 from darwin.dataset import RemoteDataset
+from darwin.dataset.annotation_index import AnnotationIndex
 from darwin.dataset.download_manager import (
     _download_image_from_json_annotation,
     download_all_images_from_annotations,
@@ -29,7 +30,7 @@ from darwin.dataset.upload_manager import (
     LocalFile,
     UploadHandlerV2,
 )
-from darwin.utils.utils import SLOTS_GRID_MAP
+from darwin.utils.utils import SLOTS_GRID_MAP, parse_darwin_json
 from darwin.datatypes import ManifestItem, ObjectStore, SegmentManifest
 from darwin.exceptions import UnsupportedExportFormat, UnsupportedFileType
 from darwin.item import DatasetItem
@@ -1260,6 +1261,216 @@ class TestPull:
                 )
                 assert metadata_path.exists()
 
+    @patch("platform.system", return_value="Linux")
+    def test_parses_each_annotation_file_once(
+        self, system_mock: MagicMock, remote_dataset: RemoteDataset
+    ):
+        stub_release_response = Release(
+            "dataset-slug",
+            "team-slug",
+            "0.1.0",
+            "release-name",
+            ReleaseStatus("complete"),
+            "http://darwin-fake-url.com",
+            datetime.now(),
+            None,
+            None,
+            True,
+            True,
+            "json",
+        )
+
+        def fake_download_zip(self, path):
+            zip: Path = Path("tests/dataset.zip")
+            shutil.copy(zip, path)
+            return path
+
+        with patch.object(
+            RemoteDataset, "get_release", return_value=stub_release_response
+        ), patch.object(Release, "download_zip", new=fake_download_zip), patch(
+            "darwin.dataset.remote_dataset.parse_darwin_json",
+            wraps=parse_darwin_json,
+        ) as parse_mock, patch(
+            "darwin.dataset.download_manager.parse_darwin_json"
+        ) as download_parse_mock, patch(
+            "darwin.dataset.utils.parse_path"
+        ) as class_list_parse_mock:
+            _, count = remote_dataset.pull(blocking=False)
+
+        assert parse_mock.call_count == 1
+        download_parse_mock.assert_not_called()
+        class_list_parse_mock.assert_not_called()
+        assert count == 1
+        release_path = remote_dataset.local_path / "releases" / "latest"
+        assert (release_path / "lists" / "classes_polygon.txt").exists()
+        assert (release_path / "annotations.index.sqlite").exists()
+        # The annotations are indexed before being dropped from memory
+        index = AnnotationIndex.load(release_path / "annotations")
+        assert index is not None
+        assert [entry.annotation_count for entry in index.entries().values()] == [
+            len(parse_darwin_json(path).annotations)
+            for path in (release_path / "annotations").glob("*.json")
+        ]
+        index.close()
+
+    @patch("platform.system", return_value="Linux")
+    def test_extracts_annotations_without_a_full_extraction(
+        self, system_mock: MagicMock, remote_dataset: RemoteDataset
+    ):
+        stub_release_response = Release(
+            "dataset-slug",
+            "team-slug",
+            "0.1.0",
+            "release-name",
+            ReleaseStatus("complete"),
+            "http://darwin-fake-url.com",
+            datetime.now(),
+            None,
+            None,
+            True,
+            True,
+            "json",
+        )
+
+        def fake_download_zip(self, path):
+            with zipfile.ZipFile("tests/dataset.zip") as source:
+                annotation = source.read("ferrari-laferrari.json")
+            with zipfile.ZipFile(path, "w") as z:
+                z.writestr("a.json", annotation)
+                z.writestr("b.json", annotation)
+                z.writestr(".v7/metadata.json", "{}")
+                z.writestr("__MACOSX/._a.json", "")
+            return path
+
+        with patch.object(
+            RemoteDataset, "get_release", return_value=stub_release_response
+        ), patch.object(Release, "download_zip", new=fake_download_zip), patch.object(
+            zipfile.ZipFile, "extractall"
+        ) as extractall_mock:
+            _, count = remote_dataset.pull(blocking=False)
+
+        extractall_mock.assert_not_called()
+        release_path = remote_dataset.local_path / "releases" / "release-name"
+        annotations_path = release_path / "annotations"
+        assert sorted(
+            str(path.relative_to(annotations_path))
+            for path in annotations_path.rglob("*")
+            if path.is_file()
+        ) == [
+            ".v7/metadata.json",
+            "ferrari-laferrari.json",
+            "ferrari-laferrari_2.json",
+        ]
+        assert not (release_path / ".release.zip").exists()
+
+    @patch("platform.system", return_value="Linux")
+    def test_incremental_pull_only_touches_changed_items(
+        self, system_mock: MagicMock, remote_dataset: RemoteDataset
+    ):
+        stub_release_response = Release(
+            "dataset-slug",
+            "team-slug",
+            "0.1.0",
+            "release-name",
+            ReleaseStatus("complete"),
+            "http://darwin-fake-url.com",
+            datetime.now(),
+            None,
+            None,
+            True,
+            True,
+            "json",
+        )
+
+        def payload(item_id: str, name: str, class_name: str) -> bytes:
+            return json.dumps(
+                {
+                    "version": "2.0",
+                    "schema_ref": "https://darwin-public.s3.eu-west-1.amazonaws.com/darwin_json/2.0/schema.json",
+                    "item": {
+                        "name": name,
+                        "path": "/",
+                        "source_info": {"item_id": item_id},
+                        "slots": [
+                            {
+                                "type": "image",
+                                "slot_name": "0",
+                                "width": 10,
+                                "height": 10,
+                                "source_files": [
+                                    {"file_name": name, "url": f"http://{name}"}
+                                ],
+                            }
+                        ],
+                    },
+                    "annotations": [{"name": class_name, "tag": {}}],
+                }
+            )
+
+        def pull(members: Dict[str, bytes]) -> Tuple[MagicMock, MagicMock]:
+            def fake_download_zip(self, path):
+                with zipfile.ZipFile(path, "w") as z:
+                    for name, content in members.items():
+                        z.writestr(name, content)
+                return path
+
+            with patch.object(
+                RemoteDataset, "get_release", return_value=stub_release_response
+            ), patch.object(Release, "download_zip", new=fake_download_zip), patch(
+                "darwin.dataset.remote_dataset.download_all_images_from_annotations",
+                return_value=(lambda: [], 0),
+            ) as download_mock, patch(
+                "darwin.dataset.remote_dataset.parse_darwin_json",
+                wraps=parse_darwin_json,
+            ) as parse_mock:
+                remote_dataset.pull(incremental=True)
+            return download_mock, parse_mock
+
+        pull(
+            {
+                "a.json": payload("id-a", "a.jpg", "cat"),
+                "b.json": payload("id-b", "b.jpg", "cat"),
+                "d.json": payload("id-d", "d.jpg", "cat"),
+            }
+        )
+        annotations_path = (
+            remote_dataset.local_releases_path / "release-name" / "annotations"
+        )
+        unchanged_mtime = (annotations_path / "a.json").stat().st_mtime_ns
+
+        download_mock, parse_mock = pull(
+            {
+                "a.json": payload("id-a", "a.jpg", "cat"),
+                "b.json": payload("id-b", "b.jpg", "dog"),
+                "c.json": payload("id-c", "c.jpg", "cat"),
+            }
+        )
+
+        parsed_paths = {Path(call.args[0]).name for call in parse_mock.call_args_list}
+        assert parsed_paths == {"b.json", "c.json"}
+        kwargs = download_mock.call_args.kwargs
+        assert sorted(
+            annotation.path.name for annotation in kwargs["annotation_files"]
+        ) == ["b.json", "c.json"]
+        images_path = remote_dataset.local_images_path
+        assert kwargs["existing_images"] == {
+            images_path / "b.jpg",
+            images_path / "d.jpg",
+        }
+        assert sorted(path.name for path in annotations_path.glob("*.json")) == [
+            "a.json",
+            "b.json",
+            "c.json",
+        ]
+        assert (annotations_path / "a.json").stat().st_mtime_ns == unchanged_mtime
+        classes = (
+            remote_dataset.local_releases_path
+            / "release-name"
+            / "lists"
+            / "classes_tag.txt"
+        ).read_text()
+        assert classes.split() == ["cat", "dog"]
+
     @patch("time.sleep", return_value=None)
     def test_num_retries(self, mock_sleep, remote_dataset, pending_release):
         with patch.object(remote_dataset, "get_release", return_value=pending_release):
@@ -1281,6 +1492,12 @@ class TestPull:
         with pytest.raises(ValueError):
             remote_dataset.pull(retry=True, retry_timeout=5, retry_interval=10)
 
+    def test_raises_error_if_incremental_without_blocking(self, remote_dataset):
+        with patch.object(remote_dataset, "get_release") as get_release_mock:
+            with pytest.raises(ValueError, match="must be blocking"):
+                remote_dataset.pull(incremental=True, blocking=False)
+        get_release_mock.assert_not_called()
+
 
 class TestPullNamingConvention:
     @pytest.mark.usefixtures("file_read_write_test")
@@ -1,7 +1,11 @@
+import threading
+import time
 from pathlib import Path
+from typing import Any, Dict, List
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 import responses
 import inspect
 
@@ -12,6 +16,7 @@ from darwin.dataset import RemoteDataset
 from darwin.dataset.identifier import DatasetIdentifier
 from darwin.dataset.remote_dataset_v2 import RemoteDatasetV2
 from darwin.dataset.upload_manager import (
+    UPLOAD_ATTEMPTS,
     LocalFile,
     UploadHandler,
     UploadHandlerV2,
@@ -519,3 +524,185 @@ class TestUploadChunkSize:
     def test_value_specified_by_env_var(self, mock: MagicMock):
         assert _upload_chunk_size() == 123
         mock.assert_called_once_with("DARWIN_UPLOAD_CHUNK_SIZE")
+
+
+def _register_data_response(local_files: List[LocalFile]) -> Dict[str, Any]:
+    return {
+        "blocked_items": [],
+        "items": [
+            {
+                "id": f"item-{local_file.local_path.name}",
+                "name": local_file.local_path.name,
+                "path": "/",
+                "slots": [
+                    {
+                        "type": "image",
+                        "file_name": local_file.local_path.name,
+                        "slot_name": "0",
+                        "upload_id": f"upload-{local_file.local_path.name}",
+                    }
+                ],
+            }
+            for local_file in local_files
+        ],
+    }
+
+
+class _ConcurrencyCounter:
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+        self.current = 0
+        self.peak = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs) -> MagicMock:
+        with self._lock:
+            self.current += 1
+            self.calls += 1
+            self.peak = max(self.peak, self.current)
+        time.sleep(self.seconds)
+        with self._lock:
+            self.current -= 1
+        return MagicMock(status_code=200)
+
+
+class TestPipelinedUpload:
+    def test_limits_the_concurrency_of_each_stage(self, tmp_path: Path) -> None:
+        local_files = []
+        for i in range(12):
+            (tmp_path / f"{i}.jpg").write_bytes(b"image")
+            local_files.append(LocalFile(tmp_path / f"{i}.jpg"))
+        dataset = MagicMock()
+        dataset.client.api_v2.register_data.return_value = _register_data_response(
+            local_files
+        )
+        signs, puts, confirms = (
+            _ConcurrencyCounter(0.005),
+            _ConcurrencyCounter(0.05),
+            _ConcurrencyCounter(0.005),
+        )
+        dataset.client.api_v2.sign_upload.side_effect = lambda *args, **kwargs: (
+            signs() and {"upload_url": "https://storage/upload"}
+        )
+        dataset.client.session.put.side_effect = puts
+        dataset.client.api_v2.confirm_upload.side_effect = confirms
+
+        handler = UploadHandlerV2(dataset, local_files)
+        handler.upload(max_workers=4, sign_workers=2, confirm_workers=1)
+
+        assert handler.error_count == 0
+        assert signs.calls == puts.calls == confirms.calls == 12
+        assert signs.peak == 2
+        assert puts.peak == 4
+        assert confirms.peak == 1
+
+    def test_registers_chunks_concurrently_in_order(self) -> None:
+        local_files = [LocalFile(f"{i}.jpg") for i in range(4)]
+        barrier = threading.Barrier(4, timeout=5)
+        dataset = MagicMock()
+
+        def register_data(dataset_slug, payload, team_slug):
+            # Only returns if the 4 chunks are registered at the same time
+            barrier.wait()
+            name = payload["items"][0]["slots"][0]["file_name"]
+            return _register_data_response(
+                [
+                    local_file
+                    for local_file in local_files
+                    if local_file.data["filename"] == name
+                ]
+            )
+
+        dataset.client.api_v2.register_data.side_effect = register_data
+
+        with patch("darwin.dataset.upload_manager._upload_chunk_size", return_value=1):
+            handler = UploadHandlerV2(dataset, local_files)
+
+        assert [item.filename for item in handler.pending_items] == [
+            "0.jpg",
+            "1.jpg",
+            "2.jpg",
+            "3.jpg",
+        ]
+
+    def test_resends_the_whole_file_when_storage_is_busy(self, tmp_path: Path) -> None:
+        (tmp_path / "test.jpg").write_bytes(b"image content")
+        local_file = LocalFile(tmp_path / "test.jpg")
+        dataset = MagicMock()
+        dataset.client.api_v2.register_data.return_value = _register_data_response(
+            [local_file]
+        )
+        dataset.client.api_v2.sign_upload.return_value = {
+            "upload_url": "https://storage/upload"
+        }
+        bodies = []
+
+        def put(url, data):
+            bodies.append(data.read())
+            return MagicMock(status_code=503 if len(bodies) == 1 else 200)
+
+        dataset.client.session.put.side_effect = put
+
+        handler = UploadHandlerV2(dataset, [local_file])
+        with patch("time.sleep"):
+            handler.upload()
+
+        assert handler.error_count == 0
+        assert bodies == [b"image content", b"image content"]
+        dataset.client.api_v2.confirm_upload.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "failure",
+        [requests.ConnectionError("connection reset"), MagicMock(status_code=502)],
+    )
+    def test_resends_the_whole_file_after_transient_failures(
+        self, tmp_path: Path, failure: Any
+    ) -> None:
+        (tmp_path / "test.jpg").write_bytes(b"image content")
+        local_file = LocalFile(tmp_path / "test.jpg")
+        dataset = MagicMock()
+        dataset.client.api_v2.register_data.return_value = _register_data_response(
+            [local_file]
+        )
+        dataset.client.api_v2.sign_upload.return_value = {
+            "upload_url": "https://storage/upload"
+        }
+        bodies = []
+
+        def put(url, data):
+            bodies.append(data.read())
+            if len(bodies) == 1:
+                if isinstance(failure, Exception):
+                    raise failure
+                return failure
+            return MagicMock(status_code=200)
+
+        dataset.client.session.put.side_effect = put
+
+        handler = UploadHandlerV2(dataset, [local_file])
+        with patch("time.sleep"):
+            handler.upload()
+
+        assert handler.error_count == 0
+        assert bodies == [b"image content", b"image content"]
+
+    def test_fails_the_upload_after_the_last_attempt(self, tmp_path: Path) -> None:
+        (tmp_path / "test.jpg").write_bytes(b"image content")
+        local_file = LocalFile(tmp_path / "test.jpg")
+        dataset = MagicMock()
+        dataset.client.api_v2.register_data.return_value = _register_data_response(
+            [local_file]
+        )
+        dataset.client.api_v2.sign_upload.return_value = {
+            "upload_url": "https://storage/upload"
+        }
+        dataset.client.session.put.side_effect = requests.ConnectionError("down")
+
+        handler = UploadHandlerV2(dataset, [local_file])
+        with patch("time.sleep"):
+            handler.upload()
+
+        assert handler.error_count == 1
+        assert dataset.client.session.put.call_count == UPLOAD_ATTEMPTS
+        dataset.client.api_v2.confirm_upload.assert_not_called()
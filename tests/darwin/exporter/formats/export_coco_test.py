@@ -1,5 +1,9 @@
+import gc
+import weakref
 from pathlib import Path
+from typing import Iterator, List
 
+import orjson as json
 import pytest
 
 import darwin.datatypes as dt
@@ -71,3 +75,78 @@ class TestBuildAnnotations:
         assert coco._build_annotation(annotation_file, "test-id", bbox, categories)[
             "extra"
         ] == {"instance_id": 1}
+
+
+def _annotation_file(seq: int, name: str) -> dt.AnnotationFile:
+    polygon_class = dt.AnnotationClass("polygon_class", "polygon")
+    bbox_class = dt.AnnotationClass("bbox_class", "bounding_box")
+    tag_class = dt.AnnotationClass(f"tag_{seq % 2}", "tag")
+    annotations = [
+        dt.Annotation(
+            polygon_class,
+            {"paths": [[{"x": 1, "y": 1}, {"x": 2.5, "y": 2}, {"x": 1, "y": 2}]]},
+            [dt.make_instance_id(seq)],
+        ),
+        dt.Annotation(
+            polygon_class,
+            {
+                "paths": [
+                    [{"x": 1, "y": 1}, {"x": 5, "y": 5}, {"x": 1, "y": 5}],
+                    [{"x": 6, "y": 6}, {"x": 8, "y": 8}, {"x": 6, "y": 8}],
+                ]
+            },
+            [],
+        ),
+        dt.Annotation(tag_class, {}, []),
+        dt.Annotation(bbox_class, {"x": 1, "y": 2, "w": 3, "h": 4}, []),
+    ]
+    return dt.AnnotationFile(
+        path=Path(f"{name}.json"),
+        filename=f"{name}.jpg",
+        annotation_classes={polygon_class, bbox_class, tag_class},
+        annotations=annotations,
+        image_height=10,
+        image_width=12,
+        seq=seq,
+    )
+
+
+class TestExport:
+    def test_writes_the_same_document_as_build_json(self, tmp_path: Path):
+        annotation_files = [
+            _annotation_file(seq, f"image_{seq}") for seq in [3, 1, 2, 5, 4]
+        ]
+
+        coco.export(iter(annotation_files), tmp_path)
+
+        expected = json.dumps(
+            coco._build_json(annotation_files),
+            option=json.OPT_INDENT_2 | json.OPT_SERIALIZE_NUMPY,
+        )
+        assert (tmp_path / "output.json").read_bytes() == expected
+
+    def test_writes_empty_export(self, tmp_path: Path):
+        coco.export(iter([]), tmp_path)
+
+        expected = json.dumps(
+            coco._build_json([]), option=json.OPT_INDENT_2 | json.OPT_SERIALIZE_NUMPY
+        )
+        assert (tmp_path / "output.json").read_bytes() == expected
+
+    def test_does_not_keep_exported_files_in_memory(self, tmp_path: Path):
+        exported_files: List[weakref.ref] = []
+
+        def annotation_files() -> Iterator[dt.AnnotationFile]:
+            for seq in range(1, 6):
+                gc.collect()
+                # Only the file being exported may still be referenced
+                assert all(ref() is None for ref in exported_files[:-1])
+                annotation_file = _annotation_file(seq, f"image_{seq}")
+                exported_files.append(weakref.ref(annotation_file))
+                yield annotation_file
+
+        coco.export(annotation_files(), tmp_path)
+
+        output = json.loads((tmp_path / "output.json").read_bytes())
+        assert [image["id"] for image in output["images"]] == [1, 2, 3, 4, 5]
+        assert len(output["annotations"]) == 15
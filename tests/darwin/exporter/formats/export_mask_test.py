@@ -215,6 +215,7 @@ def test_rle_decoder() -> None:
     expectation = [1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3]
 
     assert rle_decode(predication, label_colours) == expectation
+    assert rle_decode([1, 2, 2, 1], {1: 300, 2: 7}) == [300, 300, 7]
 
     odd_number_of_integers = [1, 2, 3, 4, 5, 6, 7]
     with pytest.raises(ValueError):
@@ -471,8 +472,10 @@ def test_render_raster() -> None:
         filename="test.txt",
     )
 
-    with patch("darwin.exporter.formats.mask.rle_decode") as mock_rle_decode:
-        mock_rle_decode.return_value = rle_code
+    with patch("darwin.exporter.formats.mask.decode_dense_rle") as mock_decode:
+        mock_decode.return_value = np.array(rle_code, dtype=np.uint8).reshape(
+            (100, 100)
+        )
 
         errors, result_mask, result_categories, result_colours = render_raster(
             mask, colours, categories, annotations, annotation_file, 100, 100
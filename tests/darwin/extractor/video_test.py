@@ -1,9 +1,38 @@
+import json
+import os
+import subprocess
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from darwin.extractor.video import extract_artifacts
+from darwin.extractor.video import (
+    REGISTRATION_MANIFEST_NAME,
+    _create_directories,
+    _extract_segments,
+    _extract_segments_and_frames,
+    _get_batch_workers,
+    extract_artifacts,
+    extract_artifacts_batch,
+)
+
+
+def _probe_streams(path: Path) -> list:
+    """Describe the streams of a media file, leaving out their bitrates"""
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "stream=codec_type,codec_name,profile,width,height,pix_fmt,"
+        "sample_rate,channels,r_frame_rate",
+        "-of",
+        "json",
+        str(path),
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)["streams"]
 
 
 @pytest.fixture
@@ -289,3 +318,292 @@ class TestVideoArtifactExtraction:
         assert len(durations_1s) > len(
             durations_3s
         ), "Should have more 1-second segments than 3-second segments"
+
+    @pytest.mark.parametrize(
+        "source_name", ["test_video.mp4", "test_video_with_audio.mp4"]
+    )
+    def test_extract_artifacts_single_decode(self, data_dir, output_dir, source_name):
+        """Test that a single decode extracts the same artifacts"""
+        source_file = data_dir / source_name
+
+        results = {}
+        for single_decode in (False, True):
+            results[single_decode] = extract_artifacts(
+                source_file=str(source_file),
+                output_dir=str(output_dir / str(single_decode)),
+                storage_key_prefix="test/prefix",
+                fps=15.0,
+                segment_length=2,
+                repair=False,
+                single_decode=single_decode,
+            )["registration_payload"]
+
+        # Encoding the same frames, only the bitrates may differ slightly
+        for payload in results.values():
+            for rendition in payload["hls_segments"].values():
+                assert rendition.pop("bitrate") > 0
+        assert results[True] == results[False]
+        for artifact in ("frames_manifest.txt", "thumbnail.jpg"):
+            assert (output_dir / "True" / artifact).read_bytes() == (
+                output_dir / "False" / artifact
+            ).read_bytes()
+        for quality in ("high", "low"):
+            segments = {
+                single_decode: sorted(
+                    (output_dir / str(single_decode) / "segments" / quality).glob(
+                        "*.ts"
+                    )
+                )
+                for single_decode in (False, True)
+            }
+            assert [s.name for s in segments[True]] == [s.name for s in segments[False]]
+            for single_decode_segment, segment in zip(segments[True], segments[False]):
+                assert _probe_streams(single_decode_segment) == _probe_streams(segment)
+        assert sorted(
+            p.name for p in (output_dir / "True" / "sections").glob("*.png")
+        ) == sorted(p.name for p in (output_dir / "False" / "sections").glob("*.png"))
+        if source_name == "test_video.mp4":
+            assert len(list((output_dir / "True" / "sections").glob("*.png"))) == 75
+
+    def test_extract_artifacts_batch(self, data_dir, output_dir):
+        """Test batch extraction of the videos of a directory"""
+        source_dir = output_dir / "source"
+        (source_dir / "nested").mkdir(parents=True)
+        for name in ("test_video.mp4", "nested/test_video_with_audio.mp4"):
+            (source_dir / name).write_bytes((data_dir / Path(name).name).read_bytes())
+
+        registration_manifest = extract_artifacts_batch(
+            source=str(source_dir),
+            output_dir=str(output_dir / "artifacts"),
+            storage_key_prefix="test/prefix",
+            max_workers=2,
+            threads_per_job=1,
+        )
+
+        assert registration_manifest["failed"] == []
+        assert [
+            item["storage_key_prefix"] for item in registration_manifest["items"]
+        ] == [
+            "test/prefix/nested/test_video_with_audio.mp4",
+            "test/prefix/test_video.mp4",
+        ]
+        assert (
+            output_dir / "artifacts" / "test_video.mp4" / "frames_manifest.txt"
+        ).exists()
+        with open(output_dir / "artifacts" / REGISTRATION_MANIFEST_NAME) as f:
+            assert json.load(f) == registration_manifest
+
+
+class TestExtractSegments:
+    def test_keeps_the_default_stream_selection_and_codecs(self, output_dir):
+        dirs = _create_directories(str(output_dir))
+
+        with patch("darwin.extractor.video.subprocess.run") as run, patch(
+            "darwin.extractor.video._get_segments_bitrate", return_value=4000.0
+        ):
+            _extract_segments("video.mp4", dirs, segment_length=2)
+
+        assert run.call_count == 2
+        for call in run.call_args_list:
+            cmd = call.args[0]
+            assert "-map" not in cmd
+            assert "-c:a" not in cmd
+
+
+class TestExtractSegmentsAndFrames:
+    def _run_ffmpeg(self, cmd, **kwargs):
+        # Writes the outputs of the HLS renditions and logs two frames
+        for index_path in (arg for arg in cmd if arg.endswith("index.m3u8")):
+            quality_dir = Path(index_path).parent
+            (quality_dir / "000000000.ts").write_bytes(b"0" * 1000)
+            Path(index_path).write_text(
+                "#EXTM3U\n#EXTINF:2.000000,\n000000000.ts\n#EXT-X-ENDLIST\n"
+            )
+        stderr = (
+            "[Parsed_showinfo_0] n:   0 pts:      0 pts_time:0       duration: 512\n"
+            "[Parsed_showinfo_0] n:   1 pts:    512 pts_time:0.0333333 duration: 512\n"
+        )
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr=stderr)
+
+    def test_decodes_video_once(self, output_dir):
+        dirs = _create_directories(str(output_dir))
+
+        with patch(
+            "darwin.extractor.video.subprocess.run", side_effect=self._run_ffmpeg
+        ) as run:
+            segments_metadata, frames_timestamps = _extract_segments_and_frames(
+                "video.mp4", dirs, segment_length=2, downsampling_step=2.0
+            )
+
+        run.assert_called_once()
+        cmd = run.call_args.args[0]
+        assert cmd.count("-i") == 1
+        filter_graph = cmd[cmd.index("-filter_complex") + 1]
+        assert filter_graph.startswith(
+            "[0:v]showinfo,split=3[high][low_in][frames_in];[low_in]scale="
+        )
+        assert "[frames_in]select='eq(trunc(trunc((n+1)/2.0)*2.0)\\,n)'[frames]" in (
+            filter_graph
+        )
+        assert [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-map"] == [
+            "[high]",
+            "0:a?",
+            "[low]",
+            "0:a?",
+            "[frames]",
+        ]
+        # The mapped audio is encoded as ffmpeg does by default for HLS
+        assert [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-c:a"] == [
+            "aac",
+            "aac",
+        ]
+        assert cmd[-1] == str(output_dir / "sections" / "%09d.png")
+        assert frames_timestamps == [0.0, 0.0333333]
+        assert segments_metadata == {"bitrates": {"high": 4000.0, "low": 4000.0}}
+
+    def test_keeps_every_frame_without_downsampling(self, output_dir):
+        dirs = _create_directories(str(output_dir))
+
+        with patch(
+            "darwin.extractor.video.subprocess.run", side_effect=self._run_ffmpeg
+        ) as run:
+            _extract_segments_and_frames(
+                "video.mp4", dirs, segment_length=2, downsampling_step=1.0
+            )
+
+        cmd = run.call_args.args[0]
+        assert "[frames_in]null[frames]" in cmd[cmd.index("-filter_complex") + 1]
+
+
+class TestExtractArtifactsBatch:
+    @pytest.fixture
+    def source_dir(self, output_dir):
+        source_dir = output_dir / "source"
+        (source_dir / "nested").mkdir(parents=True)
+        for name in ("a.mp4", "nested/b.MOV", "notes.txt"):
+            (source_dir / name).write_bytes(b"video")
+        return source_dir
+
+    def _extract_artifacts(self, source_file, output_dir, storage_key_prefix, **kwargs):
+        if source_file.endswith("broken.mp4"):
+            raise RuntimeError("Invalid data found when processing input")
+        metadata = {
+            "repaired": False,
+            "source_file": source_file,
+            "storage_key_prefix": storage_key_prefix,
+            "segment_length": kwargs["segment_length"],
+            "repair": kwargs["repair"],
+            "registration_payload": {
+                "fps": kwargs["fps"],
+                "threads": kwargs["threads"],
+            },
+        }
+        os.makedirs(output_dir, exist_ok=True)
+        with open(os.path.join(output_dir, "metadata.json"), "w") as f:
+            json.dump(metadata, f)
+        return metadata
+
+    def _extract_batch(self, source, output_dir, **kwargs):
+        with patch("darwin.extractor.video._check_ffmpeg_version"), patch(
+            "darwin.extractor.video.extract_artifacts",
+            side_effect=self._extract_artifacts,
+        ) as extract:
+            registration_manifest = extract_artifacts_batch(
+                source=str(source),
+                output_dir=str(output_dir / "artifacts"),
+                storage_key_prefix="/prefix/",
+                max_workers=1,
+                threads_per_job=2,
+                **kwargs,
+            )
+        return registration_manifest, extract
+
+    def test_extracts_videos_of_directory(self, source_dir, output_dir):
+        registration_manifest, extract = self._extract_batch(source_dir, output_dir)
+
+        assert extract.call_count == 2
+        assert registration_manifest == {
+            "items": [
+                {
+                    "source_file": str(source_dir / "a.mp4"),
+                    "storage_key_prefix": "prefix/a.mp4",
+                    "registration_payload": {"fps": 0.0, "threads": 2},
+                },
+                {
+                    "source_file": str(source_dir / "nested" / "b.MOV"),
+                    "storage_key_prefix": "prefix/nested/b.MOV",
+                    "registration_payload": {"fps": 0.0, "threads": 2},
+                },
+            ],
+            "failed": [],
+        }
+        with open(output_dir / "artifacts" / REGISTRATION_MANIFEST_NAME) as f:
+            assert json.load(f) == registration_manifest
+
+    def test_skips_up_to_date_videos(self, source_dir, output_dir):
+        self._extract_batch(source_dir, output_dir)
+        # The artifacts of a.mp4 are older than its source
+        metadata_path = output_dir / "artifacts" / "a.mp4" / "metadata.json"
+        source_mtime = os.path.getmtime(source_dir / "a.mp4")
+        os.utime(metadata_path, (source_mtime - 10, source_mtime - 10))
+
+        registration_manifest, extract = self._extract_batch(source_dir, output_dir)
+
+        assert [call.kwargs["source_file"] for call in extract.call_args_list] == [
+            str(source_dir / "a.mp4")
+        ]
+        assert len(registration_manifest["items"]) == 2
+
+    @pytest.mark.parametrize(
+        "options", [{"fps": 15.0}, {"segment_length": 1}, {"repair": True}]
+    )
+    def test_extracts_again_with_other_options_or_force(
+        self, source_dir, output_dir, options
+    ):
+        self._extract_batch(source_dir, output_dir)
+
+        _, extract = self._extract_batch(source_dir, output_dir, **options)
+        assert extract.call_count == 2
+
+        _, extract = self._extract_batch(source_dir, output_dir, **options)
+        assert extract.call_count == 0
+
+        _, extract = self._extract_batch(source_dir, output_dir, force=True, **options)
+        assert extract.call_count == 2
+
+    def test_extracts_videos_of_manifest(self, source_dir, output_dir):
+        manifest_path = output_dir / "videos.txt"
+        manifest_path.write_text("source/a.mp4\n\nsource/broken.mp4\n")
+
+        registration_manifest, _ = self._extract_batch(manifest_path, output_dir)
+
+        assert [
+            item["storage_key_prefix"] for item in registration_manifest["items"]
+        ] == ["prefix/source/a.mp4"]
+        assert registration_manifest["failed"] == [
+            {
+                "name": "source/broken.mp4",
+                "error": "Invalid data found when processing input",
+            }
+        ]
+
+    def test_raises_if_videos_share_artifacts_directory(self, output_dir):
+        manifest_path = output_dir / "videos.txt"
+        manifest_path.write_text("/first/video.mp4\n/second/video.mp4\n")
+
+        with pytest.raises(ValueError):
+            self._extract_batch(manifest_path, output_dir)
+
+
+@pytest.mark.parametrize(
+    "max_workers, threads_per_job, expected",
+    [
+        (None, None, (16, 4)),
+        (8, None, (8, 8)),
+        (None, 16, (4, 16)),
+        (128, None, (128, 1)),
+        (3, 5, (3, 5)),
+    ],
+)
+def test_get_batch_workers(max_workers, threads_per_job, expected):
+    assert _get_batch_workers(max_workers, threads_per_job, 64) == expected
@@ -18,7 +18,12 @@ from darwin.datatypes import (
     SubAnnotation,
     VideoAnnotation,
 )
-from darwin.importer.formats.nifti import get_new_axial_size, parse_path, process_nifti
+from darwin.importer.formats.nifti import (
+    get_new_axial_size,
+    parse_path,
+    parse_path_headers,
+    process_nifti,
+)
 from tests.fixtures import *
 from darwin.utils.utils import parse_darwin_json
 
@@ -610,3 +615,69 @@ def test_parse_path_nifti_without_legacy_scaling():
             parsed_annotation, decimal_places=4
         )
         assert expected_annotation_rounded == parsed_annotation_rounded
+
+
+def test_parse_path_headers_matches_parse_path_without_loading_volumes(
+    team_slug_darwin_json_v2: str,
+):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with ZipFile("tests/data.zip") as zfile:
+            zfile.extractall(tmpdir)
+        label_path = (
+            Path(tmpdir)
+            / team_slug_darwin_json_v2
+            / "nifti"
+            / "releases"
+            / "latest"
+            / "annotations"
+            / "vol0_brain.nii.gz"
+        )
+        input_dict = {
+            "data": [
+                {
+                    "image": image,
+                    "label": str(label_path),
+                    "class_map": {"1": "brain"},
+                    "mode": "video",
+                }
+                for image in ["vol0 (1).nii", "folder/vol1.nii"]
+            ]
+        }
+        upload_json = Path(tmpdir) / "annotations.json"
+        upload_json.write_text(json.dumps(input_dict))
+
+        with patch("darwin.importer.formats.nifti.nib.load") as load:
+            header_files = parse_path_headers(upload_json)
+            load.assert_not_called()
+        annotation_files = parse_path(upload_json)
+
+        assert [file.full_path for file in header_files] == [
+            file.full_path for file in annotation_files
+        ]
+        assert [file.filename for file in header_files] == ["vol0 (1).nii", "vol1.nii"]
+        assert all(not file.annotations for file in header_files)
+        assert parse_path_headers(Path(tmpdir) / "annotations.txt") is None
+
+
+@pytest.mark.parametrize(
+    "image, remote_path, filename",
+    [
+        ("vol0.nii", "/", "vol0.nii"),
+        ("folder/vol0.nii", "folder", "vol0.nii"),
+        ("/folder/subfolder/vol0.nii", "/folder/subfolder", "vol0.nii"),
+    ],
+)
+def test_parse_path_headers_splits_the_folder_of_the_image(
+    image: str, remote_path: str, filename: str, tmp_path: Path
+):
+    upload_json = tmp_path / "annotations.json"
+    upload_json.write_text(
+        json.dumps(
+            {"data": [{"image": image, "label": "label.nii", "class_map": {"1": "a"}}]}
+        )
+    )
+
+    [header_file] = parse_path_headers(upload_json)
+
+    assert header_file.remote_path == remote_path
+    assert header_file.filename == filename
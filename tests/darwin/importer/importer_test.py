@@ -1,7 +1,10 @@
+import concurrent.futures
 import json
 import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Set
 from unittest.mock import MagicMock, Mock, _patch, patch
 from zipfile import ZipFile
 
@@ -23,9 +26,13 @@ from darwin.importer.importer import (
     _display_slot_warnings_and_errors,
     _find_and_parse,
     _get_annotation_format,
+    _get_import_batches,
     _get_remote_files_ready_for_import,
     _get_slot_names,
     _import_annotations,
+    _import_batch,
+    _split_repeated_items,
+    _ImportPropertiesCache,
     _is_skeleton_class,
     _overwrite_warning,
     _parse_empty_masks,
@@ -42,7 +49,7 @@ from darwin.importer.importer import (
     MAX_URL_LENGTH,
     BASE_URL_LENGTH,
 )
-from darwin.exceptions import RequestEntitySizeExceeded
+from darwin.exceptions import RequestEntitySizeExceeded, ValidationError
 
 import numpy as np
 
@@ -1263,6 +1270,106 @@ def test_overwrite_warning_aborts_import():
         assert result is False
 
 
+def _get_overwrite_warning_files(
+    count: int, item_properties: Optional[List[dict]] = None
+) -> Tuple[List[dt.AnnotationFile], dict]:
+    files = [
+        dt.AnnotationFile(
+            path=Path("/"),
+            filename=f"file{i}",
+            annotation_classes=set(),
+            annotations=[],
+            remote_path="/",
+            item_properties=item_properties or [],
+        )
+        for i in range(count)
+    ]
+    remote_files = {f"/file{i}": {"item_id": f"id{i}"} for i in range(count)}
+    return files, remote_files
+
+
+def test_overwrite_warning_lists_items_in_local_file_order():
+    files, remote_files = _get_overwrite_warning_files(
+        4, item_properties=[{"name": "prop", "value": "1"}]
+    )
+    client = MagicMock()
+    client.api_v2._get_remote_annotations.side_effect = lambda item_id, team: (
+        [{"id": "annotation"}] if item_id in ("id1", "id3") else []
+    )
+    client.api_v2._get_properties_state_for_item.side_effect = lambda item_id, team: {
+        "properties": [
+            {"id": "prop", "values": [{"value": "1"}] if item_id == "id0" else []}
+        ]
+    }
+    console = MagicMock()
+
+    with patch("builtins.input", return_value="y") as mock_input:
+        assert _overwrite_warning(client, MagicMock(), files, remote_files, console)
+
+    mock_input.assert_called_once()
+    printed = [c.args[0] for c in console.print.call_args_list]
+    assert printed == [
+        "The following 2 dataset item(s) have annotations that will be overwritten by this import:",
+        "- /file1",
+        "- /file3",
+        "The following 1 dataset item(s) have item-level properties that will be overwritten by this import:",
+        "- /file0",
+    ]
+
+
+def test_overwrite_warning_does_not_ask_without_overwrites():
+    files, remote_files = _get_overwrite_warning_files(3)
+    client = MagicMock()
+    client.api_v2._get_remote_annotations.return_value = []
+
+    with patch("builtins.input") as mock_input:
+        assert _overwrite_warning(client, MagicMock(), files, remote_files, MagicMock())
+
+    mock_input.assert_not_called()
+    assert client.api_v2._get_remote_annotations.call_count == 3
+    client.api_v2._get_properties_state_for_item.assert_not_called()
+
+
+def test_overwrite_warning_stops_checking_once_listing_is_complete():
+    files, remote_files = _get_overwrite_warning_files(50)
+    client = MagicMock()
+    client.api_v2._get_remote_annotations.return_value = [{"id": "annotation"}]
+    console = MagicMock()
+
+    with patch("builtins.input", return_value="n"):
+        assert not _overwrite_warning(
+            client,
+            MagicMock(),
+            files,
+            remote_files,
+            console,
+            max_workers=1,
+            max_listed_files=2,
+        )
+
+    assert client.api_v2._get_remote_annotations.call_count < 50
+    printed = [c.args[0] for c in console.print.call_args_list]
+    assert printed[0].startswith("At least ")
+    assert printed[1:3] == ["- /file0", "- /file1"]
+
+
+def test_overwrite_warning_checks_items_concurrently():
+    files, remote_files = _get_overwrite_warning_files(4)
+    barrier = threading.Barrier(4, timeout=5)
+    client = MagicMock()
+    # Only returns if the 4 items are checked at the same time
+    client.api_v2._get_remote_annotations.side_effect = lambda item_id, team: (
+        barrier.wait() and []
+    )
+
+    with patch("builtins.input") as mock_input:
+        assert _overwrite_warning(
+            client, MagicMock(), files, remote_files, MagicMock(), max_workers=4
+        )
+
+    mock_input.assert_not_called()
+
+
 import pytest
 
 
@@ -4058,3 +4165,238 @@ def test_slot_is_handled_by_monai():
     non_monai_slot = {"metadata": {"medical": {}}}
     assert slot_is_handled_by_monai(monai_slot) is True
     assert slot_is_handled_by_monai(non_monai_slot) is False
+
+
+class _ImportHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Holds each request until as many requests are being handled at once
+    barrier: Optional[threading.Barrier] = None
+    failing_items: Set[str] = set()
+    requests: List[str] = []
+
+    def do_POST(self):
+        cls = type(self)
+        self.rfile.read(int(self.headers["Content-Length"]))
+        item_id = self.path.split("/items/")[1].split("/")[0]
+        cls.requests.append(item_id)
+        if cls.barrier is not None:
+            try:
+                cls.barrier.wait(timeout=5)
+            except threading.BrokenBarrierError:
+                self._send(422, {"errors": "Not sent concurrently"})
+                return
+        if item_id in cls.failing_items:
+            self._send(422, {"errors": "Invalid annotation"})
+        else:
+            self._send(200, {})
+
+    def _send(self, status: int, body: dict):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def import_server_dataset():
+    from darwin.client import Client
+    from darwin.config import Config
+    from darwin.dataset.remote_dataset_v2 import RemoteDatasetV2
+
+    _ImportHandler.barrier = None
+    _ImportHandler.failing_items = set()
+    _ImportHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ImportHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    config = Config(path=None)
+    config.set_team(team="team", api_key="key", datasets_dir="/tmp")
+    config.set_global(
+        api_endpoint=f"http://127.0.0.1:{server.server_address[1]}/api/",
+        base_url=f"http://127.0.0.1:{server.server_address[1]}",
+        default_team="team",
+    )
+    yield RemoteDatasetV2(
+        client=Client(config), team="team", name="dataset", slug="dataset", dataset_id=1
+    )
+
+    server.shutdown()
+    server.server_close()
+
+
+def _import_payloads(count: int) -> List[Tuple[dt.ItemId, dt.DictFreeForm]]:
+    return [
+        (f"item-{i}", {"annotations": [{"id": str(i)}], "overwrite": "false"})
+        for i in range(count)
+    ]
+
+
+def test__get_import_batches_bounds_items_and_size() -> None:
+    payloads = _import_payloads(10)
+    payload_size = len(json.dumps(payloads[0][1]).encode("utf-8"))
+
+    batches = list(_get_import_batches(payloads, batch_size=4))
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert [item for batch in batches for item in batch] == payloads
+
+    batches = list(
+        _get_import_batches(
+            payloads, batch_size=10, max_payload_size=payload_size * 3 + 1
+        )
+    )
+    assert [len(batch) for batch in batches] == [3, 3, 3, 1]
+
+
+def test__get_import_batches_reads_payloads_as_batches_are_filled() -> None:
+    read_payloads = []
+
+    def payloads():
+        for item_id, payload in _import_payloads(10):
+            read_payloads.append(item_id)
+            yield item_id, payload
+
+    batches = _get_import_batches(payloads(), batch_size=2)
+
+    assert len(next(batches)) == 2
+    # The next batch is only started by the payload that doesn't fit in the first one
+    assert read_payloads == ["item-0", "item-1", "item-2"]
+
+
+def test__import_batch_sends_the_requests_of_a_batch_concurrently(
+    import_server_dataset,
+) -> None:
+    _ImportHandler.barrier = threading.Barrier(4)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        errors = _import_batch(import_server_dataset, _import_payloads(4), executor)
+
+    assert not errors
+    assert sorted(_ImportHandler.requests) == [f"item-{i}" for i in range(4)]
+
+
+def test__import_batch_reports_failures_per_item(import_server_dataset) -> None:
+    _ImportHandler.failing_items = {"item-3"}
+
+    errors = _import_batch(import_server_dataset, _import_payloads(5))
+
+    assert _ImportHandler.requests == [f"item-{i}" for i in range(5)]
+    assert list(errors) == ["item-3"]
+    assert isinstance(errors["item-3"][0], ValidationError)
+
+
+def test__split_repeated_items_keeps_items_once_per_round() -> None:
+    entries = [
+        ("item-1", "a"),
+        ("item-2", "b"),
+        ("item-1", "c"),
+        ("item-3", "d"),
+        ("item-1", "e"),
+        ("item-2", "f"),
+    ]
+
+    assert _split_repeated_items(entries) == [
+        [("item-1", "a"), ("item-2", "b"), ("item-3", "d")],
+        [("item-1", "c"), ("item-2", "f")],
+        [("item-1", "e")],
+    ]
+
+
+def test__get_remote_files_targeted_by_import_reuses_parsed_files() -> None:
+    mock_dataset = Mock()
+    mock_remote_file = Mock(full_path="/path/to/file1.json")
+    mock_dataset.fetch_remote_files.return_value = [mock_remote_file]
+    mock_importer = Mock()
+    parsed_file = Mock(
+        spec=dt.AnnotationFile,
+        filename="file1.json",
+        full_path="/path/to/file1.json",
+    )
+
+    result = _get_remote_files_targeted_by_import(
+        importer=mock_importer,
+        file_paths=[Path("file1.json")],
+        dataset=mock_dataset,
+        parsed_files=[parsed_file],
+    )
+
+    assert result == [mock_remote_file]
+    mock_importer.assert_not_called()
+
+
+class TestImportPropertiesCache:
+    def test_fetches_team_properties_once_until_invalidated(self) -> None:
+        cache = _ImportPropertiesCache(Mock(), "test_team")
+
+        with patch(
+            "darwin.importer.importer._get_team_properties_annotation_lookup",
+            return_value=({}, {}),
+        ) as mock_lookup:
+            for _ in range(3):
+                assert cache.get_team_properties_lookups() == ({}, {})
+            assert mock_lookup.call_count == 1
+
+            cache.invalidate_team_properties()
+            cache.get_team_properties_lookups()
+            assert mock_lookup.call_count == 2
+
+    def test_parses_each_metadata_file_once(self, tmp_path: Path) -> None:
+        cache = _ImportPropertiesCache(Mock(), "test_team")
+        metadata_path = tmp_path / ".v7" / "metadata.json"
+
+        with patch(
+            "darwin.importer.importer._parse_metadata_file", return_value=([], [])
+        ) as mock_parse, patch(
+            "darwin.importer.importer.is_properties_enabled",
+            return_value=metadata_path,
+        ) as mock_is_properties_enabled:
+            for name in ["a.json", "b.json", "c.json"]:
+                (tmp_path / name).write_text("{}")
+                path = cache.get_metadata_path(tmp_path / name)
+                assert cache.parse_metadata_file(path) == ([], [])
+
+        assert mock_is_properties_enabled.call_count == 1
+        mock_parse.assert_called_once_with(metadata_path)
+
+    def test_is_shared_by_the_items_of_an_import(self, mock_dataset) -> None:
+        annotations = [
+            dt.Annotation(
+                dt.AnnotationClass("test_class", "polygon"),
+                {"paths": [[{"x": 1, "y": 2}, {"x": 3, "y": 4}, {"x": 5, "y": 6}]]},
+                [],
+                [],
+            )
+        ]
+        mock_dataset.version = 2
+        cache = _ImportPropertiesCache(mock_dataset.client, mock_dataset.team)
+
+        with patch(
+            "darwin.importer.importer._get_team_properties_annotation_lookup",
+            return_value=({}, {}),
+        ) as mock_lookup:
+            for item_id in ["item-1", "item-2", "item-3"]:
+                errors, _ = _import_annotations(
+                    mock_dataset.client,
+                    item_id,
+                    {"polygon": {"test_class": "123"}},
+                    {},
+                    annotations,
+                    [],
+                    "0",
+                    mock_dataset,
+                    False,
+                    False,
+                    False,
+                    False,
+                    False,
+                    cache,
+                )
+                assert not errors
+
+        assert mock_lookup.call_count == 1
+        assert mock_dataset.import_annotation.call_count == 3
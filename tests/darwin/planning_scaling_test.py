@@ -0,0 +1,159 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from darwin import datatypes as dt
+from darwin.dataset.remote_dataset_v2 import _find_files_to_upload_as_single_file_items
+from darwin.dataset.upload_manager import (
+    ItemMergeMode,
+    LocalFile,
+    MultiFileItem,
+    UploadHandlerV2,
+)
+from darwin.importer.importer import _get_remote_files_targeted_by_import
+from darwin.utils import find_files
+
+# Planning compares each entry with a bounded number of others through hashed lookups, while the
+# membership scans it replaces compared each entry with every other one, about size ** 2 / 2
+# comparisons. The tests count the comparisons instead of timing the planning, at sizes growing
+# tenfold. Sizes stop at 100k to keep the suite fast, quadratic planning already taking 5 billion
+# comparisons at that size.
+SIZES = [1_000, 10_000, 100_000]
+
+
+class _Comparisons:
+    count = 0
+
+
+class _CountingStr(str):
+    __hash__ = str.__hash__
+
+    def __eq__(self, other: object) -> bool:
+        _Comparisons.count += 1
+        return str.__eq__(self, other)
+
+
+class _CountingPath(type(Path())):  # type: ignore[misc]
+    def __str__(self) -> str:
+        return _CountingStr(super().__str__())
+
+    def relative_to(self, *other):  # type: ignore[override]
+        _Comparisons.count += 1
+        return super().relative_to(*other)
+
+
+def _find_files(size: int, tmp_path: Path) -> None:
+    files = [f"dir/file{i}.jpg" for i in range(size)]
+
+    with patch("darwin.utils.utils.Path", _CountingPath):
+        found_files = find_files(files, files_to_exclude=files[::2], recursive=False)
+
+    assert len(found_files) == size // 2
+
+
+def _preserve_folders_of_files_to_upload(size: int, tmp_path: Path) -> None:
+    files = [
+        _CountingPath(tmp_path / f"dir{i % 100}" / f"file{i}.jpg") for i in range(size)
+    ]
+
+    with patch("darwin.dataset.remote_dataset_v2.find_files", return_value=files):
+        local_files = _find_files_to_upload_as_single_file_items(
+            [tmp_path, *files],
+            [],
+            [],
+            None,
+            0,
+            False,
+            False,
+            True,
+        )
+
+    assert local_files[-1].data["path"] == f"dir{(size - 1) % 100}"
+
+
+def _match_remote_files_targeted_by_import(size: int, tmp_path: Path) -> None:
+    parsed_files = [
+        dt.AnnotationFile(
+            path=Path(f"file{i}.json"),
+            filename=f"file{i}.jpg",
+            annotation_classes=set(),
+            annotations=[],
+            remote_path="/",
+        )
+        for i in range(size)
+    ]
+    remote_files = {
+        f"file{i}.jpg": SimpleNamespace(full_path=_CountingStr(f"/file{i}.jpg"))
+        for i in range(size)
+    }
+    dataset = MagicMock()
+    dataset.fetch_remote_files.side_effect = lambda filters: [
+        remote_files[name] for name in filters["item_names"]
+    ]
+
+    targeted_files = _get_remote_files_targeted_by_import(
+        MagicMock(), [], dataset, parsed_files=parsed_files
+    )
+
+    assert len(targeted_files) == size
+
+
+def _plan_upload_requests(size: int, tmp_path: Path) -> None:
+    multi_file_items: List[MultiFileItem] = [
+        MultiFileItem(
+            Path(f"dir{i}"),
+            [Path(f"dir{i}/a.jpg"), Path(f"dir{i}/b.jpg")],
+            ItemMergeMode.SLOTS,
+            0,
+        )
+        for i in range(size // 4)
+    ]
+    local_files = [
+        file for multi_file_item in multi_file_items for file in multi_file_item.files
+    ] + [LocalFile(f"file{i}.jpg") for i in range(size // 2)]
+    dataset = MagicMock()
+    dataset.client.api_v2.register_data.return_value = {
+        "blocked_items": [],
+        "items": [],
+    }
+
+    def counting_eq(self: LocalFile, other: object) -> bool:
+        _Comparisons.count += 1
+        return self is other
+
+    with patch.object(LocalFile, "__eq__", counting_eq):
+        UploadHandlerV2(dataset, local_files, multi_file_items)
+
+    registered_files = sum(
+        len(call.args[1]["items"])
+        for call in dataset.client.api_v2.register_data.call_args_list
+    )
+    assert registered_files == size // 4 + size // 2
+
+
+@pytest.mark.parametrize(
+    "plan",
+    [
+        _find_files,
+        _preserve_folders_of_files_to_upload,
+        _match_remote_files_targeted_by_import,
+        _plan_upload_requests,
+    ],
+)
+def test_planning_takes_a_linear_number_of_comparisons(
+    plan: Callable[[int, Path], None], tmp_path: Path
+) -> None:
+    counts = []
+    for size in SIZES:
+        _Comparisons.count = 0
+        plan(size, tmp_path)
+        counts.append(_Comparisons.count)
+
+    for size, count in zip(SIZES, counts):
+        assert count <= size
+    # Ten times more entries take about ten times more comparisons, not a hundred times more
+    for previous_count, count in zip(counts, counts[1:]):
+        assert count <= previous_count * 11
@@ -0,0 +1,77 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+import pytest
+
+from darwin.utils.rle import decode_dense_rle, get_dense_rle_labels
+
+
+def _decode_with_lists(
+    rle: List[int], label_map: Optional[Dict[int, int]] = None
+) -> List[int]:
+    output: List[int] = []
+    for i in range(0, len(rle), 2):
+        label = rle[i] if label_map is None else label_map[rle[i]]
+        output += [label] * rle[i + 1]
+    return output
+
+
+def _random_rle(width: int, height: int, seed: int = 0) -> List[int]:
+    random = np.random.default_rng(seed)
+    rle: List[int] = []
+    remaining = width * height
+    while remaining:
+        count = min(int(random.integers(1, 200)), remaining)
+        rle += [int(random.integers(0, 4)), count]
+        remaining -= count
+    return rle
+
+
+class TestDecodeDenseRle:
+    def test_decodes_runs_row_by_row(self) -> None:
+        mask = decode_dense_rle([0, 3, 1, 2, 2, 1], 3, 2)
+
+        assert mask.dtype == np.uint8
+        assert mask.tolist() == [[0, 0, 0], [1, 1, 2]]
+
+    def test_maps_labels(self) -> None:
+        mask = decode_dense_rle([0, 2, 5, 2], 2, 2, {0: 0, 5: 3})
+
+        assert mask.tolist() == [[0, 0], [3, 3]]
+
+    def test_matches_list_decoding(self) -> None:
+        rle = _random_rle(64, 48)
+        label_map = {0: 0, 1: 10, 2: 20, 3: 30}
+
+        mask = decode_dense_rle(rle, 64, 48, label_map)
+
+        assert mask.ravel().tolist() == _decode_with_lists(rle, label_map)
+
+    @pytest.mark.parametrize("rle", [[1, 2], [1, 2, 2, 4], [1, 6, 2, -2]])
+    def test_raises_when_runs_do_not_cover_the_mask(self, rle: List[int]) -> None:
+        with pytest.raises(ValueError):
+            decode_dense_rle(rle, 2, 2)
+
+    def test_skips_empty_runs(self) -> None:
+        assert decode_dense_rle([1, 2, 3, 0, 2, 2], 2, 2).tolist() == [[1, 1], [2, 2]]
+
+    def test_raises_on_odd_length(self) -> None:
+        with pytest.raises(ValueError):
+            decode_dense_rle([1, 2, 3], 2, 2)
+
+    def test_raises_on_unknown_label(self) -> None:
+        with pytest.raises(KeyError):
+            decode_dense_rle([1, 4], 2, 2, {0: 0})
+
+    def test_decodes_to_the_given_dtype(self) -> None:
+        mask = decode_dense_rle([1, 2, 2, 2], 2, 2, {1: 300, 2: 7}, dtype=np.int64)
+
+        assert mask.dtype == np.int64
+        assert mask.tolist() == [[300, 300], [7, 7]]
+
+
+def test_get_dense_rle_labels() -> None:
+    rle = [0, 3, 2, 1, 0, 4, 7, 2]
+
+    assert get_dense_rle_labels(rle) == {0, 2, 7}
+    assert get_dense_rle_labels(np.array(rle)) == {0, 2, 7}